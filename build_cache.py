@@ -4,207 +4,338 @@ Fetch, enrich, and cache fantasy-relevant player data in Redis.
 This replaces the existing cache with enriched Sleeper + Fantasy Nerds data.
 """
 
+import asyncio
 import json
-import gzip
 import httpx
 import redis
 import os
-from typing import Dict, Any, List
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 from datetime import datetime
 from dotenv import load_dotenv
 
+from cache_codec import (
+    codec_metadata,
+    compress_blob,
+    dumps_json,
+    encode_blob,
+    resolve_codec,
+)
+from json_stream import JSONObjectStream
+from player_views import players_blob_payload
+from ppr_stats import filter_ppr_relevant_stats
+from search_index import build_search_index, normalize_name
+
 # Load environment variables
 load_dotenv()
 
+# Redis keys for the enriched player cache
+PLAYERS_CACHE_KEY = "nfl_players_cache"
+# Generation counter bumped on every write so readers can keep an in-process copy
+PLAYERS_CACHE_VERSION_KEY = "nfl_players_cache_version"
+# Per-player layout: one hash field per Sleeper ID plus position/team index sets
+PLAYERS_HASH_KEY = "nfl_players_hash"
+PLAYERS_BY_POSITION_PREFIX = "nfl_players_by_position:"
+PLAYERS_BY_TEAM_PREFIX = "nfl_players_by_team:"
+# Prebuilt name search index (see search_index.py)
+PLAYER_SEARCH_INDEX_KEY = "player_search_index"
+# Last live stats applied by spot refreshes, one hash per season/week
+LIVE_STATS_KEY_PREFIX = "nfl_live_stats:"
+
+# Storage layout written by cache_players: "blob" (single compressed JSON string,
+# see cache_codec.py) or
+# "hash" (per-player hash fields). Readers pick the layout up from metadata.
+PLAYERS_CACHE_LAYOUT = os.getenv("PLAYERS_CACHE_LAYOUT", "blob").lower()
+
+# Local JSON copy of the last successful build, served while the cache warms
+PLAYERS_BACKUP_PATH = os.getenv(
+    "PLAYERS_BACKUP_PATH", "fantasy_relevant_players_backup.json"
+)
+
+
+# Upper bound on pooled Redis connections per process (and per event loop for
+# the async pool in cache_client)
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+
+# Per-source request timeouts (seconds) for the fetch stage
+SOURCE_TIMEOUTS = {
+    "sleeper_players": 30.0,
+    "sleeper_state": 10.0,
+    "sleeper_stats": 30.0,
+    "fantasy_nerds": 30.0,
+    "fantasy_nerds_byes": 10.0,
+}
+# Retries per upstream request on connection errors, 429 and 5xx responses
+FETCH_RETRIES = int(os.getenv("CACHE_FETCH_RETRIES", "2"))
+FETCH_RETRY_BACKOFF_SECONDS = 1.0
+
+# Positions kept in the player cache
+FANTASY_POSITIONS = {"QB", "RB", "WR", "TE", "K", "DEF"}
+
+# Sleeper player fields kept in the cache
+# Removed unused fields for context optimization (issue #108):
+# - search_first_name, search_full_name, search_last_name (search internals)
+# - hashtag (unused unique identifier)
+# - team_abbr (always null, redundant with team)
+# - depth_chart_position (too granular)
+# - team_changed_at (rarely relevant)
+SLEEPER_PLAYER_FIELDS = {
+    "team",
+    "practice_description",
+    "active",
+    "injury_start_date",
+    "first_name",
+    "player_id",
+    "status",
+    "news_updated",
+    "last_name",
+    "full_name",
+    "depth_chart_order",
+    "injury_status",
+    "age",
+    "injury_body_part",
+    "position",
+    "injury_notes",
+    "fantasy_positions",
+    "count",
+}
+
+_redis_pool: Optional[redis.ConnectionPool] = None
+
 
 def get_redis_client() -> redis.Redis:
-    """Get Redis client connection."""
-    redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
-    return redis.from_url(redis_url, decode_responses=False)
+    """Get Redis client backed by the process-wide connection pool."""
+    global _redis_pool
+    if _redis_pool is None:
+        redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
+        _redis_pool = redis.ConnectionPool.from_url(
+            redis_url, decode_responses=False, max_connections=REDIS_MAX_CONNECTIONS
+        )
+    return redis.Redis(connection_pool=_redis_pool)
 
 
-def normalize_name(name: str) -> str:
-    """Normalize player name for matching."""
-    return (
-        name.lower().replace(".", "").replace("'", "").replace("-", "").replace(" ", "")
-    )
+def bump_cache_version(r: redis.Redis) -> int:
+    """Increment the player cache generation after writing new player data.
 
+    Readers compare this small key against their in-process copy and only
+    re-download the full blob when it has changed.
+    """
+    return int(r.incr(PLAYERS_CACHE_VERSION_KEY))
 
-def fetch_sleeper_players() -> Dict[str, Any]:
-    """Fetch all players from Sleeper API."""
-    url = "https://api.sleeper.app/v1/players/nfl"
 
-    print("Fetching Sleeper players...")
-    with httpx.Client(timeout=30.0) as client:
-        response = client.get(url)
+def write_players_hash(r: redis.Redis, players: Dict[str, Any], ttl: int) -> int:
+    """Write players as one hash field per Sleeper ID with position/team sets.
+
+    The hash and index sets are replaced in a single MULTI/EXEC so readers never
+    see a half-written layout.
+
+    Args:
+        r: Redis client
+        players: Enriched players keyed by Sleeper ID
+        ttl: Expiry in seconds for the hash and index sets
+
+    Returns:
+        Total size in bytes of the JSON values written
+    """
+    fields = {pid: json.dumps(pdata) for pid, pdata in players.items()}
+
+    by_position: Dict[str, List[str]] = {}
+    by_team: Dict[str, List[str]] = {}
+    for pid, pdata in players.items():
+        if pdata.get("position"):
+            by_position.setdefault(pdata["position"], []).append(pid)
+        if pdata.get("team"):
+            by_team.setdefault(pdata["team"], []).append(pid)
+
+    stale_index_keys = list(r.scan_iter(match=f"{PLAYERS_BY_POSITION_PREFIX}*"))
+    stale_index_keys += list(r.scan_iter(match=f"{PLAYERS_BY_TEAM_PREFIX}*"))
+
+    pipe = r.pipeline(transaction=True)
+    pipe.delete(PLAYERS_HASH_KEY, *stale_index_keys)
+    if fields:
+        pipe.hset(PLAYERS_HASH_KEY, mapping=fields)
+        pipe.expire(PLAYERS_HASH_KEY, ttl)
+    for position, pids in by_position.items():
+        key = f"{PLAYERS_BY_POSITION_PREFIX}{position}"
+        pipe.sadd(key, *pids)
+        pipe.expire(key, ttl)
+    for team, pids in by_team.items():
+        key = f"{PLAYERS_BY_TEAM_PREFIX}{team}"
+        pipe.sadd(key, *pids)
+        pipe.expire(key, ttl)
+    pipe.execute()
+
+    return sum(len(value) for value in fields.values())
+
+
+def _is_retryable(error: httpx.HTTPError) -> bool:
+    """Return True for errors worth retrying (network, 429, 5xx)."""
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+async def _with_retries(source: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """Run a fetch with the source's retry policy for transient failures."""
+    for attempt in range(FETCH_RETRIES + 1):
+        try:
+            return await fetch()
+        except httpx.HTTPError as e:
+            if attempt == FETCH_RETRIES or not _is_retryable(e):
+                raise
+            delay = FETCH_RETRY_BACKOFF_SECONDS * 2**attempt
+            # URLs carry the API key, so only the source name is printed
+            print(f"Retrying {source} in {delay:.0f}s ({type(e).__name__})")
+            await asyncio.sleep(delay)
+
+
+async def _get_json(client: httpx.AsyncClient, url: str, source: str) -> Any:
+    """GET a URL with the source's timeout, retrying transient failures."""
+
+    async def fetch():
+        response = await client.get(url, timeout=SOURCE_TIMEOUTS[source])
         response.raise_for_status()
         return response.json()
 
+    return await _with_retries(source, fetch)
 
-def fetch_current_nfl_week() -> tuple[int, str]:
-    """Fetch current NFL week and season from Sleeper state API."""
-    url = "https://api.sleeper.app/v1/state/nfl"
 
-    print("Fetching current NFL week...")
-    with httpx.Client(timeout=10.0) as client:
-        response = client.get(url)
-        response.raise_for_status()
-        state = response.json()
-        return state.get("week", 1), state.get("season", "2025")
+async def _stream_json_object(
+    client: httpx.AsyncClient,
+    url: str,
+    source: str,
+    keep: Callable[[Any], Optional[Any]],
+) -> Dict[str, Any]:
+    """GET a JSON object, keeping only the members keep() returns a value for.
 
+    The body is decoded member by member as it arrives, so members that are
+    dropped never accumulate. Retries like _get_json.
+    """
 
-def fetch_player_stats(week: int, season: str) -> Dict[str, Any]:
-    """Fetch player stats for a specific week."""
-    url = f"https://api.sleeper.app/v1/stats/nfl/regular/{season}/{week}"
+    async def fetch():
+        kept = {}
+        stream = JSONObjectStream()
 
-    print(f"Fetching player stats for week {week}, season {season}...")
-    with httpx.Client(timeout=30.0) as client:
-        response = client.get(url)
-        response.raise_for_status()
-        return response.json()
+        def add(members):
+            for key, value in members:
+                value = keep(value)
+                if value is not None:
+                    kept[key] = value
 
+        async with client.stream(
+            "GET", url, timeout=SOURCE_TIMEOUTS[source]
+        ) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_text():
+                add(stream.feed(chunk))
+        add(stream.close())
+        return kept
 
-def filter_ppr_relevant_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
-    """Filter stats to only include PPR points and contributing stats.
-    Also transforms field names to be more descriptive."""
-
-    # Define mapping from Sleeper API fields to our descriptive names
-    field_mapping = {
-        # Core PPR score
-        "pts_ppr": "fantasy_points",
-        # Passing stats
-        "pass_yd": "passing_yards",
-        "pass_td": "passing_touchdowns",
-        "pass_int": "passing_interceptions",
-        "pass_2pt": "passing_two_point_conversions",
-        # Rushing stats
-        "rush_att": "carries",  # Rushing attempts
-        "rush_yd": "rushing_yards",
-        "rush_td": "rushing_touchdowns",
-        "rush_2pt": "rushing_two_point_conversions",
-        # Receiving stats (PPR)
-        "rec": "receptions",
-        "rec_tgt": "targets",
-        "rec_yd": "receiving_yards",
-        "rec_td": "receiving_touchdowns",
-        "rec_2pt": "receiving_two_point_conversions",
-        # Fumbles
-        "fum_lost": "fumbles_lost",
-        # Kicking stats
-        "fgm": "field_goals_made",
-        "fgm_0_19": "field_goals_made_0_19",
-        "fgm_20_29": "field_goals_made_20_29",
-        "fgm_30_39": "field_goals_made_30_39",
-        "fgm_40_49": "field_goals_made_40_49",
-        "fgm_50p": "field_goals_made_50_plus",
-        "fgmiss": "field_goals_missed",
-        "xpm": "extra_points_made",
-        "xpmiss": "extra_points_missed",
-        # Defensive stats (for IDP if used)
-        "def_td": "defensive_touchdowns",
-        "def_int": "defensive_interceptions",
-        "def_sack": "defensive_sacks",
-        "def_ff": "defensive_forced_fumbles",
-        "def_fr": "defensive_fumble_recoveries",
-        # Bonus stats that might affect scoring
-        "bonus_pass_yd_300": "bonus_passing_300_yards",
-        "bonus_pass_yd_400": "bonus_passing_400_yards",
-        "bonus_rush_yd_100": "bonus_rushing_100_yards",
-        "bonus_rush_yd_200": "bonus_rushing_200_yards",
-        "bonus_rec_yd_100": "bonus_receiving_100_yards",
-        "bonus_rec_yd_200": "bonus_receiving_200_yards",
-    }
+    return await _with_retries(source, fetch)
 
-    # Filter and transform the stats
-    filtered = {}
-    for player_id, player_stats in stats.items():
-        if isinstance(player_stats, dict):
-            # Transform field names and filter to relevant stats
-            transformed_stats = {}
-            fantasy_points = None
-
-            for old_field, new_field in field_mapping.items():
-                if old_field in player_stats:
-                    value = player_stats[old_field]
-                    if value is not None and value != 0:
-                        transformed_stats[new_field] = value
-                        if old_field == "pts_ppr":
-                            fantasy_points = value
-
-            # Only add player if they have fantasy points
-            if fantasy_points is not None:
-                filtered[player_id] = transformed_stats
-        else:
-            # Handle case where stats might not be a dict
-            filtered[player_id] = player_stats
 
-    return filtered
+def cacheable_sleeper_player(player: Any) -> Optional[Dict[str, Any]]:
+    """Trim a raw Sleeper player to what the cache keeps, or None to drop it.
 
+    Drops non-fantasy positions, players without a team (free agents,
+    retired players) and truly inactive players (not IR or Out), and keeps
+    only SLEEPER_PLAYER_FIELDS.
+    """
+    if not isinstance(player, dict):
+        return None
+    if player.get("position", "") not in FANTASY_POSITIONS:
+        return None
+    if player.get("status", "") == "Inactive" and not player.get("injury_status"):
+        return None
+    if not player.get("team"):
+        return None
+    return {field: player[field] for field in SLEEPER_PLAYER_FIELDS if field in player}
+
+
+async def fetch_sleeper_players(client: httpx.AsyncClient) -> Dict[str, Any]:
+    """Fetch cacheable players from Sleeper API.
+
+    The multi-MB dump is parsed while it downloads and filtered with
+    cacheable_sleeper_player, so only fantasy-relevant players on NFL teams
+    are ever held in memory.
+    """
+    url = "https://api.sleeper.app/v1/players/nfl"
 
-def fetch_fantasy_nerds_data() -> tuple[Dict, Dict, List]:
-    """Fetch all Fantasy Nerds data (rankings, injuries, news)."""
-    api_key = os.getenv("FFNERD_API_KEY")
+    print("Fetching Sleeper players...")
+    players = await _stream_json_object(
+        client, url, "sleeper_players", cacheable_sleeper_player
+    )
+    print(f"Kept {len(players)} fantasy-relevant Sleeper players")
+    return players
 
-    print("Fetching Fantasy Nerds weekly rankings...")
-    with httpx.Client(timeout=30.0) as client:
-        rankings_resp = client.get(
-            f"https://api.fantasynerds.com/v1/nfl/weekly-rankings?format=ppr&apikey={api_key}"
-        )
-        rankings_resp.raise_for_status()
-        rankings = rankings_resp.json()
 
-    print("Fetching Fantasy Nerds injuries...")
-    with httpx.Client(timeout=30.0) as client:
-        injuries_resp = client.get(
-            f"https://api.fantasynerds.com/v1/nfl/injuries?apikey={api_key}"
-        )
-        injuries_resp.raise_for_status()
-        injuries = injuries_resp.json()
+async def fetch_current_nfl_week(client: httpx.AsyncClient) -> tuple[int, str]:
+    """Fetch current NFL week and season from Sleeper state API."""
+    url = "https://api.sleeper.app/v1/state/nfl"
 
-    print("Fetching Fantasy Nerds news...")
-    with httpx.Client(timeout=30.0) as client:
-        news_resp = client.get(
-            f"https://api.fantasynerds.com/v1/nfl/news?apikey={api_key}"
-        )
-        news_resp.raise_for_status()
-        news = news_resp.json()
+    print("Fetching current NFL week...")
+    state = await _get_json(client, url, "sleeper_state")
+    return state.get("week", 1), state.get("season", "2025")
+
+
+async def fetch_player_stats(
+    client: httpx.AsyncClient, week: int, season: str
+) -> Dict[str, Any]:
+    """Fetch player stats for a specific week."""
+    url = f"https://api.sleeper.app/v1/stats/nfl/regular/{season}/{week}"
 
+    print(f"Fetching player stats for week {week}, season {season}...")
+    return await _get_json(client, url, "sleeper_stats")
+
+
+async def fetch_fantasy_nerds_data(
+    client: httpx.AsyncClient,
+) -> tuple[Dict, Dict, List]:
+    """Fetch all Fantasy Nerds data (rankings, injuries, news) concurrently."""
+    api_key = os.getenv("FFNERD_API_KEY")
+    base = "https://api.fantasynerds.com/v1/nfl"
+
+    print("Fetching Fantasy Nerds weekly rankings, injuries and news...")
+    rankings, injuries, news = await asyncio.gather(
+        _get_json(
+            client,
+            f"{base}/weekly-rankings?format=ppr&apikey={api_key}",
+            "fantasy_nerds",
+        ),
+        _get_json(client, f"{base}/injuries?apikey={api_key}", "fantasy_nerds"),
+        _get_json(client, f"{base}/news?apikey={api_key}", "fantasy_nerds"),
+    )
     return rankings, injuries, news
 
 
-def fetch_fantasy_nerds_ros() -> Dict:
+async def fetch_fantasy_nerds_ros(client: httpx.AsyncClient) -> Dict:
     """Fetch Rest of Season (ROS) projections from Fantasy Nerds."""
     api_key = os.getenv("FFNERD_API_KEY")
 
     print("Fetching Fantasy Nerds ROS projections...")
-    with httpx.Client(timeout=30.0) as client:
-        ros_resp = client.get(
-            f"https://api.fantasynerds.com/v1/nfl/ros?apikey={api_key}"
-        )
-        ros_resp.raise_for_status()
-        return ros_resp.json()
+    return await _get_json(
+        client,
+        f"https://api.fantasynerds.com/v1/nfl/ros?apikey={api_key}",
+        "fantasy_nerds",
+    )
 
 
-def fetch_fantasy_nerds_players() -> List[Dict]:
+async def fetch_fantasy_nerds_players(client: httpx.AsyncClient) -> List[Dict]:
     """Fetch Fantasy Nerds player list for ID mapping."""
     api_key = os.getenv("FFNERD_API_KEY")
     url = f"https://api.fantasynerds.com/v1/nfl/players?apikey={api_key}&include_inactive="
 
     print("Fetching Fantasy Nerds player list for mapping...")
-    with httpx.Client(timeout=30.0) as client:
-        response = client.get(url)
-        response.raise_for_status()
-        data = response.json()
-        # Ensure we return a list even if API returns an error
-        if not isinstance(data, list):
-            print(
-                f"Warning: Fantasy Nerds API returned non-list response: {type(data)}"
-            )
-            return []
-        return data
+    data = await _get_json(client, url, "fantasy_nerds")
+    # Ensure we return a list even if API returns an error
+    if not isinstance(data, list):
+        print(f"Warning: Fantasy Nerds API returned non-list response: {type(data)}")
+        return []
+    return data
 
 
-def fetch_bye_weeks() -> Dict[str, int]:
+async def fetch_bye_weeks(client: httpx.AsyncClient) -> Dict[str, int]:
     """Fetch bye week data from Fantasy Nerds API.
 
     Returns:
@@ -215,21 +346,18 @@ def fetch_bye_weeks() -> Dict[str, int]:
 
     print("Fetching bye weeks from Fantasy Nerds...")
     try:
-        with httpx.Client(timeout=10.0) as client:
-            response = client.get(url)
-            response.raise_for_status()
-            data = response.json()
-
-            # Build team -> bye_week mapping
-            bye_weeks_map = {}
-            if "weeks" in data:
-                for week_num, week_data in data["weeks"].items():
-                    teams = week_data.get("teams", [])
-                    for team in teams:
-                        bye_weeks_map[team] = int(week_num)
-
-            print(f"Fetched bye weeks for {len(bye_weeks_map)} teams")
-            return bye_weeks_map
+        data = await _get_json(client, url, "fantasy_nerds_byes")
+
+        # Build team -> bye_week mapping
+        bye_weeks_map = {}
+        if "weeks" in data:
+            for week_num, week_data in data["weeks"].items():
+                teams = week_data.get("teams", [])
+                for team in teams:
+                    bye_weeks_map[team] = int(week_num)
+
+        print(f"Fetched bye weeks for {len(bye_weeks_map)} teams")
+        return bye_weeks_map
     except Exception as e:
         print(f"Warning: Failed to fetch bye weeks: {e}")
         return {}
@@ -551,61 +679,16 @@ def enrich_and_filter_players(
     bye_weeks_map: Dict[str, int],
 ) -> Dict:
     """Enrich Sleeper players with Fantasy Nerds data, current week stats, and bye weeks.
-    Only includes active players on NFL teams (excludes free agents and retired players).
-    Creates a consistent stats structure with both projected and actual data.
-    Filters to only include specified fields to reduce context size."""
+    Players are filtered and trimmed with cacheable_sleeper_player (a no-op for
+    players fetch_sleeper_players already kept).
+    Creates a consistent stats structure with both projected and actual data."""
     enriched = {}
-    fantasy_positions = {"QB", "RB", "WR", "TE", "K", "DEF"}
-
-    # Define the fields to keep
-    # Removed unused fields for context optimization (issue #108):
-    # - search_first_name, search_full_name, search_last_name (search internals)
-    # - hashtag (unused unique identifier)
-    # - team_abbr (always null, redundant with team)
-    # - depth_chart_position (too granular)
-    # - team_changed_at (rarely relevant)
-    fields_to_keep = {
-        "team",
-        "practice_description",
-        "active",
-        "injury_start_date",
-        "first_name",
-        "player_id",
-        "status",
-        "news_updated",
-        "last_name",
-        "full_name",
-        "depth_chart_order",
-        "injury_status",
-        "age",
-        "injury_body_part",
-        "position",
-        "injury_notes",
-        "fantasy_positions",
-        "count",
-    }
 
     for sleeper_id, player in sleeper_players.items():
-        position = player.get("position", "")
-
-        # Include ALL fantasy-relevant players regardless of matching
-        if position not in fantasy_positions:
-            continue
-
-        # Skip only truly inactive players (not IR or Out)
-        status = player.get("status", "")
-        if status == "Inactive" and not player.get("injury_status"):
-            continue
-
-        # Skip players without a team (free agents, retired players)
-        if not player.get("team"):
+        filtered_player = cacheable_sleeper_player(player)
+        if filtered_player is None:
             continue
-
-        # Build filtered player object with only specified fields
-        filtered_player = {}
-        for field in fields_to_keep:
-            if field in player:
-                filtered_player[field] = player[field]
+        position = filtered_player.get("position", "")
 
         # Synthesize full_name for defenses if it's null
         if position == "DEF" and not filtered_player.get("full_name"):
@@ -828,39 +911,89 @@ def build_name_lookup_table(players: Dict) -> Dict[str, str]:
     return name_to_id
 
 
-def cache_players():
-    """Main function to fetch, enrich, and cache player data."""
+async def fetch_cache_inputs() -> Dict[str, Any]:
+    """Fetch every upstream source concurrently over one shared client.
 
-    try:
-        # Get Redis client
-        r = get_redis_client()
+    Each pipeline step starts as soon as its own inputs arrive: stats are
+    fetched once the current week is known, ID mapping runs once both player
+    lists are in, and Fantasy Nerds data is organized once its four feeds
+    are in. Total time is roughly that of the slowest chain of requests.
 
-        # Fetch all data
-        sleeper_players = fetch_sleeper_players()
-        ffnerd_players = fetch_fantasy_nerds_players()
-        rankings, injuries, news = fetch_fantasy_nerds_data()
-        ros = fetch_fantasy_nerds_ros()  # Fetch ROS projections
-        bye_weeks_map = fetch_bye_weeks()  # Fetch bye weeks
+    Returns:
+        Dict with sleeper_players, mapping, ffnerd_data, stats_data,
+        bye_weeks_map, current_week and season
+    """
 
-        # Get current NFL week and fetch stats
-        current_week, season = fetch_current_nfl_week()
-        raw_stats = fetch_player_stats(current_week, season)
+    async def stats_stage():
+        current_week, season = await fetch_current_nfl_week(client)
+        raw_stats = await fetch_player_stats(client, current_week, season)
 
         # Filter to only PPR-relevant stats
         stats_data = filter_ppr_relevant_stats(raw_stats)
         print(f"Filtered to {len(stats_data)} players with PPR-relevant stats")
+        return current_week, season, stats_data
 
-        # Create ID mappings
-        mapping = create_player_mappings(sleeper_players, ffnerd_players)
+    async def mapping_stage():
+        sleeper_players, ffnerd_players = await asyncio.gather(
+            fetch_sleeper_players(client), fetch_fantasy_nerds_players(client)
+        )
+        return sleeper_players, create_player_mappings(sleeper_players, ffnerd_players)
 
-        # Organize Fantasy Nerds data (now including ROS)
+    async def ffnerd_stage():
+        (rankings, injuries, news), ros = await asyncio.gather(
+            fetch_fantasy_nerds_data(client), fetch_fantasy_nerds_ros(client)
+        )
         print("Organizing Fantasy Nerds data...")
-        ffnerd_data = organize_ffnerd_data(rankings, injuries, news, ros)
+        return organize_ffnerd_data(rankings, injuries, news, ros)
+
+    start = time.perf_counter()
+    limits = httpx.Limits(max_connections=10, max_keepalive_connections=10)
+    async with httpx.AsyncClient(limits=limits) as client:
+        (
+            (current_week, season, stats_data),
+            (sleeper_players, mapping),
+            ffnerd_data,
+            bye_weeks_map,
+        ) = await asyncio.gather(
+            stats_stage(), mapping_stage(), ffnerd_stage(), fetch_bye_weeks(client)
+        )
+    print(f"Fetched all sources in {time.perf_counter() - start:.1f}s")
+
+    return {
+        "sleeper_players": sleeper_players,
+        "mapping": mapping,
+        "ffnerd_data": ffnerd_data,
+        "stats_data": stats_data,
+        "bye_weeks_map": bye_weeks_map,
+        "current_week": current_week,
+        "season": season,
+    }
+
+
+def cache_players():
+    """Main function to fetch, enrich, and cache player data.
+
+    Must not be called from a running event loop; async callers run it in a
+    worker thread (see cache_client.get_players_from_cache_async).
+    """
+
+    try:
+        # Get Redis client
+        r = get_redis_client()
+
+        # Fetch all upstream data concurrently
+        inputs = asyncio.run(fetch_cache_inputs())
+        current_week = inputs["current_week"]
+        season = inputs["season"]
 
         # Enrich and filter to fantasy-relevant players only
         print("Enriching and filtering players...")
         players = enrich_and_filter_players(
-            sleeper_players, mapping, ffnerd_data, stats_data, bye_weeks_map
+            inputs["sleeper_players"],
+            inputs["mapping"],
+            inputs["ffnerd_data"],
+            inputs["stats_data"],
+            inputs["bye_weeks_map"],
         )
 
         print(f"Total fantasy-relevant players: {len(players)}")
@@ -890,13 +1023,11 @@ def cache_players():
         # Compress and cache
         print("\nCaching player data to Redis...")
 
-        # Convert to JSON and compress
-        json_data = json.dumps(players)
-        compressed_data = gzip.compress(json_data.encode("utf-8"))
-
         # Store in Redis with 6-hour TTL
-        cache_key = "nfl_players_cache"
+        cache_key = PLAYERS_CACHE_KEY
         ttl = 6 * 60 * 60  # 6 hours
+        layout = "hash" if PLAYERS_CACHE_LAYOUT == "hash" else "blob"
+        codec = resolve_codec()
 
         # Clear old cache keys if they exist
         old_keys = ["nfl_players_enriched", "nfl_players_unified"]
@@ -905,18 +1036,37 @@ def cache_players():
                 r.delete(key)
                 print(f"Deleted old cache key: {key}")
 
-        # Set new cache
-        r.set(cache_key, compressed_data, ex=ttl)
+        if layout == "hash":
+            # One field per player so readers can HMGET only what they need
+            json_size = write_players_hash(r, players, ttl)
+            compressed_size = None
+            r.delete(cache_key)
+        else:
+            # Serialize each player separately so readers decode on access
+            json_data = dumps_json(players_blob_payload(players))
+            compressed_data = compress_blob(json_data, codec)
+            json_size = len(json_data)
+            compressed_size = len(compressed_data)
+
+            # Set new cache
+            r.set(cache_key, compressed_data, ex=ttl)
 
         # Cache the name lookup table
         name_lookup_key = "player_name_lookup"
-        name_lookup_json = json.dumps(name_lookup)
-        name_lookup_compressed = gzip.compress(name_lookup_json.encode("utf-8"))
+        name_lookup_compressed = encode_blob(name_lookup, codec)
         r.set(name_lookup_key, name_lookup_compressed, ex=ttl)
         print(
             f"Cached name lookup table ({len(name_lookup_compressed) / 1024:.1f} KB compressed)"
         )
 
+        # Cache the name search index (prefix/trigram search without the player map)
+        search_index = build_search_index(players)
+        search_index_compressed = encode_blob(search_index, codec)
+        r.set(PLAYER_SEARCH_INDEX_KEY, search_index_compressed, ex=ttl)
+        print(
+            f"Cached name search index ({len(search_index['keys'])} names, {len(search_index_compressed) / 1024:.1f} KB compressed)"
+        )
+
         # Store metadata
         metadata = {
             "total_players": len(players),
@@ -929,25 +1079,41 @@ def cache_players():
             "season": season,
             "last_updated": datetime.now().isoformat(),
             "ttl_seconds": ttl,
-            "compressed_size_bytes": len(compressed_data),
-            "uncompressed_size_bytes": len(json_data),
+            "layout": layout,
+            "compressed_size_bytes": compressed_size,
+            "uncompressed_size_bytes": json_size,
+            **codec_metadata(codec),
         }
 
         r.set(f"{cache_key}_metadata", json.dumps(metadata), ex=ttl)
 
+        # Fresh build already has current stats; let spot refreshes start over
+        live_stats_keys = list(r.scan_iter(match=f"{LIVE_STATS_KEY_PREFIX}*"))
+        if live_stats_keys:
+            r.delete(*live_stats_keys)
+
+        # Signal readers that the player data changed
+        version = bump_cache_version(r)
+
         print("\nCache update complete!")
-        print(f"  - Cache key: {cache_key}")
-        print(f"  - Compressed size: {len(compressed_data) / 1024 / 1024:.2f} MB")
-        print(f"  - Uncompressed size: {len(json_data) / 1024 / 1024:.2f} MB")
-        print(
-            f"  - Compression ratio: {(1 - len(compressed_data) / len(json_data)) * 100:.1f}%"
-        )
+        if layout == "hash":
+            print(f"  - Cache key: {PLAYERS_HASH_KEY} (one field per player)")
+        else:
+            print(f"  - Cache key: {cache_key}")
+        print(f"  - Cache version: {version}")
+        if compressed_size is not None:
+            print(f"  - Compressed size: {compressed_size / 1024 / 1024:.2f} MB")
+        print(f"  - Uncompressed size: {json_size / 1024 / 1024:.2f} MB")
+        if compressed_size is not None:
+            print(
+                f"  - Compression ratio: {(1 - compressed_size / json_size) * 100:.1f}%"
+            )
         print("  - TTL: 6 hours")
 
         # Also save to local file for backup
-        with open("fantasy_relevant_players_backup.json", "w") as f:
+        with open(PLAYERS_BACKUP_PATH, "w") as f:
             json.dump(players, f, indent=2)
-        print("\nBackup saved to fantasy_relevant_players_backup.json")
+        print(f"\nBackup saved to {PLAYERS_BACKUP_PATH}")
 
         return True
 
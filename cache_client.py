@@ -4,15 +4,40 @@ Enhanced player cache module that uses enriched data from Fantasy Nerds.
 Provides automatic refresh on cache miss/expiry.
 """
 
+import asyncio
 import json
-import gzip
 import redis
+import redis.asyncio as aioredis
 import os
 import logging
-from typing import Dict, Any, Optional, Set
+import threading
+import time
+import uuid
+import weakref
+from typing import Dict, Any, Iterable, Optional, Set
 from datetime import datetime
-from build_cache import cache_players
+from build_cache import (
+    REDIS_MAX_CONNECTIONS,
+    PLAYERS_CACHE_KEY,
+    PLAYERS_CACHE_VERSION_KEY,
+    PLAYERS_HASH_KEY,
+    LIVE_STATS_KEY_PREFIX,
+    PLAYER_SEARCH_INDEX_KEY,
+    PLAYERS_BACKUP_PATH,
+    cache_players,
+    get_redis_client,
+)
 from dotenv import load_dotenv
+from cache_codec import decode_blob, encode_blob
+from player_views import (
+    ActivePlayersView,
+    LazyPlayers,
+    is_active_player,
+    players_blob_payload,
+    players_from_blob_payload,
+)
+from ppr_stats import filter_ppr_relevant_stats
+from search_index import load_search_index, normalize_name, query_search_index
 
 # Load environment variables
 load_dotenv()
@@ -21,10 +46,289 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 
-def get_redis_client() -> redis.Redis:
-    """Get Redis client connection."""
-    redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
-    return redis.from_url(redis_url, decode_responses=False)
+# One async client (and connection pool) per event loop, since redis.asyncio
+# connections cannot be shared between loops
+_async_redis_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aioredis.Redis]" = weakref.WeakKeyDictionary()
+
+
+def get_async_redis_client() -> aioredis.Redis:
+    """Get the process-wide async Redis client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _async_redis_clients.get(loop)
+    if client is None:
+        client = aioredis.from_url(
+            os.getenv("REDIS_URL", "redis://localhost:6379"),
+            decode_responses=False,
+            max_connections=REDIS_MAX_CONNECTIONS,
+        )
+        _async_redis_clients[loop] = client
+    return client
+
+
+async def close_async_redis_client() -> None:
+    """Close the async Redis pool for the running event loop, if one was opened."""
+    client = _async_redis_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+# In-process copy of the decoded player cache. Entries are only trusted while the
+# Redis version stamp matches, so a warm process skips the blob download entirely.
+_local_players: Dict[str, Any] = {
+    "version": None,
+    "last_updated": None,
+    "players": None,
+    "active_players": None,
+}
+_local_players_lock = threading.Lock()
+
+# Cached data older than this triggers a rebuild from upstream
+CACHE_MAX_AGE_HOURS = 6
+
+# Number of candidate IDs resolved per HMGET when searching by name
+SEARCH_BATCH_SIZE = 50
+
+# Last-applied live stats per week are kept this long (seconds)
+LIVE_STATS_TTL = 7 * 24 * 60 * 60
+
+# Live week stats are reused for this many seconds across callers and processes
+LIVE_STATS_REFRESH_SECONDS = int(os.getenv("LIVE_STATS_REFRESH_SECONDS", "60"))
+# Shared week stats payload and the lock held by the process fetching it
+LIVE_STATS_PAYLOAD_KEY = "nfl_live_stats_payload"
+LIVE_STATS_LOCK_KEY = "nfl_live_stats_lock"
+LIVE_STATS_LOCK_SECONDS = 15
+
+SLEEPER_BASE_URL = "https://api.sleeper.app/v1"
+
+# Most recent week stats payload, the in-flight fetch, and which players have
+# already been applied from that payload
+_live_stats: Dict[str, Any] = {
+    "payload": None,
+    "task": None,
+    "applied_ids": set(),
+    "all_applied": False,
+}
+
+
+# Players loaded from the on-disk backup, served while the cache is rebuilt
+_backup_players: Dict[str, Any] = {"players": None, "active_players": None}
+
+# Decoded name search index and the cache version it was read at
+_search_index: Dict[str, Any] = {"version": None, "index": None}
+
+# In-flight cache rebuild shared by readers and the server warm-up
+_rebuild: Dict[str, Any] = {"task": None}
+
+
+def _is_fresh(meta: Dict[str, Any]) -> bool:
+    """Return True if cache metadata is younger than CACHE_MAX_AGE_HOURS."""
+    last_updated = datetime.fromisoformat(meta.get("last_updated"))
+    age_hours = (datetime.now() - last_updated).total_seconds() / 3600
+    return age_hours < CACHE_MAX_AGE_HOURS
+
+
+def _decode_players_blob(cached_data: bytes) -> LazyPlayers:
+    """Decompress the player blob; players are decoded on access."""
+    return players_from_blob_payload(decode_blob(cached_data))
+
+
+def _decode_player_fields(raw_players: Dict[bytes, bytes]) -> LazyPlayers:
+    """Wrap per-player hash fields; players are decoded on access."""
+    return LazyPlayers({pid.decode("utf-8"): v for pid, v in raw_players.items()})
+
+
+def _load_players(r: redis.Redis, layout: str) -> Optional[Dict[str, Any]]:
+    """Read and decode the full player set in whichever layout was written."""
+    if layout == "hash":
+        raw_players = r.hgetall(PLAYERS_HASH_KEY)
+        return _decode_player_fields(raw_players) if raw_players else None
+
+    cached_data = r.get(PLAYERS_CACHE_KEY)
+    return _decode_players_blob(cached_data) if cached_data else None
+
+
+async def _load_players_async(
+    r: aioredis.Redis, layout: str
+) -> Optional[Dict[str, Any]]:
+    """Async _load_players; decoding runs in a worker thread off the event loop."""
+    if layout == "hash":
+        raw_players = await r.hgetall(PLAYERS_HASH_KEY)
+        if not raw_players:
+            return None
+        return await asyncio.to_thread(_decode_player_fields, raw_players)
+
+    cached_data = await r.get(PLAYERS_CACHE_KEY)
+    if not cached_data:
+        return None
+    return await asyncio.to_thread(_decode_players_blob, cached_data)
+
+
+def _select_players(
+    version: Optional[bytes], players: Dict[str, Any], active_only: bool
+) -> Dict[str, Any]:
+    """Return players (or the memoized active subset) after a fresh load."""
+    local_players = _get_local_players(version, active_only)
+    if local_players is not None:
+        return local_players
+    return ActivePlayersView(players) if active_only else players
+
+
+def _pick_players(
+    players: Dict[str, Any], ids: list, active_only: bool
+) -> Dict[str, Any]:
+    """Select the requested IDs from a full player dict."""
+    return {
+        pid: players[pid]
+        for pid in ids
+        if pid in players and (not active_only or is_active_player(players[pid]))
+    }
+
+
+def _decode_hmget(ids: list, values: list, active_only: bool) -> Dict[str, Any]:
+    """Decode HMGET results for the requested IDs, skipping missing players."""
+    found = {
+        pid: json.loads(value) for pid, value in zip(ids, values) if value is not None
+    }
+    if active_only:
+        return {pid: p for pid, p in found.items() if is_active_player(p)}
+    return found
+
+
+def _store_local_players(
+    version: Optional[bytes], last_updated: Optional[str], players: Dict[str, Any]
+) -> None:
+    """Remember decoded players for the given cache version."""
+    with _local_players_lock:
+        _local_players["version"] = version
+        _local_players["last_updated"] = last_updated
+        _local_players["players"] = players
+        _local_players["active_players"] = None
+
+
+def _get_local_players(
+    version: Optional[bytes], active_only: bool
+) -> Optional[Dict[str, Any]]:
+    """Return the in-process player copy if it matches the Redis version stamp."""
+    if version is None:
+        return None
+
+    with _local_players_lock:
+        if _local_players["version"] != version or _local_players["players"] is None:
+            return None
+
+        last_updated = _local_players["last_updated"]
+        if last_updated:
+            age_hours = (
+                datetime.now() - datetime.fromisoformat(last_updated)
+            ).total_seconds() / 3600
+            if age_hours >= CACHE_MAX_AGE_HOURS:
+                return None
+
+        if not active_only:
+            return _local_players["players"]
+
+        if _local_players["active_players"] is None:
+            _local_players["active_players"] = ActivePlayersView(
+                _local_players["players"]
+            )
+        return _local_players["active_players"]
+
+
+def clear_local_player_cache() -> None:
+    """Drop in-process player data and live stats so the next read goes to Redis."""
+    with _local_players_lock:
+        _local_players["version"] = None
+        _local_players["last_updated"] = None
+        _local_players["players"] = None
+        _local_players["active_players"] = None
+
+    _live_stats["payload"] = None
+    _live_stats["task"] = None
+    _live_stats["applied_ids"] = set()
+    _live_stats["all_applied"] = False
+
+    _clear_backup_players()
+    _rebuild["task"] = None
+    _search_index["version"] = None
+    _search_index["index"] = None
+
+
+def load_backup_players(path: str = PLAYERS_BACKUP_PATH) -> int:
+    """
+    Load the on-disk player backup written by cache_players.
+
+    Once loaded, async readers serve it instead of blocking while the Redis
+    cache is missing, expired or unreachable. It is dropped after the next
+    successful rebuild.
+
+    Args:
+        path: Backup JSON file (default: PLAYERS_BACKUP_PATH)
+
+    Returns:
+        Number of players loaded (0 if the backup is missing or unreadable)
+    """
+    try:
+        with open(path) as f:
+            players = json.load(f)
+    except FileNotFoundError:
+        logger.info(f"No player backup found (path={path})")
+        return 0
+    except Exception as e:
+        logger.warning(
+            f"Error reading player backup (path={path}, error_type={type(e).__name__}, error_message={str(e)})"
+        )
+        return 0
+
+    _backup_players["players"] = players
+    _backup_players["active_players"] = None
+    logger.info(f"Loaded {len(players)} players from backup (path={path})")
+    return len(players)
+
+
+def _clear_backup_players() -> None:
+    """Stop serving the on-disk backup."""
+    _backup_players["players"] = None
+    _backup_players["active_players"] = None
+
+
+def _get_backup_players(active_only: bool) -> Optional[Dict[str, Any]]:
+    """Return backup players if a backup is loaded."""
+    players = _backup_players["players"]
+    if players is None or not active_only:
+        return players
+
+    if _backup_players["active_players"] is None:
+        _backup_players["active_players"] = ActivePlayersView(players)
+    return _backup_players["active_players"]
+
+
+async def _run_rebuild() -> bool:
+    """Rebuild the player cache in a worker thread."""
+    success = await asyncio.to_thread(cache_players)
+    if success:
+        _clear_backup_players()
+    return success
+
+
+def _start_rebuild() -> "asyncio.Task[bool]":
+    """Start a cache rebuild, or return the one already in flight."""
+    loop = asyncio.get_running_loop()
+    task = _rebuild["task"]
+    if task is None or task.done() or task.get_loop() is not loop:
+        task = loop.create_task(_run_rebuild())
+        _rebuild["task"] = task
+    return task
+
+
+async def rebuild_players_cache() -> bool:
+    """
+    Rebuild the player cache from upstream, sharing any rebuild in progress.
+
+    Returns:
+        True if the cache was rebuilt successfully
+    """
+    # Shielded so a cancelled caller does not abort a rebuild others wait on
+    return await asyncio.shield(_start_rebuild())
 
 
 def get_players_from_cache(active_only: bool = True) -> Optional[Dict[str, Any]]:
@@ -32,48 +336,39 @@ def get_players_from_cache(active_only: bool = True) -> Optional[Dict[str, Any]]
     Get player data from Redis cache.
     Automatically refreshes if cache is missing or expired.
 
+    Decoded players are kept in-process and reused until the cache version
+    stamp in Redis changes. The returned dicts are shared between callers and
+    must be treated as read-only (copy before mutating).
+
     Args:
         active_only: If True, only return active players (default: True)
     """
     try:
         r = get_redis_client()
 
-        # Try to get cached data
-        cache_key = "nfl_players_cache"
-        cached_data = r.get(cache_key)
+        # Serve the in-process copy when the data in Redis has not changed
+        version = r.get(PLAYERS_CACHE_VERSION_KEY)
+        local_players = _get_local_players(version, active_only)
+        if local_players is not None:
+            return local_players
 
-        if cached_data:
-            # Check metadata to see if it's fresh enough
-            metadata = r.get(f"{cache_key}_metadata")
-            if metadata:
-                meta = json.loads(metadata)
-                last_updated = datetime.fromisoformat(meta.get("last_updated"))
-                age_hours = (datetime.now() - last_updated).total_seconds() / 3600
-
-                # If cache is less than 6 hours old, use it
-                if age_hours < 6:
-                    logger.info(f"Using cached player data ({age_hours:.1f} hours old)")
-                    decompressed = gzip.decompress(cached_data).decode("utf-8")
-                    players = json.loads(decompressed)
-
-                    # Filter for active players if requested
-                    if active_only:
-                        active_players = {
-                            pid: pdata
-                            for pid, pdata in players.items()
-                            if pdata.get("active", False) is True
-                            and pdata.get("team") is not None
-                        }
-                        logger.info(
-                            f"Filtered to {len(active_players)} active players with teams from {len(players)} total"
-                        )
-                        return active_players
+        # Check metadata to see if the cached data is fresh enough
+        metadata = r.get(f"{PLAYERS_CACHE_KEY}_metadata")
+        if metadata:
+            meta = json.loads(metadata)
+            last_updated = datetime.fromisoformat(meta.get("last_updated"))
+            age_hours = (datetime.now() - last_updated).total_seconds() / 3600
 
-                    return players
-                else:
-                    logger.info(f"Cache is {age_hours:.1f} hours old, refreshing...")
+            # If cache is less than 6 hours old, use it
+            if age_hours < CACHE_MAX_AGE_HOURS:
+                players = _load_players(r, meta.get("layout", "blob"))
+                if players is not None:
+                    logger.info(f"Using cached player data ({age_hours:.1f} hours old)")
+                    _store_local_players(version, meta.get("last_updated"), players)
+                    return _select_players(version, players, active_only)
+                logger.info("No cached data found, fetching fresh data...")
             else:
-                logger.warning("Cache metadata missing, refreshing")
+                logger.info(f"Cache is {age_hours:.1f} hours old, refreshing...")
         else:
             logger.info("No cached data found, fetching fresh data...")
 
@@ -83,25 +378,84 @@ def get_players_from_cache(active_only: bool = True) -> Optional[Dict[str, Any]]
 
         if success:
             # Try to get the newly cached data
-            cached_data = r.get(cache_key)
-            if cached_data:
-                decompressed = gzip.decompress(cached_data).decode("utf-8")
-                players = json.loads(decompressed)
-
-                # Filter for active players if requested
-                if active_only:
-                    active_players = {
-                        pid: pdata
-                        for pid, pdata in players.items()
-                        if pdata.get("active", False) is True
-                        and pdata.get("team") is not None
-                    }
-                    logger.info(
-                        f"Filtered to {len(active_players)} active players with teams from {len(players)} total"
-                    )
-                    return active_players
+            version = r.get(PLAYERS_CACHE_VERSION_KEY)
+            metadata = r.get(f"{PLAYERS_CACHE_KEY}_metadata")
+            meta = json.loads(metadata) if metadata else {}
+            players = _load_players(r, meta.get("layout", "blob"))
+            if players is not None:
+                _store_local_players(
+                    version,
+                    meta.get("last_updated", datetime.now().isoformat()),
+                    players,
+                )
+                return _select_players(version, players, active_only)
 
-                return players
+        logger.error("Failed to refresh cache", exc_info=True)
+        return None
+
+    except Exception as e:
+        logger.error(
+            f"Error accessing player cache (error_type={type(e).__name__}, error_message={str(e)}, active_only={active_only})",
+            exc_info=True,
+        )
+        return None
+
+
+async def get_players_from_cache_async(
+    active_only: bool = True,
+) -> Optional[Dict[str, Any]]:
+    """
+    Async variant of get_players_from_cache using the shared async Redis pool.
+
+    Decoding and cache rebuilds run in worker threads so other requests keep
+    being served while a large read is in progress.
+
+    Args:
+        active_only: If True, only return active players (default: True)
+    """
+    try:
+        r = get_async_redis_client()
+
+        # Serve the in-process copy when the data in Redis has not changed
+        version, metadata = await r.mget(
+            PLAYERS_CACHE_VERSION_KEY, f"{PLAYERS_CACHE_KEY}_metadata"
+        )
+        local_players = _get_local_players(version, active_only)
+        if local_players is not None:
+            return local_players
+
+        if metadata:
+            meta = json.loads(metadata)
+            if _is_fresh(meta):
+                players = await _load_players_async(r, meta.get("layout", "blob"))
+                if players is not None:
+                    _store_local_players(version, meta.get("last_updated"), players)
+                    return _select_players(version, players, active_only)
+
+        # Serve the backup (if loaded) and rebuild without blocking the caller
+        backup = _get_backup_players(active_only)
+        if backup is not None:
+            logger.info("Player cache missing or expired, serving backup")
+            _start_rebuild()
+            return backup
+
+        # Cache is missing or too old - refresh it
+        logger.info("Player cache missing or expired, refreshing...")
+        success = await rebuild_players_cache()
+
+        if success:
+            version, metadata = await r.mget(
+                PLAYERS_CACHE_VERSION_KEY, f"{PLAYERS_CACHE_KEY}_metadata"
+            )
+            meta = json.loads(metadata) if metadata else {}
+            players = await _load_players_async(r, meta.get("layout", "blob"))
+            if players is not None:
+                _store_local_players(
+                    version,
+                    meta.get("last_updated", datetime.now().isoformat()),
+                    players,
+                )
+                return _select_players(version, players, active_only)
 
         logger.error("Failed to refresh cache", exc_info=True)
         return None
@@ -111,14 +465,162 @@ def get_players_from_cache(active_only: bool = True) -> Optional[Dict[str, Any]]
             f"Error accessing player cache (error_type={type(e).__name__}, error_message={str(e)}, active_only={active_only})",
             exc_info=True,
         )
+        return _get_backup_players(active_only)
+
+
+def get_players_by_ids(
+    player_ids: Iterable[str], active_only: bool = False
+) -> Optional[Dict[str, Any]]:
+    """
+    Get only the requested players by Sleeper ID.
+
+    Uses the in-process copy when it is current, HMGET on the per-player hash
+    layout otherwise, and only falls back to decoding the full cache when the
+    blob layout is in use. Returned dicts are shared and must not be mutated.
+
+    Args:
+        player_ids: Sleeper player IDs to look up (duplicates and empty IDs ignored)
+        active_only: If True, drop inactive players and free agents without a team
+
+    Returns:
+        Dict of found players keyed by Sleeper ID, or None if the cache is unavailable
+    """
+    ids = [pid for pid in dict.fromkeys(player_ids) if pid]
+    if not ids:
+        return {}
+
+    try:
+        r = get_redis_client()
+        version, metadata = r.mget(
+            PLAYERS_CACHE_VERSION_KEY, f"{PLAYERS_CACHE_KEY}_metadata"
+        )
+
+        players = _get_local_players(version, active_only=False)
+        if players is None and metadata:
+            meta = json.loads(metadata)
+            if meta.get("layout") == "hash" and _is_fresh(meta):
+                values = r.hmget(PLAYERS_HASH_KEY, ids)
+                return _decode_hmget(ids, values, active_only)
+
+        if players is None:
+            players = get_players_from_cache(active_only=False)
+            if players is None:
+                return None
+
+        return _pick_players(players, ids, active_only)
+
+    except Exception as e:
+        logger.error(
+            f"Error getting players by ID (error_type={type(e).__name__}, error_message={str(e)}, count={len(ids)})",
+            exc_info=True,
+        )
         return None
 
 
-def normalize_name(name: str) -> str:
-    """Normalize player name for matching."""
-    return (
-        name.lower().replace(".", "").replace("'", "").replace("-", "").replace(" ", "")
-    )
+async def get_players_by_ids_async(
+    player_ids: Iterable[str], active_only: bool = False
+) -> Optional[Dict[str, Any]]:
+    """
+    Async variant of get_players_by_ids using the shared async Redis pool.
+
+    Args:
+        player_ids: Sleeper player IDs to look up (duplicates and empty IDs ignored)
+        active_only: If True, drop inactive players and free agents without a team
+
+    Returns:
+        Dict of found players keyed by Sleeper ID, or None if the cache is unavailable
+    """
+    ids = [pid for pid in dict.fromkeys(player_ids) if pid]
+    if not ids:
+        return {}
+
+    try:
+        r = get_async_redis_client()
+        version, metadata = await r.mget(
+            PLAYERS_CACHE_VERSION_KEY, f"{PLAYERS_CACHE_KEY}_metadata"
+        )
+
+        players = _get_local_players(version, active_only=False)
+        if players is None and metadata:
+            meta = json.loads(metadata)
+            if meta.get("layout") == "hash" and _is_fresh(meta):
+                values = await r.hmget(PLAYERS_HASH_KEY, ids)
+                return _decode_hmget(ids, values, active_only)
+
+        if players is None:
+            players = await get_players_from_cache_async(active_only=False)
+            if players is None:
+                return None
+
+        return _pick_players(players, ids, active_only)
+
+    except Exception as e:
+        logger.error(
+            f"Error getting players by ID (error_type={type(e).__name__}, error_message={str(e)}, count={len(ids)})",
+            exc_info=True,
+        )
+        return None
+
+
+def _decode_search_index(cached_data: bytes) -> Dict[str, Any]:
+    """Decode the compressed search index and build its lookup structures."""
+    return load_search_index(decode_blob(cached_data))
+
+
+def _remember_search_index(
+    version: Optional[bytes], index: Optional[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """Keep a decoded search index for the given cache version."""
+    if index is not None and version is not None:
+        _search_index["version"] = version
+        _search_index["index"] = index
+    return index
+
+
+def get_search_index() -> Optional[Dict[str, Any]]:
+    """Get the name search index, decoded once per cache version."""
+    try:
+        r = get_redis_client()
+        version = r.get(PLAYERS_CACHE_VERSION_KEY)
+        if version is not None and _search_index["version"] == version:
+            return _search_index["index"]
+
+        cached_data = r.get(PLAYER_SEARCH_INDEX_KEY)
+        if not cached_data:
+            return None
+        return _remember_search_index(version, _decode_search_index(cached_data))
+    except Exception as e:
+        logger.error(
+            f"Error getting search index from cache (error_type={type(e).__name__}, error_message={str(e)})",
+            exc_info=True,
+        )
+        return None
+
+
+async def get_search_index_async() -> Optional[Dict[str, Any]]:
+    """Async variant of get_search_index."""
+    try:
+        r = get_async_redis_client()
+        version = await r.get(PLAYERS_CACHE_VERSION_KEY)
+        if version is not None and _search_index["version"] == version:
+            return _search_index["index"]
+
+        cached_data = await r.get(PLAYER_SEARCH_INDEX_KEY)
+        if not cached_data:
+            return None
+        index = await asyncio.to_thread(_decode_search_index, cached_data)
+        return _remember_search_index(version, index)
+    except Exception as e:
+        logger.error(
+            f"Error getting search index from cache (error_type={type(e).__name__}, error_message={str(e)})",
+            exc_info=True,
+        )
+        return None
+
+
+def _indexed_results(ids: list, players: Dict[str, Any]) -> list:
+    """Search results in index rank order."""
+    return [{"player_id": pid, **players[pid]} for pid in ids if pid in players]
 
 
 def get_name_lookup_from_cache() -> Optional[Dict[str, str]]:
@@ -129,8 +631,26 @@ def get_name_lookup_from_cache() -> Optional[Dict[str, str]]:
         cached_data = r.get(cache_key)
 
         if cached_data:
-            decompressed = gzip.decompress(cached_data).decode("utf-8")
-            return json.loads(decompressed)
+            return decode_blob(cached_data)
+
+        logger.warning("Name lookup table not found in cache")
+        return None
+    except Exception as e:
+        logger.error(
+            f"Error getting name lookup from cache (error_type={type(e).__name__}, error_message={str(e)})",
+            exc_info=True,
+        )
+        return None
+
+
+async def get_name_lookup_from_cache_async() -> Optional[Dict[str, str]]:
+    """Async variant of get_name_lookup_from_cache."""
+    try:
+        r = get_async_redis_client()
+        cached_data = await r.get("player_name_lookup")
+
+        if cached_data:
+            return decode_blob(cached_data)
 
         logger.warning("Name lookup table not found in cache")
         return None
@@ -142,54 +662,130 @@ def get_name_lookup_from_cache() -> Optional[Dict[str, str]]:
         return None
 
 
+def _lookup_candidates(
+    name_lookup: Optional[Dict[str, str]], normalized_query: str
+) -> list:
+    """Player IDs from the lookup table: exact match first, then partial matches."""
+    candidate_ids = []
+    if name_lookup:
+        if normalized_query in name_lookup:
+            candidate_ids.append(name_lookup[normalized_query])
+        candidate_ids.extend(
+            player_id
+            for name_key, player_id in name_lookup.items()
+            if normalized_query in name_key
+        )
+    return list(dict.fromkeys(candidate_ids))
+
+
+def _add_matches(
+    results: list, matched_ids: set, batch: list, players: Dict[str, Any], limit: int
+) -> bool:
+    """Append found players from a candidate batch. Returns True once limit is hit."""
+    for player_id in batch:
+        if player_id in players and player_id not in matched_ids:
+            results.append({"player_id": player_id, **players[player_id]})
+            matched_ids.add(player_id)
+            if len(results) >= limit:
+                return True
+    return False
+
+
+def _add_full_name_matches(
+    results: list, matched_ids: set, players: Dict[str, Any], query: str, limit: int
+) -> None:
+    """Fall back to substring matches on full names until limit is hit."""
+    query_lower = query.lower()
+    for player_id, player in players.items():
+        if player_id not in matched_ids:
+            full_name = player.get("full_name", "").lower()
+            if query_lower in full_name:
+                results.append({"player_id": player_id, **player})
+                matched_ids.add(player_id)
+                if len(results) >= limit:
+                    break
+
+
 def search_players(query: str, limit: int = 10, active_only: bool = True) -> list:
     """
     Search players by name using cached lookup table for fast access.
     Returns list of matching players with all data.
 
+    Uses the prebuilt search index (exact > prefix > substring > fuzzy,
+    ranked by roster relevance) and fetches only the matched players. Caches
+    written before the index existed fall back to the name lookup table,
+    resolving candidates in batches, then to a full-name scan.
+
     Args:
         query: Player name to search for
         limit: Maximum number of results to return (default: 10)
         active_only: If True, only return active players (default: True)
     """
-    # Get both the players data and name lookup table
+    index = get_search_index()
+    if index is not None:
+        ids = query_search_index(index, query, limit, active_only)
+        players = get_players_by_ids(ids, active_only=active_only)
+        return _indexed_results(ids, players) if players else []
+
+    candidate_ids = _lookup_candidates(
+        get_name_lookup_from_cache(), normalize_name(query)
+    )
+    results = []
+    matched_ids = set()
+
+    batch_size = max(limit, SEARCH_BATCH_SIZE)
+    for start in range(0, len(candidate_ids), batch_size):
+        batch = candidate_ids[start : start + batch_size]
+        players = get_players_by_ids(batch, active_only=active_only)
+        if players is None:
+            return []
+        if _add_matches(results, matched_ids, batch, players, limit):
+            return results
+
+    # Fall back to searching full names in player data if needed
     players = get_players_from_cache(active_only=active_only)
-    if not players:
-        return []
+    if players:
+        _add_full_name_matches(results, matched_ids, players, query, limit)
 
-    name_lookup = get_name_lookup_from_cache()
-    normalized_query = normalize_name(query)
+    return results
+
+
+async def search_players_async(
+    query: str, limit: int = 10, active_only: bool = True
+) -> list:
+    """
+    Async variant of search_players using the shared async Redis pool.
+
+    Args:
+        query: Player name to search for
+        limit: Maximum number of results to return (default: 10)
+        active_only: If True, only return active players (default: True)
+    """
+    index = await get_search_index_async()
+    if index is not None:
+        ids = query_search_index(index, query, limit, active_only)
+        players = await get_players_by_ids_async(ids, active_only=active_only)
+        return _indexed_results(ids, players) if players else []
+
+    candidate_ids = _lookup_candidates(
+        await get_name_lookup_from_cache_async(), normalize_name(query)
+    )
     results = []
     matched_ids = set()
 
-    # First, try exact match using the lookup table
-    if name_lookup and normalized_query in name_lookup:
-        player_id = name_lookup[normalized_query]
-        if player_id in players:
-            results.append({"player_id": player_id, **players[player_id]})
-            matched_ids.add(player_id)
-
-    # Then do partial matching on the lookup table keys
-    if name_lookup and len(results) < limit:
-        for name_key, player_id in name_lookup.items():
-            if player_id not in matched_ids and normalized_query in name_key:
-                if player_id in players:
-                    results.append({"player_id": player_id, **players[player_id]})
-                    matched_ids.add(player_id)
-                    if len(results) >= limit:
-                        break
+    batch_size = max(limit, SEARCH_BATCH_SIZE)
+    for start in range(0, len(candidate_ids), batch_size):
+        batch = candidate_ids[start : start + batch_size]
+        players = await get_players_by_ids_async(batch, active_only=active_only)
+        if players is None:
+            return []
+        if _add_matches(results, matched_ids, batch, players, limit):
+            return results
 
     # Fall back to searching full names in player data if needed
-    if len(results) < limit:
-        query_lower = query.lower()
-        for player_id, player in players.items():
-            if player_id not in matched_ids:
-                full_name = player.get("full_name", "").lower()
-                if query_lower in full_name:
-                    results.append({"player_id": player_id, **player})
-                    matched_ids.add(player_id)
-                    if len(results) >= limit:
-                        break
+    players = await get_players_from_cache_async(active_only=active_only)
+    if players:
+        _add_full_name_matches(results, matched_ids, players, query, limit)
 
     return results
 
@@ -198,18 +794,268 @@ def get_player_by_id(player_id: str) -> Optional[Dict[str, Any]]:
     """
     Get a specific player by Sleeper ID.
     """
-    players = get_players_from_cache()
+    players = get_players_by_ids([player_id], active_only=True)
+    if not players:
+        return None
+
+    return players.get(player_id)
+
+
+async def get_player_by_id_async(player_id: str) -> Optional[Dict[str, Any]]:
+    """Async variant of get_player_by_id."""
+    players = await get_players_by_ids_async([player_id], active_only=True)
     if not players:
         return None
 
     return players.get(player_id)
 
 
-def spot_refresh_player_stats(player_ids: Optional[Set[str]] = None) -> bool:
+def _with_live_stats(player: Dict[str, Any], stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of a cached player with current-week stats as stats.actual."""
+    player_stats = dict(player.get("stats") or {"projected": None, "actual": None})
+
+    # Separate game stats from fantasy points
+    game_stats = {k: v for k, v in stats.items() if k != "fantasy_points"}
+
+    player_stats["actual"] = {
+        "fantasy_points": stats.get("fantasy_points"),
+        "game_stats": game_stats if game_stats else None,
+        "game_status": "live",  # Could be enhanced with actual game status
+    }
+    return {**player, "stats": player_stats}
+
+
+def _with_player_updates(
+    players: Dict[str, Any], updated_players: Dict[str, Any]
+) -> LazyPlayers:
+    """Return a view of players with updated_players swapped in, sharing the rest."""
+    if not isinstance(players, LazyPlayers):
+        players = LazyPlayers(players)
+    return players.with_updates(updated_players)
+
+
+async def _changed_live_stats(
+    r: aioredis.Redis, season: str, week: int, stats: Dict[str, Any]
+) -> tuple[Dict[str, Any], Dict[str, str]]:
+    """Compare week stats against the last payload applied to the cache.
+
+    Returns:
+        Tuple of (stats for players whose numbers changed, their encoded form
+        to record with _record_live_stats once the cache write succeeds)
+    """
+    player_ids = list(stats)
+    encoded = {pid: json.dumps(stats[pid], sort_keys=True) for pid in player_ids}
+    previous = await r.hmget(f"{LIVE_STATS_KEY_PREFIX}{season}:{week}", player_ids)
+
+    changed = {
+        pid: stats[pid]
+        for pid, prev in zip(player_ids, previous)
+        if prev is None or prev.decode("utf-8") != encoded[pid]
+    }
+    return changed, {pid: encoded[pid] for pid in changed}
+
+
+async def _record_live_stats(
+    r: aioredis.Redis, season: str, week: int, encoded: Dict[str, str]
+) -> None:
+    """Remember the stats payload applied for each player this week."""
+    key = f"{LIVE_STATS_KEY_PREFIX}{season}:{week}"
+    async with r.pipeline() as pipe:
+        pipe.hset(key, mapping=encoded)
+        pipe.expire(key, LIVE_STATS_TTL)
+        await pipe.execute()
+
+
+async def _write_live_stats(
+    r: aioredis.Redis,
+    meta: Dict[str, Any],
+    version: Optional[bytes],
+    changed_stats: Dict[str, Any],
+) -> Optional[tuple[Dict[str, Any], Optional[Dict[str, Any]]]]:
+    """Patch changed players into whichever cache layout is in use.
+
+    Returns:
+        Tuple of (updated players, full player dict to keep in-process or None),
+        or None if there is no cache to update
+    """
+    local_players = _get_local_players(version, active_only=False)
+
+    if meta.get("layout") == "hash":
+        # Only read and rewrite the players that have new stats
+        update_ids = list(changed_stats)
+        values = await r.hmget(PLAYERS_HASH_KEY, update_ids)
+        updated_players = {
+            pid: _with_live_stats(json.loads(value), changed_stats[pid])
+            for pid, value in zip(update_ids, values)
+            if value is not None
+        }
+        if updated_players:
+            await r.hset(
+                PLAYERS_HASH_KEY,
+                mapping={
+                    pid: json.dumps(pdata) for pid, pdata in updated_players.items()
+                },
+            )
+
+        # Patch the in-process players rather than re-reading them all
+        if local_players is None:
+            return updated_players, None
+        return updated_players, _with_player_updates(local_players, updated_players)
+
+    # Blob layout: start from the in-process copy when it is current
+    base_players = local_players
+    if base_players is None:
+        cached_data = await r.get(PLAYERS_CACHE_KEY)
+        if not cached_data:
+            return None
+        base_players = await asyncio.to_thread(_decode_players_blob, cached_data)
+
+    updated_players = {
+        pid: _with_live_stats(base_players[pid], stats)
+        for pid, stats in changed_stats.items()
+        if pid in base_players
+    }
+    if not updated_players:
+        return updated_players, local_players
+
+    # Re-compress and save back to cache, keeping the codec the build recorded.
+    # Unchanged players are written back from their encoded fragments.
+    players = _with_player_updates(base_players, updated_players)
+    compressed = await asyncio.to_thread(
+        lambda: encode_blob(players_blob_payload(players), meta.get("codec"))
+    )
+    await r.set(PLAYERS_CACHE_KEY, compressed, keepttl=True)
+    return updated_players, players
+
+
+async def _fetch_week_stats() -> Dict[str, Any]:
+    """Fetch current week stats from Sleeper, filtered to PPR-relevant fields."""
+    # Imported here because lib imports this module
+    from lib.http_client import get_http_client
+
+    # Get current week/season info
+    season = str(datetime.now().year)
+    client = get_http_client()
+
+    # Fetch current week from schedule endpoint
+    schedule_resp = await client.get(f"{SLEEPER_BASE_URL}/state/nfl")
+    schedule_resp.raise_for_status()
+    current_week = schedule_resp.json().get("week", 1)
+
+    logger.info(f"Fetching live stats for week {current_week}, season {season}")
+
+    # Fetch stats for current week
+    stats_resp = await client.get(
+        f"{SLEEPER_BASE_URL}/stats/nfl/regular/{season}/{current_week}"
+    )
+    stats_resp.raise_for_status()
+    raw_stats = stats_resp.json()
+
+    return {
+        "season": season,
+        "week": current_week,
+        # Filter to PPR-relevant stats, shared with build_cache
+        "stats": filter_ppr_relevant_stats(raw_stats),
+        "fetched_at": time.time(),
+    }
+
+
+async def _read_shared_week_stats(r: aioredis.Redis) -> Optional[Dict[str, Any]]:
+    """Return the week stats payload another process stored, if still fresh."""
+    data = await r.get(LIVE_STATS_PAYLOAD_KEY)
+    if not data:
+        return None
+    return decode_blob(data)
+
+
+async def _fetch_week_stats_shared() -> Dict[str, Any]:
+    """Fetch week stats at most once per freshness window across processes.
+
+    The process that wins the Redis lock fetches from Sleeper and publishes the
+    payload; the others wait for it and fall back to fetching themselves if the
+    lock holder does not publish in time. Without Redis every process fetches
+    for itself.
+    """
+    try:
+        return await _fetch_week_stats_locked(get_async_redis_client())
+    except redis.RedisError as e:
+        logger.warning(
+            f"Redis unavailable for shared live stats, fetching directly (error_type={type(e).__name__}, error_message={str(e)})"
+        )
+        return await _fetch_week_stats()
+
+
+async def _fetch_week_stats_locked(r: aioredis.Redis) -> Dict[str, Any]:
+    """Fetch week stats under the Redis lock, or wait for the lock holder."""
+    payload = await _read_shared_week_stats(r)
+    if payload:
+        return payload
+
+    token = uuid.uuid4().hex
+    if await r.set(LIVE_STATS_LOCK_KEY, token, nx=True, ex=LIVE_STATS_LOCK_SECONDS):
+        try:
+            payload = await _fetch_week_stats()
+            if LIVE_STATS_REFRESH_SECONDS > 0:
+                await r.set(
+                    LIVE_STATS_PAYLOAD_KEY,
+                    encode_blob(payload),
+                    ex=LIVE_STATS_REFRESH_SECONDS,
+                )
+            return payload
+        finally:
+            if await r.get(LIVE_STATS_LOCK_KEY) == token.encode("utf-8"):
+                await r.delete(LIVE_STATS_LOCK_KEY)
+
+    # Another process is fetching - wait for it to publish
+    deadline = time.monotonic() + LIVE_STATS_LOCK_SECONDS
+    while time.monotonic() < deadline:
+        await asyncio.sleep(0.1)
+        payload = await _read_shared_week_stats(r)
+        if payload:
+            return payload
+
+    logger.warning("Timed out waiting for shared live stats, fetching directly")
+    return await _fetch_week_stats()
+
+
+async def get_live_week_stats() -> Dict[str, Any]:
+    """Get current week stats, shared by all callers within the freshness window.
+
+    Concurrent callers in this process await a single in-flight fetch.
+
+    Returns:
+        Dict with season, week, stats (PPR-relevant, keyed by player ID) and
+        fetched_at (epoch seconds)
+    """
+    payload = _live_stats["payload"]
+    if payload and time.time() - payload["fetched_at"] < LIVE_STATS_REFRESH_SECONDS:
+        return payload
+
+    loop = asyncio.get_running_loop()
+    task = _live_stats["task"]
+    if task is None or task.done() or task.get_loop() is not loop:
+        task = loop.create_task(_fetch_week_stats_shared())
+        _live_stats["task"] = task
+
+    payload = await asyncio.shield(task)
+    if _live_stats["payload"] is not payload:
+        _live_stats["payload"] = payload
+        _live_stats["applied_ids"] = set()
+        _live_stats["all_applied"] = False
+    return payload
+
+
+async def spot_refresh_player_stats(player_ids: Optional[Set[str]] = None) -> bool:
     """
     Spot refresh stats for specific players or all players with recent stats.
     This fetches current week stats and updates only those players in cache.
 
+    The week stats fetch is shared (see get_live_week_stats), and players already
+    applied from the current payload are skipped. The last payload applied per
+    player is kept in Redis, so only players whose numbers changed are
+    rewritten. When nothing changed the cache, metadata and version stamp are
+    left untouched.
+
     Args:
         player_ids: Optional set of player IDs to specifically update.
                    If None, updates all players with stats in current week.
@@ -218,167 +1064,123 @@ def spot_refresh_player_stats(player_ids: Optional[Set[str]] = None) -> bool:
         True if update successful, False otherwise
     """
     try:
-        # Get current week from NFL schedule
-        import httpx
-
-        # Get current week/season info
-        current_year = datetime.now().year
-        season = str(current_year)
-
-        # Fetch current week from schedule endpoint
-        with httpx.Client(timeout=10.0) as client:
-            schedule_resp = client.get("https://api.sleeper.app/v1/state/nfl")
-            schedule_resp.raise_for_status()
-            state = schedule_resp.json()
-            current_week = state.get("week", 1)
+        payload = await get_live_week_stats()
 
-            logger.info(f"Fetching live stats for week {current_week}, season {season}")
-
-            # Fetch stats for current week
-            stats_url = (
-                f"https://api.sleeper.app/v1/stats/nfl/regular/{season}/{current_week}"
-            )
-            stats_resp = client.get(stats_url)
-            stats_resp.raise_for_status()
-            raw_stats = stats_resp.json()
+        # Nothing to do if these players were already applied from this payload
+        if _live_stats["payload"] is payload and (
+            _live_stats["all_applied"]
+            or (player_ids and player_ids <= _live_stats["applied_ids"])
+        ):
+            return True
 
-        # Filter to PPR-relevant stats using the same logic as build_cache
-        filtered_stats = filter_ppr_relevant_stats(raw_stats)
+        season = payload["season"]
+        current_week = payload["week"]
+        filtered_stats = payload["stats"]
 
         # If specific player_ids provided, filter to just those
         if player_ids:
             filtered_stats = {
-                pid: stats for pid, stats in filtered_stats.items() if pid in player_ids
+                pid: filtered_stats[pid] for pid in player_ids if pid in filtered_stats
             }
 
-        if not filtered_stats:
+        if filtered_stats:
+            if not await _apply_live_stats(season, current_week, filtered_stats):
+                return False
+        else:
             logger.info("No stats to update")
-            return True
-
-        # Get Redis client and current cache
-        r = get_redis_client()
-        cache_key = "nfl_players_cache"
 
-        # Get current cache
-        cached_data = r.get(cache_key)
-        if not cached_data:
-            logger.warning("No cache exists to spot update")
-            return False
+        if _live_stats["payload"] is payload:
+            if player_ids:
+                _live_stats["applied_ids"] |= player_ids
+            else:
+                _live_stats["all_applied"] = True
 
-        # Decompress and load current cache
-        decompressed = gzip.decompress(cached_data).decode("utf-8")
-        players = json.loads(decompressed)
+        return True
 
-        # Update stats for matching players
-        updated_count = 0
-        for player_id, stats in filtered_stats.items():
-            if player_id in players:
-                # Update the stats.actual structure
-                if "stats" not in players[player_id]:
-                    players[player_id]["stats"] = {"projected": None, "actual": None}
+    except Exception as e:
+        logger.error(
+            f"Error spot refreshing player stats (error_type={type(e).__name__}, error_message={str(e)})",
+            exc_info=True,
+        )
+        return False
 
-                # Extract fantasy points
-                fantasy_points = stats.get("fantasy_points")
 
-                # Separate game stats from fantasy points
-                game_stats = {k: v for k, v in stats.items() if k != "fantasy_points"}
+async def _apply_live_stats(
+    season: str, week: int, filtered_stats: Dict[str, Any]
+) -> bool:
+    """Write changed live stats into the player cache.
 
-                players[player_id]["stats"]["actual"] = {
-                    "fantasy_points": fantasy_points,
-                    "game_stats": game_stats if game_stats else None,
-                    "game_status": "live",  # Could be enhanced with actual game status
-                }
-                updated_count += 1
+    Returns:
+        True if the cache is up to date with filtered_stats, False if there is
+        no cache to update
+    """
+    # Skip players whose stats match what was last applied
+    r = get_async_redis_client()
+    changed_stats, encoded = await _changed_live_stats(r, season, week, filtered_stats)
+    if not changed_stats:
+        logger.info(
+            f"Live stats unchanged, skipping cache write (count={len(filtered_stats)})"
+        )
+        return True
 
-        logger.info(f"Updated stats for {updated_count} players")
+    cache_key = PLAYERS_CACHE_KEY
+    version, metadata = await r.mget(PLAYERS_CACHE_VERSION_KEY, f"{cache_key}_metadata")
+    meta = json.loads(metadata) if metadata else {}
 
-        # Re-compress and save back to cache
-        compressed = gzip.compress(json.dumps(players).encode("utf-8"))
-        r.set(cache_key, compressed)
+    written = await _write_live_stats(r, meta, version, changed_stats)
+    if written is None:
+        logger.warning("No cache exists to spot update")
+        return False
+    updated_players, players = written
 
-        # Update metadata with spot refresh time
-        metadata = r.get(f"{cache_key}_metadata")
-        if metadata:
-            meta = json.loads(metadata)
-            meta["last_spot_refresh"] = datetime.now().isoformat()
-            meta["last_spot_refresh_count"] = updated_count
-            r.set(f"{cache_key}_metadata", json.dumps(meta))
+    await _record_live_stats(r, season, week, encoded)
 
+    updated_count = len(updated_players)
+    logger.info(
+        f"Updated stats for {updated_count} players ({len(changed_stats)} changed of {len(filtered_stats)})"
+    )
+    if not updated_count:
         return True
 
-    except Exception as e:
-        logger.error(
-            f"Error spot refreshing player stats (error_type={type(e).__name__}, error_message={str(e)})",
-            exc_info=True,
+    # Update metadata with spot refresh time
+    if meta:
+        meta["last_spot_refresh"] = datetime.now().isoformat()
+        meta["last_spot_refresh_count"] = updated_count
+        await r.set(f"{cache_key}_metadata", json.dumps(meta), keepttl=True)
+
+    # Invalidate other processes' copies and keep the patched data locally
+    new_version = int(await r.incr(PLAYERS_CACHE_VERSION_KEY))
+    if players is not None:
+        _store_local_players(
+            str(new_version).encode("utf-8"), meta.get("last_updated"), players
         )
-        return False
 
-
-def filter_ppr_relevant_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
-    """Filter stats to only include PPR points and contributing stats.
-    Duplicated from build_cache.py for efficiency."""
-
-    # Define mapping from Sleeper API fields to our descriptive names
-    field_mapping = {
-        "pts_ppr": "fantasy_points",
-        "pass_yd": "passing_yards",
-        "pass_td": "passing_touchdowns",
-        "pass_int": "passing_interceptions",
-        "pass_2pt": "passing_two_point_conversions",
-        "rush_att": "carries",  # Rushing attempts
-        "rush_yd": "rushing_yards",
-        "rush_td": "rushing_touchdowns",
-        "rush_2pt": "rushing_two_point_conversions",
-        "rec": "receptions",
-        "rec_tgt": "targets",
-        "rec_yd": "receiving_yards",
-        "rec_td": "receiving_touchdowns",
-        "rec_2pt": "receiving_two_point_conversions",
-        "fum_lost": "fumbles_lost",
-        "fgm": "field_goals_made",
-        "fgm_0_19": "field_goals_made_0_19",
-        "fgm_20_29": "field_goals_made_20_29",
-        "fgm_30_39": "field_goals_made_30_39",
-        "fgm_40_49": "field_goals_made_40_49",
-        "fgm_50p": "field_goals_made_50_plus",
-        "fgmiss": "field_goals_missed",
-        "xpm": "extra_points_made",
-        "xpmiss": "extra_points_missed",
-        "def_td": "defensive_touchdowns",
-        "def_int": "defensive_interceptions",
-        "def_sack": "defensive_sacks",
-        "def_ff": "defensive_forced_fumbles",
-        "def_fr": "defensive_fumble_recoveries",
-        "bonus_pass_yd_300": "bonus_passing_300_yards",
-        "bonus_pass_yd_400": "bonus_passing_400_yards",
-        "bonus_rush_yd_100": "bonus_rushing_100_yards",
-        "bonus_rush_yd_200": "bonus_rushing_200_yards",
-        "bonus_rec_yd_100": "bonus_receiving_100_yards",
-        "bonus_rec_yd_200": "bonus_receiving_200_yards",
+    return True
+
+
+def _format_cache_status(meta: Dict[str, Any], history_data: list) -> Dict[str, Any]:
+    """Build the cache status response from metadata and refresh history."""
+    last_updated = datetime.fromisoformat(meta.get("last_updated"))
+    age_hours = (datetime.now() - last_updated).total_seconds() / 3600
+
+    return {
+        "exists": True,
+        "last_updated": meta.get("last_updated"),
+        "age_hours": round(age_hours, 1),
+        "total_players": meta.get("total_players"),
+        "players_with_projections": meta.get("players_with_projections"),
+        "players_with_injuries": meta.get("players_with_injuries"),
+        "players_with_news": meta.get("players_with_news"),
+        "players_with_stats": meta.get("players_with_stats", 0),
+        "current_week": meta.get("current_week"),
+        "season": meta.get("season"),
+        "layout": meta.get("layout", "blob"),
+        "compressed_size_mb": round(
+            (meta.get("compressed_size_bytes") or 0) / 1024 / 1024, 2
+        ),
+        "refresh_history": [json.loads(item) for item in history_data],
     }
 
-    filtered = {}
-    for player_id, player_stats in stats.items():
-        if isinstance(player_stats, dict):
-            transformed_stats = {}
-            fantasy_points = None
-
-            for old_field, new_field in field_mapping.items():
-                if old_field in player_stats:
-                    value = player_stats[old_field]
-                    if value is not None and value != 0:
-                        transformed_stats[new_field] = value
-                        if old_field == "pts_ppr":
-                            fantasy_points = value
-
-            # Only add player if they have fantasy points
-            if fantasy_points is not None:
-                filtered[player_id] = transformed_stats
-        else:
-            filtered[player_id] = player_stats
-
-    return filtered
-
 
 def get_cache_status() -> Dict[str, Any]:
     """
@@ -387,9 +1189,9 @@ def get_cache_status() -> Dict[str, Any]:
     try:
         r = get_redis_client()
 
-        # Check if cache exists
-        cache_key = "nfl_players_cache"
-        exists = r.exists(cache_key)
+        # Check if cache exists in either layout
+        cache_key = PLAYERS_CACHE_KEY
+        exists = r.exists(cache_key, PLAYERS_HASH_KEY)
 
         if not exists:
             return {"exists": False, "message": "Cache not found"}
@@ -397,33 +1199,34 @@ def get_cache_status() -> Dict[str, Any]:
         # Get metadata
         metadata = r.get(f"{cache_key}_metadata")
         if metadata:
-            meta = json.loads(metadata)
-            last_updated = datetime.fromisoformat(meta.get("last_updated"))
-            age_hours = (datetime.now() - last_updated).total_seconds() / 3600
+            # Get refresh history (last 5 refreshes)
+            history_data = r.lrange("nfl_players_refresh_history", 0, 4)
+            return _format_cache_status(json.loads(metadata), history_data)
 
-            # Get refresh history
-            history_key = "nfl_players_refresh_history"
-            history = []
-            history_data = r.lrange(history_key, 0, 4)  # Last 5 refreshes
-            for item in history_data:
-                history.append(json.loads(item))
-
-            return {
-                "exists": True,
-                "last_updated": meta.get("last_updated"),
-                "age_hours": round(age_hours, 1),
-                "total_players": meta.get("total_players"),
-                "players_with_projections": meta.get("players_with_projections"),
-                "players_with_injuries": meta.get("players_with_injuries"),
-                "players_with_news": meta.get("players_with_news"),
-                "players_with_stats": meta.get("players_with_stats", 0),
-                "current_week": meta.get("current_week"),
-                "season": meta.get("season"),
-                "compressed_size_mb": round(
-                    meta.get("compressed_size_bytes", 0) / 1024 / 1024, 2
-                ),
-                "refresh_history": history,
-            }
+        return {"exists": True, "message": "Cache exists but metadata missing"}
+
+    except Exception as e:
+        return {"error": str(e)}
+
+
+async def get_cache_status_async() -> Dict[str, Any]:
+    """Async variant of get_cache_status using the shared async Redis pool."""
+    try:
+        r = get_async_redis_client()
+
+        # Check if cache exists in either layout
+        cache_key = PLAYERS_CACHE_KEY
+        exists = await r.exists(cache_key, PLAYERS_HASH_KEY)
+
+        if not exists:
+            return {"exists": False, "message": "Cache not found"}
+
+        # Get metadata
+        metadata = await r.get(f"{cache_key}_metadata")
+        if metadata:
+            # Get refresh history (last 5 refreshes)
+            history_data = await r.lrange("nfl_players_refresh_history", 0, 4)
+            return _format_cache_status(json.loads(metadata), history_data)
 
         return {"exists": True, "message": "Cache exists but metadata missing"}
 
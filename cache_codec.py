@@ -0,0 +1,140 @@
+"""
+Codecs for the compressed blobs in the player cache.
+
+The player blob, name lookup, search index and shared live stats payload are
+stored as compressed JSON. Two codecs are supported:
+
+- gzip-json: gzip-compressed JSON, the original format
+- zstd-json: zstd-compressed JSON, several times faster to encode and decode
+  at a similar size (needs the zstandard package)
+
+JSON is serialized with orjson when it is installed and with the standard
+library otherwise; the bytes are interchangeable. Readers detect the codec
+from the blob's magic bytes, so entries written in either format (including
+ones written before codecs were configurable) stay readable whatever
+CACHE_CODEC is set to. cache_players records the codec and CODEC_VERSION in
+the cache metadata.
+
+Configuration (environment variables):
+- CACHE_CODEC: codec for new writes, "gzip" or "zstd" (default: gzip). Falls
+  back to gzip if zstandard is not installed.
+- CACHE_GZIP_LEVEL: gzip compression level, 1-9 (default: 6)
+- CACHE_ZSTD_LEVEL: zstd compression level (default: 3)
+"""
+
+import gzip
+import json
+import logging
+import os
+from typing import Any, Dict, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+GZIP_JSON = "gzip-json"
+ZSTD_JSON = "zstd-json"
+# Bumped when the blob layout of any codec changes
+CODEC_VERSION = 1
+
+CACHE_CODEC = os.getenv("CACHE_CODEC", "gzip").lower()
+CACHE_GZIP_LEVEL = int(os.getenv("CACHE_GZIP_LEVEL", "6"))
+CACHE_ZSTD_LEVEL = int(os.getenv("CACHE_ZSTD_LEVEL", "3"))
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+_CODEC_NAMES = {
+    "gzip": GZIP_JSON,
+    GZIP_JSON: GZIP_JSON,
+    "zstd": ZSTD_JSON,
+    ZSTD_JSON: ZSTD_JSON,
+}
+
+
+def resolve_codec(codec: Optional[str] = None) -> str:
+    """Return the codec to write with.
+
+    Args:
+        codec: "gzip", "zstd" or a full codec name (default: CACHE_CODEC)
+
+    Returns:
+        GZIP_JSON or ZSTD_JSON; zstd falls back to gzip if zstandard is not
+        installed
+    """
+    requested = codec or CACHE_CODEC
+    name = _CODEC_NAMES.get(requested)
+    if name is None:
+        logger.warning(f"Unknown cache codec, using gzip (codec={requested})")
+        return GZIP_JSON
+    if name == ZSTD_JSON and zstandard is None:
+        logger.warning("zstandard is not installed, using gzip for cache blobs")
+        return GZIP_JSON
+    return name
+
+
+def codec_metadata(codec: str) -> Dict[str, Any]:
+    """Metadata fields describing blobs written with codec."""
+    return {"codec": codec, "codec_version": CODEC_VERSION}
+
+
+def dumps_json(obj: Any) -> bytes:
+    """Serialize obj to JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj).encode("utf-8")
+
+
+def loads_json(data: Union[str, bytes]) -> Any:
+    """Parse JSON (orjson when installed), accepting NaN from older entries."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity written by json.dumps in older entries
+            pass
+    return json.loads(data)
+
+
+def compress_blob(data: bytes, codec: Optional[str] = None) -> bytes:
+    """Compress serialized JSON with codec (default: CACHE_CODEC)."""
+    if resolve_codec(codec) == ZSTD_JSON:
+        return zstandard.ZstdCompressor(level=CACHE_ZSTD_LEVEL).compress(data)
+    return gzip.compress(data, compresslevel=CACHE_GZIP_LEVEL)
+
+
+def encode_blob(obj: Any, codec: Optional[str] = None) -> bytes:
+    """Serialize and compress obj.
+
+    Args:
+        obj: JSON-serializable value
+        codec: Codec to use (default: CACHE_CODEC, see resolve_codec)
+
+    Returns:
+        Compressed bytes
+    """
+    return compress_blob(dumps_json(obj), codec)
+
+
+def decode_blob(data: bytes) -> Any:
+    """Decompress and parse a blob written by encode_blob, in either codec.
+
+    Raises:
+        ValueError: If the codec is not recognized or zstandard is needed but
+            not installed
+    """
+    if data[:2] == _GZIP_MAGIC:
+        return loads_json(gzip.decompress(data))
+    if data[:4] == _ZSTD_MAGIC:
+        if zstandard is None:
+            raise ValueError("Cache blob is zstd-compressed but zstandard is missing")
+        return loads_json(zstandard.ZstdDecompressor().decompress(data))
+    raise ValueError("Unrecognized cache blob format")
@@ -0,0 +1,149 @@
+"""
+Incremental decoding of large top-level JSON objects.
+
+Sleeper's /players/nfl dump is a single object mapping ~11k player IDs to
+player records, most of which the cache build throws away. Reading it with
+response.json() holds the raw body, the decoded text and every player dict
+in memory at once. JSONObjectStream decodes one member at a time from text
+chunks as they arrive, so a caller can keep only what it needs and the rest
+is freed immediately:
+
+    stream = JSONObjectStream()
+    async for chunk in response.aiter_text():
+        for player_id, player in stream.feed(chunk):
+            ...
+    stream.close()
+
+Uses only the standard library json decoder.
+"""
+
+import json
+import re
+from typing import Any, List, Tuple
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Characters that can end a top-level member's number
+_NUMBER_DELIMITERS = frozenset(" \t\n\r,}")
+
+# Parser states
+_START = 0  # before the opening brace
+_FIRST = 1  # after "{": first member or "}"
+_NEXT = 2  # after a member: "," or "}"
+_DONE = 3  # after the closing brace
+
+
+class JSONObjectStream:
+    """Decode the (key, value) members of one JSON object from text chunks."""
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._state = _START
+
+    def feed(self, text: str) -> List[Tuple[str, Any]]:
+        """Add a chunk of text and return the members it completed.
+
+        Raises:
+            ValueError: If the text is not a JSON object
+        """
+        self._buffer += text
+        members, pos = self._parse(final=False)
+        self._buffer = self._buffer[pos:]
+        return members
+
+    def close(self) -> List[Tuple[str, Any]]:
+        """Finish the stream and return any remaining members.
+
+        Raises:
+            ValueError: If the object is incomplete or followed by other data
+        """
+        members, pos = self._parse(final=True)
+        self._buffer = self._buffer[pos:]
+        if self._state != _DONE:
+            raise ValueError("Incomplete JSON object")
+        return members
+
+    def _skip(self, pos: int) -> int:
+        return _WHITESPACE.match(self._buffer, pos).end()
+
+    def _parse(self, final: bool) -> Tuple[List[Tuple[str, Any]], int]:
+        """Parse as many members as the buffer holds.
+
+        Returns:
+            (members, position of the first unconsumed character)
+        """
+        buffer = self._buffer
+        members = []
+        pos = 0
+        while True:
+            pos = self._skip(pos)
+            if pos == len(buffer):
+                return members, pos
+
+            char = buffer[pos]
+            if self._state == _DONE:
+                raise ValueError(f"Extra data after JSON object at {pos}")
+            if self._state == _START:
+                if char != "{":
+                    raise ValueError(f"Expected a JSON object, got {char!r}")
+                self._state = _FIRST
+                pos += 1
+                continue
+            if char == "}":
+                self._state = _DONE
+                pos += 1
+                continue
+            if self._state == _NEXT:
+                if char != ",":
+                    raise ValueError(f"Expected ',' or '}}' at {pos}, got {char!r}")
+                start = pos + 1
+            else:
+                start = pos
+
+            member = self._member(start, final)
+            if member is None:
+                # Wait for the rest of the member
+                return members, pos
+            key, value, pos = member
+            members.append((key, value))
+            self._state = _NEXT
+
+    def _member(self, pos: int, final: bool) -> Any:
+        """Decode `"key": value` at pos.
+
+        Returns:
+            (key, value, end position), or None if the buffer ends inside the
+            member (or right after it, since a number could still be growing)
+
+        Raises:
+            ValueError: If the member is malformed
+        """
+        buffer = self._buffer
+        try:
+            pos = self._skip(pos)
+            key, pos = self._decoder.raw_decode(buffer, pos)
+            if not isinstance(key, str):
+                raise ValueError(f"Expected a string key, got {key!r}")
+            pos = self._skip(pos)
+            if pos == len(buffer):
+                raise json.JSONDecodeError("Expecting ':'", buffer, pos)
+            if buffer[pos] != ":":
+                raise ValueError(f"Expected ':' at {pos}, got {buffer[pos]!r}")
+            value, pos = self._decoder.raw_decode(buffer, self._skip(pos + 1))
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return None
+
+        if not final:
+            if self._skip(pos) == len(buffer):
+                return None
+            # raw_decode stops a number before a dangling "." or "e", so a
+            # number is only complete once a delimiter follows it
+            if (
+                isinstance(value, (int, float))
+                and not isinstance(value, bool)
+                and buffer[pos] not in _NUMBER_DELIMITERS
+            ):
+                return None
+        return key, value, pos
@@ -16,6 +16,9 @@ from lib.enrichment import (
     enrich_player_injury_news,
     enrich_player_full,
     enrich_player_minimal,
+    enrich_players_full,
+    collect_transaction_player_ids,
+    enrich_transaction_moves,
     get_trending_data_map,
     get_recent_drops_set,
     add_trending_data,
@@ -48,6 +51,9 @@ __all__ = [
     "enrich_player_injury_news",
     "enrich_player_full",
     "enrich_player_minimal",
+    "enrich_players_full",
+    "collect_transaction_player_ids",
+    "enrich_transaction_moves",
     "get_trending_data_map",
     "get_recent_drops_set",
     "add_trending_data",
@@ -0,0 +1,166 @@
+"""Background warm-up and periodic refresh of the player cache.
+
+The HTTP server used to wait for build_cache.py to finish before binding its
+port. Instead, the server now starts immediately and this module warms the
+cache in a background task:
+
+1. If the Redis cache is already fresh, the server is ready at once.
+2. Otherwise the on-disk backup (fantasy_relevant_players_backup.json) is
+   loaded so tools can answer from it while the cache is rebuilt.
+3. The rebuild runs in a worker thread; readers switch to Redis once it lands.
+
+An optional refresher rebuilds the cache on an interval so it never expires
+under load. Readiness is reported by get_warmup_status() (used by the
+health_check tool and the /health route).
+
+Configuration (environment variables):
+- CACHE_WARMUP_ENABLED: warm the cache on HTTP server start (default: true)
+- ENABLE_BACKGROUND_REFRESH: run the periodic refresher (default: false)
+- CACHE_REFRESH_INTERVAL_HOURS: hours between refreshes (default: 5)
+"""
+
+import asyncio
+import logging
+import os
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from cache_client import (
+    CACHE_MAX_AGE_HOURS,
+    get_cache_status_async,
+    load_backup_players,
+    rebuild_players_cache,
+)
+
+logger = logging.getLogger(__name__)
+
+CACHE_WARMUP_ENABLED = os.getenv("CACHE_WARMUP_ENABLED", "true").lower() == "true"
+ENABLE_BACKGROUND_REFRESH = (
+    os.getenv("ENABLE_BACKGROUND_REFRESH", "false").lower() == "true"
+)
+CACHE_REFRESH_INTERVAL_HOURS = float(os.getenv("CACHE_REFRESH_INTERVAL_HOURS", "5"))
+
+# Warm-up progress: idle -> warming -> ready | failed
+_warmup: Dict[str, Any] = {
+    "status": "idle",
+    "serving_backup": False,
+    "backup_players": 0,
+    "started_at": None,
+    "ready_at": None,
+    "last_refresh": None,
+    "last_error": None,
+    "tasks": [],
+}
+
+
+def _now() -> str:
+    """Current local time as an ISO string."""
+    return datetime.now().isoformat()
+
+
+async def _cache_is_fresh() -> bool:
+    """Return True if Redis already holds a cache younger than CACHE_MAX_AGE_HOURS."""
+    status = await get_cache_status_async()
+    age_hours = status.get("age_hours")
+    return age_hours is not None and age_hours < CACHE_MAX_AGE_HOURS
+
+
+async def _rebuild(reason: str) -> bool:
+    """Rebuild the cache and record the outcome."""
+    logger.info(f"Rebuilding player cache (reason={reason})")
+    try:
+        success = await rebuild_players_cache()
+    except Exception as e:
+        success = False
+        _warmup["last_error"] = f"{type(e).__name__}: {e}"
+    else:
+        if not success:
+            _warmup["last_error"] = "cache_players failed"
+
+    if success:
+        _warmup["last_refresh"] = _now()
+        _warmup["last_error"] = None
+        _warmup["serving_backup"] = False
+    else:
+        logger.error(
+            f"Player cache rebuild failed (reason={reason}, error={_warmup['last_error']})"
+        )
+    return success
+
+
+async def warm_player_cache() -> bool:
+    """Make the player cache ready, serving the backup while it is rebuilt.
+
+    Returns:
+        True if the cache is ready
+    """
+    _warmup["status"] = "warming"
+    _warmup["started_at"] = _now()
+
+    if await _cache_is_fresh():
+        logger.info("Player cache already fresh, skipping warm-up rebuild")
+        success = True
+    else:
+        backup_players = await asyncio.to_thread(load_backup_players)
+        _warmup["backup_players"] = backup_players
+        _warmup["serving_backup"] = backup_players > 0
+        success = await _rebuild("warm-up")
+
+    _warmup["status"] = "ready" if success else "failed"
+    if success:
+        _warmup["ready_at"] = _now()
+    return success
+
+
+async def refresh_player_cache_periodically(interval_hours: float) -> None:
+    """Rebuild the player cache every interval_hours until cancelled."""
+    while True:
+        await asyncio.sleep(interval_hours * 3600)
+        if await _rebuild("periodic") and _warmup["status"] == "failed":
+            _warmup["status"] = "ready"
+            _warmup["ready_at"] = _now()
+
+
+def start_cache_warmup(periodic_refresh: Optional[bool] = None) -> None:
+    """Start the warm-up (and optionally the refresher) as background tasks.
+
+    Args:
+        periodic_refresh: Run the periodic refresher (default:
+            ENABLE_BACKGROUND_REFRESH)
+    """
+    if periodic_refresh is None:
+        periodic_refresh = ENABLE_BACKGROUND_REFRESH
+
+    tasks = [asyncio.create_task(warm_player_cache())]
+    if periodic_refresh:
+        tasks.append(
+            asyncio.create_task(
+                refresh_player_cache_periodically(CACHE_REFRESH_INTERVAL_HOURS)
+            )
+        )
+        logger.info(
+            f"Background cache refresh enabled (interval_hours={CACHE_REFRESH_INTERVAL_HOURS})"
+        )
+    _warmup["tasks"] = tasks
+
+
+async def stop_cache_warmup() -> None:
+    """Cancel the warm-up and refresher tasks."""
+    tasks = _warmup["tasks"]
+    _warmup["tasks"] = []
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def get_warmup_status() -> Dict[str, Any]:
+    """Return warm-up progress for health checks.
+
+    "ready" is True once the cache is fresh, or while the backup is being
+    served (tools can answer, just from older data). Before warm-up runs
+    (stdio mode or CACHE_WARMUP_ENABLED=false) the status is "idle" and
+    readers build the cache on demand, as before.
+    """
+    status = {k: v for k, v in _warmup.items() if k != "tasks"}
+    status["ready"] = status["status"] in ("ready", "idle") or status["serving_backup"]
+    return status
@@ -8,6 +8,8 @@ import logging
 from functools import wraps
 import logfire
 
+from lib.request_context import request_context
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,6 +22,7 @@ def log_mcp_tool(func):
     - Handles errors defensively
     - Serializes parameters safely (with truncation)
     - Logs success/failure with context
+    - Runs the tool in a request context so nested tool calls share fetches
 
     The decorator is designed to be defensive - if any logging operation fails,
     the tool execution continues without disruption.
@@ -31,6 +34,11 @@ def log_mcp_tool(func):
         Wrapped async function with logging
     """
 
+    async def call_in_request_context(*args, **kwargs):
+        # Tools called through .fn from inside this one reuse the same memo
+        with request_context():
+            return await func(*args, **kwargs)
+
     @wraps(func)
     async def wrapper(*args, **kwargs):
         tool_name = func.__name__
@@ -66,7 +74,7 @@ def log_mcp_tool(func):
             )
             # Execute function without span tracking
             try:
-                result = await func(*args, **kwargs)
+                result = await call_in_request_context(*args, **kwargs)
                 logger.info(f"MCP Tool Called (no span): {tool_name}")
                 return result
             except Exception as func_error:
@@ -83,7 +91,7 @@ def log_mcp_tool(func):
                 logger.info(f"MCP Tool Called: {tool_name} with params: {params}")
 
                 # Execute the actual function
-                result = await func(*args, **kwargs)
+                result = await call_in_request_context(*args, **kwargs)
 
                 # Check if result indicates an error
                 if isinstance(result, dict) and "error" in result:
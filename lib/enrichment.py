@@ -13,7 +13,7 @@ All enrichment functions are designed to:
 """
 
 import logging
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, Iterable, List, Optional, Set
 
 logger = logging.getLogger(__name__)
 
@@ -275,6 +275,76 @@ def enrich_player_minimal(
     return minimal_data
 
 
+def enrich_players_full(
+    player_ids: Iterable[str],
+    players: Dict[str, Any],
+    include_position_stats: bool = True,
+    max_news: int = 3,
+) -> List[Dict[str, Any]]:
+    """Fully enrich several players from one batched cache lookup.
+
+    Args:
+        player_ids: Sleeper player IDs, in output order (empty IDs skipped)
+        players: Player data keyed by Sleeper ID, e.g. from get_players_by_ids
+        include_position_stats: Whether to include position-specific ROS stats
+        max_news: Maximum number of news items to include
+
+    Returns:
+        List of fully enriched player dicts (missing players get basic info only)
+    """
+    return [
+        enrich_player_full(
+            player_id, players.get(player_id, {}), include_position_stats, max_news
+        )
+        for player_id in player_ids
+        if player_id
+    ]
+
+
+def collect_transaction_player_ids(transactions: List[Dict[str, Any]]) -> Set[str]:
+    """Return every player ID added or dropped in a list of transactions.
+
+    Args:
+        transactions: Sleeper transaction dicts with optional adds/drops
+
+    Returns:
+        Set of player IDs, for a single get_players_by_ids lookup
+    """
+    return {
+        player_id
+        for txn in transactions
+        for action in ("adds", "drops")
+        for player_id in (txn.get(action) or {})
+    }
+
+
+def enrich_transaction_moves(
+    moves: Optional[Dict[str, Any]], players: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """Replace a transaction's {player_id: roster_id} adds/drops with player info.
+
+    Args:
+        moves: The transaction's adds or drops mapping
+        players: Player data keyed by Sleeper ID, e.g. from get_players_by_ids
+
+    Returns:
+        Dict of player_id -> roster_id, player_name, team and position
+    """
+    if not moves:
+        return moves
+
+    enriched = {}
+    for player_id, roster_id in moves.items():
+        player_data = players.get(player_id)
+        enriched[player_id] = {
+            "roster_id": roster_id,
+            "player_name": player_data.get("full_name") if player_data else "Unknown",
+            "team": player_data.get("team") if player_data else None,
+            "position": player_data.get("position") if player_data else None,
+        }
+    return enriched
+
+
 async def get_trending_data_map(
     get_trending_fn, txn_type: str = "add"
 ) -> Dict[str, int]:
@@ -0,0 +1,303 @@
+"""Materialized free-agent pool for waiver wire queries.
+
+get_waiver_wire_players used to walk every cached player on every call,
+build a minimal dict for each, merge trending data and sort the lot just to
+return a page of results. The pool does that work once per change instead:
+
+- Every cached player is ranked once per player cache version by the
+  static part of the relevance key (active first, projected points, name).
+  The ranking does not depend on the league, so all leagues served by the
+  process share it. A spot refresh derives a new player map that replaces a
+  few players (LazyPlayers.with_updates); the ranking is carried forward by
+  re-ranking only those players.
+- A league's pool drops its rostered players from the ranking and
+  partitions the rest by position. Pools are kept per rostered set (up to
+  MAX_LEAGUE_POOLS), so they are rebuilt only after a roster move.
+- A query is a slice of one partition plus light filtering. The few players
+  boosted by per-call data (recently dropped, trending adds) are looked up by
+  ID and merged with the head of the slice.
+
+Concurrent queries after a cache change share one ranking, which runs in a
+worker thread.
+"""
+
+import asyncio
+import heapq
+import logging
+from collections import OrderedDict
+from itertools import islice
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from lib.enrichment import enrich_player_minimal
+
+logger = logging.getLogger(__name__)
+
+# Partition holding every available player
+ALL_POSITIONS = "ALL"
+
+# Pools kept for different rostered sets, i.e. leagues served by the process
+MAX_LEAGUE_POOLS = 16
+
+# Ranked entries and the player map they were built from, the ranking in
+# flight with its player map, and pools for that ranking keyed by rostered
+# set (least recently used first)
+_pool: Dict[str, Any] = {
+    "ranked": None,
+    "players": None,
+    "task": None,
+    "task_players": None,
+    "pools": OrderedDict(),
+}
+
+
+def clear_free_agent_pool() -> None:
+    """Forget the ranking and pools so the next query rebuilds them."""
+    _pool["ranked"] = None
+    _pool["players"] = None
+    _pool["task"] = None
+    _pool["task_players"] = None
+    _pool["pools"] = OrderedDict()
+
+
+def _static_rank(minimal: Dict[str, Any]) -> Tuple[int, float, str]:
+    """Per-player part of the waiver relevance key: active, projection, name."""
+    status_priority = 0 if minimal.get("status") == "Active" else 1
+    try:
+        projected = -float(minimal.get("projected_points") or 0)
+    except (ValueError, TypeError):
+        projected = 0.0
+    return (status_priority, projected, minimal.get("full_name") or "")
+
+
+def relevance_key(
+    entry: Dict[str, Any], trending_map: Dict[str, int], recent_drops: Set[str]
+) -> Tuple[int, int, int, float, str]:
+    """Full waiver relevance key for a pool entry.
+
+    Priority: 1) recently dropped, 2) active status, 3) trending adds,
+    4) projected points, 5) name.
+    """
+    player_id = entry["player_id"]
+    status_priority, projected, name = entry["rank"]
+    return (
+        0 if player_id in recent_drops else 1,
+        status_priority,
+        -trending_map.get(player_id, 0),
+        projected,
+        name,
+    )
+
+
+def rank_players(players: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Build pool entries for every player, sorted by static rank.
+
+    Each entry holds the player_id, the lowercased search name, the minimal
+    player dict and its static rank.
+    """
+    entries = []
+    for player_id, player_data in players.items():
+        minimal = enrich_player_minimal(player_id, player_data)
+        search_name = (
+            player_data.get("full_name", "")
+            or f"{player_data.get('first_name', '')} {player_data.get('last_name', '')}"
+        ).lower()
+        entries.append(
+            {
+                "player_id": player_id,
+                "position": player_data.get("position"),
+                "search_name": search_name,
+                "minimal": minimal,
+                "rank": _static_rank(minimal),
+            }
+        )
+
+    entries.sort(key=lambda entry: entry["rank"])
+    return entries
+
+
+def rerank_players(
+    ranked: List[Dict[str, Any]],
+    players: Dict[str, Any],
+    player_ids: Iterable[str],
+) -> List[Dict[str, Any]]:
+    """Carry a ranking forward to a player map where only player_ids changed.
+
+    Only those players are decoded and ranked again; everyone else keeps
+    their entry.
+    """
+    player_ids = set(player_ids)
+    kept = [entry for entry in ranked if entry["player_id"] not in player_ids]
+    changed = rank_players({pid: players[pid] for pid in player_ids if pid in players})
+    return list(heapq.merge(kept, changed, key=lambda entry: entry["rank"]))
+
+
+def _changed_since_ranking(players: Dict[str, Any]) -> Optional[FrozenSet[str]]:
+    """Players that may differ from the ranked map, if both share a lineage."""
+    ranked_players = _pool["players"]
+    lineage = getattr(players, "lineage", None)
+    if (
+        _pool["ranked"] is None
+        or lineage is None
+        or getattr(ranked_players, "lineage", None) is not lineage
+    ):
+        return None
+    return ranked_players.updated_ids | players.updated_ids
+
+
+def build_free_agent_pool(
+    players: Dict[str, Any],
+    rostered: Set[str],
+    ranked: Optional[List[Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """Build the position-partitioned, pre-sorted pool of unrostered players.
+
+    Args:
+        players: All cached players keyed by Sleeper ID
+        rostered: Sleeper IDs on any league roster
+        ranked: rank_players(players), if already built
+
+    Returns:
+        Dict with "partitions" (position -> sorted entries, plus ALL_POSITIONS)
+        and "by_id" (Sleeper ID -> entry)
+    """
+    if ranked is None:
+        ranked = rank_players(players)
+    entries = [entry for entry in ranked if entry["player_id"] not in rostered]
+
+    partitions: Dict[str, List[Dict[str, Any]]] = {ALL_POSITIONS: entries}
+    for entry in entries:
+        if entry["position"]:
+            partitions.setdefault(entry["position"], []).append(entry)
+
+    return {
+        "partitions": partitions,
+        "by_id": {entry["player_id"]: entry for entry in entries},
+    }
+
+
+async def _get_ranked(players: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Return the ranking for this player map, sharing one build per change."""
+    if _pool["ranked"] is not None and _pool["players"] is players:
+        return _pool["ranked"]
+
+    changed = _changed_since_ranking(players)
+    if changed is not None:
+        ranked = rerank_players(_pool["ranked"], players, changed)
+        _pool["ranked"] = ranked
+        _pool["players"] = players
+        _pool["pools"] = OrderedDict()
+        logger.info(
+            f"Re-ranked updated free agent pool players (players={len(ranked)}, updated={len(changed)})"
+        )
+        return ranked
+
+    task = _pool["task"]
+    if (
+        task is None
+        or task.done()
+        or task.get_loop() is not asyncio.get_running_loop()
+        or _pool["task_players"] is not players
+    ):
+        task = asyncio.create_task(asyncio.to_thread(rank_players, players))
+        _pool["task"] = task
+        _pool["task_players"] = players
+
+    ranked = await asyncio.shield(task)
+    if _pool["task"] is task and _pool["players"] is not players:
+        _pool["ranked"] = ranked
+        _pool["players"] = players
+        _pool["pools"] = OrderedDict()
+        logger.info(f"Ranked free agent pool players (players={len(ranked)})")
+    return ranked
+
+
+async def get_free_agent_pool(
+    players: Dict[str, Any], rostered: Set[str]
+) -> Dict[str, Any]:
+    """Return the pool for this player map and rostered set, rebuilding on change.
+
+    The player cache hands out the same mapping until its version changes, so
+    the ranking is reused while the mapping matches, and a league's pool while
+    its rostered set matches too. A mapping derived from the ranked one by a
+    spot refresh only has its updated players re-ranked.
+
+    Args:
+        players: All cached players keyed by Sleeper ID
+        rostered: Sleeper IDs on any league roster
+
+    Returns:
+        Pool as returned by build_free_agent_pool
+    """
+    rostered_key: FrozenSet[str] = frozenset(rostered)
+    ranked = await _get_ranked(players)
+    current = _pool["players"] is players
+    pools = _pool["pools"]
+
+    if current and rostered_key in pools:
+        pools.move_to_end(rostered_key)
+        return pools[rostered_key]
+
+    pool = build_free_agent_pool(players, rostered_key, ranked)
+    if current:
+        pools[rostered_key] = pool
+        while len(pools) > MAX_LEAGUE_POOLS:
+            pools.popitem(last=False)
+        logger.info(
+            f"Built free agent pool (available={len(pool['by_id'])}, rostered={len(rostered_key)})"
+        )
+    return pool
+
+
+def query_free_agent_pool(
+    pool: Dict[str, Any],
+    position: Optional[str] = None,
+    search_term: Optional[str] = None,
+    limit: int = 50,
+    trending_map: Optional[Dict[str, int]] = None,
+    recent_drops: Optional[Set[str]] = None,
+) -> Tuple[int, List[Dict[str, Any]]]:
+    """Return the most relevant available players matching the filters.
+
+    Args:
+        pool: Pool as returned by build_free_agent_pool
+        position: Only this position (already validated and uppercased)
+        search_term: Case-insensitive substring of the player's name
+        limit: Maximum number of entries to return
+        trending_map: player_id -> trending add count
+        recent_drops: Sleeper IDs dropped recently
+
+    Returns:
+        (total matching players, up to limit pool entries in relevance order)
+    """
+    trending_map = trending_map or {}
+    recent_drops = recent_drops or set()
+    candidates = pool["partitions"].get(position or ALL_POSITIONS, [])
+    term = search_term.lower() if search_term else None
+
+    def matches(entry: Dict[str, Any]) -> bool:
+        if position and entry["position"] != position:
+            return False
+        return term is None or term in entry["search_name"]
+
+    if term is not None:
+        candidates = [entry for entry in candidates if term in entry["search_name"]]
+
+    # Players whose rank depends on per-call data, found by ID
+    boosted_ids = set(trending_map) | recent_drops
+    boosted = [
+        pool["by_id"][player_id]
+        for player_id in boosted_ids
+        if player_id in pool["by_id"] and matches(pool["by_id"][player_id])
+    ]
+
+    # Everyone else is already in relevance order, so only the head is needed
+    head = islice(
+        (entry for entry in candidates if entry["player_id"] not in boosted_ids),
+        limit,
+    )
+
+    ranked = sorted(
+        [*boosted, *head],
+        key=lambda entry: relevance_key(entry, trending_map, recent_drops),
+    )
+    return len(candidates), ranked[:limit]
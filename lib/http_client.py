@@ -0,0 +1,99 @@
+"""Shared pooled HTTP clients for upstream APIs.
+
+Tools and helpers used to open a new ``httpx.AsyncClient`` per request, which
+threw away keep-alive connections and TLS sessions on every call. This module
+keeps one long-lived client per upstream (Sleeper, Fantasy Nerds) so requests
+reuse warm connections.
+
+Clients are tied to the event loop they were created on, so one set is kept
+per loop. The server lifespan closes them on shutdown via close_http_clients().
+
+Configuration (environment variables):
+- HTTP_MAX_CONNECTIONS: max open connections per upstream (default: 20)
+- HTTP_MAX_KEEPALIVE_CONNECTIONS: idle connections kept per upstream (default: 10)
+- HTTP_KEEPALIVE_EXPIRY: seconds an idle connection is kept (default: 30)
+- HTTP_TIMEOUT: default request timeout in seconds (default: 10)
+- HTTP_CONNECT_TIMEOUT: connect timeout in seconds (default: 5)
+- HTTP2_ENABLED: use HTTP/2 when the h2 package is installed (default: true)
+"""
+
+import asyncio
+import logging
+import os
+import weakref
+from typing import Dict
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+SLEEPER = "sleeper"
+FANTASY_NERDS = "fantasy_nerds"
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# One client per upstream, per event loop
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, httpx.AsyncClient]]" = weakref.WeakKeyDictionary()
+
+
+def _http2_enabled() -> bool:
+    """Return True if HTTP/2 is requested and the h2 package is installed."""
+    requested = os.getenv("HTTP2_ENABLED", "true").lower() == "true"
+    return requested and HTTP2_AVAILABLE
+
+
+def _create_client() -> httpx.AsyncClient:
+    """Create a pooled client using the configured limits and timeouts."""
+    limits = httpx.Limits(
+        max_connections=int(os.getenv("HTTP_MAX_CONNECTIONS", "20")),
+        max_keepalive_connections=int(
+            os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "10")
+        ),
+        keepalive_expiry=float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30")),
+    )
+    timeout = httpx.Timeout(
+        float(os.getenv("HTTP_TIMEOUT", "10")),
+        connect=float(os.getenv("HTTP_CONNECT_TIMEOUT", "5")),
+    )
+    return httpx.AsyncClient(limits=limits, timeout=timeout, http2=_http2_enabled())
+
+
+def get_http_client(upstream: str = SLEEPER) -> httpx.AsyncClient:
+    """Get the shared HTTP client for an upstream API.
+
+    Do not use the returned client as a context manager - it stays open for
+    the life of the event loop and is closed by close_http_clients().
+
+    Args:
+        upstream: Upstream name (SLEEPER or FANTASY_NERDS)
+
+    Returns:
+        Pooled httpx.AsyncClient for the running event loop
+    """
+    loop = asyncio.get_running_loop()
+    clients = _clients.setdefault(loop, {})
+    client = clients.get(upstream)
+    if client is None or client.is_closed:
+        client = _create_client()
+        clients[upstream] = client
+        logger.debug(
+            f"Created pooled HTTP client (upstream={upstream}, http2={_http2_enabled()})"
+        )
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close all shared HTTP clients for the running event loop."""
+    clients = _clients.pop(asyncio.get_running_loop(), {})
+    for upstream, client in clients.items():
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning(
+                f"Error closing HTTP client (upstream={upstream}, error_type={type(e).__name__}, error_message={str(e)})"
+            )
@@ -0,0 +1,74 @@
+"""League selection for the current connection.
+
+The server used to be bound to a single league through SLEEPER_LEAGUE_ID, so
+serving several leagues meant running several servers, each with its own
+copy of the NFL player cache. A client can now pick its league with a
+league_id query parameter on the connection URL, the same way api_key
+selects the Token Bowl Chat account:
+
+    https://tokenbowl-mcp.example.com/sse?league_id=1266471057523490816
+
+LeagueMiddleware in sleeper_mcp stores it with use_league() and tools read
+current_league_id(), which falls back to SLEEPER_LEAGUE_ID. League data
+(Sleeper responses, league state, the transaction log and free-agent pools)
+is keyed by league ID, while the NFL player cache is shared by every league
+the process serves.
+
+Configuration (environment variables):
+- SLEEPER_LEAGUE_ID: league used when the connection does not pick one
+  (default: 1266471057523490816)
+- SLEEPER_ALLOWED_LEAGUE_IDS: comma-separated league IDs clients may select
+  (default: any)
+"""
+
+import os
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import FrozenSet, Iterator, Optional
+
+DEFAULT_LEAGUE_ID = os.environ.get("SLEEPER_LEAGUE_ID", "1266471057523490816")
+ALLOWED_LEAGUE_IDS: FrozenSet[str] = frozenset(
+    league_id.strip()
+    for league_id in os.getenv("SLEEPER_ALLOWED_LEAGUE_IDS", "").split(",")
+    if league_id.strip()
+)
+
+# Sleeper league IDs are numeric snowflakes
+_LEAGUE_ID_PATTERN = re.compile(r"^\d{1,32}$")
+
+_league_id: ContextVar[Optional[str]] = ContextVar("league_id", default=None)
+
+
+def validate_league_id(league_id: str) -> str:
+    """Check a client-supplied league ID.
+
+    Raises:
+        ValueError: If the ID is not a Sleeper league ID or is not in
+            SLEEPER_ALLOWED_LEAGUE_IDS
+    """
+    league_id = league_id.strip()
+    if not _LEAGUE_ID_PATTERN.match(league_id):
+        raise ValueError(f"Invalid league_id: {league_id!r}")
+    if ALLOWED_LEAGUE_IDS and league_id not in ALLOWED_LEAGUE_IDS:
+        raise ValueError(f"league_id {league_id} is not served by this server")
+    return league_id
+
+
+def current_league_id() -> str:
+    """League for the current connection, or SLEEPER_LEAGUE_ID."""
+    return _league_id.get() or DEFAULT_LEAGUE_ID
+
+
+@contextmanager
+def use_league(league_id: str) -> Iterator[str]:
+    """Serve league_id for the duration of the block.
+
+    Raises:
+        ValueError: If league_id fails validate_league_id
+    """
+    token = _league_id.set(validate_league_id(league_id))
+    try:
+        yield _league_id.get()
+    finally:
+        _league_id.reset(token)
@@ -0,0 +1,133 @@
+"""Shared roster-ownership index for the league.
+
+get_waiver_wire_players, get_waiver_analysis, fetch_roster_with_enrichment
+and the trade proposal script each fetched the league rosters and rebuilt
+"which players are rostered, and by whom" from scratch. This module keeps
+that index in one place:
+
+- owners: player_id -> roster_id for every rostered player
+- rostered: the set of all rostered player IDs
+- starters: roster_id -> set of starting player IDs
+- position_counts: roster_id -> {position: count}
+
+Rosters are read through fetch_sleeper_json, so freshness follows the
+rosters entry in ENDPOINT_TTLS. The index is rebuilt only when the rosters
+response actually changes. Concurrent callers share one rebuild.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from cache_client import get_players_by_ids_async
+from lib.sleeper_cache import fetch_sleeper_json
+
+logger = logging.getLogger(__name__)
+
+# league_id -> current state, and the rebuild in flight with its rosters
+_states: Dict[str, Dict[str, Any]] = {}
+_rebuilds: Dict[str, Tuple["asyncio.Task[Dict[str, Any]]", List[Dict[str, Any]]]] = {}
+
+
+def clear_league_state() -> None:
+    """Forget every league's state so the next read rebuilds it."""
+    _states.clear()
+    _rebuilds.clear()
+
+
+def _player_ids(value: Optional[List[str]]) -> List[str]:
+    """Roster player list without empty slots (Sleeper uses "0" or None)."""
+    return [player_id for player_id in value or [] if player_id and player_id != "0"]
+
+
+def build_league_state(
+    league_id: str, rosters: List[Dict[str, Any]], players: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Build the ownership index for a rosters response.
+
+    Args:
+        league_id: The Sleeper league ID
+        rosters: Response of /league/{league_id}/rosters
+        players: Cached player data for the rostered players (for positions)
+
+    Returns:
+        Dict with league_id, rosters (roster_id -> roster), roster_list (the
+        response as returned), owners, rostered, starters and position_counts
+    """
+    owners: Dict[str, int] = {}
+    starters: Dict[int, frozenset] = {}
+    position_counts: Dict[int, Dict[str, int]] = {}
+
+    for roster in rosters:
+        roster_id = roster.get("roster_id")
+        counts: Dict[str, int] = {}
+        for player_id in _player_ids(roster.get("players")):
+            owners[player_id] = roster_id
+            position = (players.get(player_id) or {}).get("position")
+            if position:
+                counts[position] = counts.get(position, 0) + 1
+        starters[roster_id] = frozenset(_player_ids(roster.get("starters")))
+        position_counts[roster_id] = counts
+
+    return {
+        "league_id": league_id,
+        "rosters": {roster.get("roster_id"): roster for roster in rosters},
+        "roster_list": rosters,
+        "owners": owners,
+        "rostered": frozenset(owners),
+        "starters": starters,
+        "position_counts": position_counts,
+    }
+
+
+async def _rebuild(league_id: str, rosters: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Look up rostered players in one batch and build the index."""
+    player_ids = {
+        player_id
+        for roster in rosters
+        for player_id in _player_ids(roster.get("players"))
+    }
+    players = await get_players_by_ids_async(player_ids) or {}
+    state = build_league_state(league_id, rosters, players)
+    logger.info(
+        f"Rebuilt league state (league_id={league_id}, rosters={len(rosters)}, rostered={len(state['rostered'])})"
+    )
+    return state
+
+
+async def get_league_state(
+    client: httpx.AsyncClient, base_url: str, league_id: str
+) -> Dict[str, Any]:
+    """Return the ownership index for a league, rebuilding it if rosters changed.
+
+    Args:
+        client: HTTP client for Sleeper requests
+        base_url: The Sleeper API base URL
+        league_id: The Sleeper league ID
+
+    Returns:
+        League state as returned by build_league_state
+    """
+    rosters = await fetch_sleeper_json(client, f"{base_url}/league/{league_id}/rosters")
+
+    state = _states.get(league_id)
+    if state is not None and state["roster_list"] == rosters:
+        return state
+
+    loop = asyncio.get_running_loop()
+    task, task_rosters = _rebuilds.get(league_id, (None, None))
+    if (
+        task is None
+        or task.done()
+        or task.get_loop() is not loop
+        or task_rosters != rosters
+    ):
+        task = loop.create_task(_rebuild(league_id, rosters))
+        _rebuilds[league_id] = (task, rosters)
+
+    state = await asyncio.shield(task)
+    if _rebuilds.get(league_id, (None,))[0] is task:
+        _states[league_id] = state
+    return state
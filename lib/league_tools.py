@@ -4,19 +4,25 @@ This module contains the business logic for all league-related MCP tools.
 Functions in this module are used by the MCP tool definitions in sleeper_mcp.py.
 """
 
+import asyncio
 import logging
 from datetime import datetime
 from typing import Any, Dict, List
 from zoneinfo import ZoneInfo
 
-import httpx
-
 from cache_client import (
-    get_player_by_id,
-    get_players_from_cache,
+    get_players_by_ids_async,
     spot_refresh_player_stats,
 )
-from lib.enrichment import enrich_player_full, organize_roster_by_position
+from lib.enrichment import (
+    collect_transaction_player_ids,
+    enrich_players_full,
+    enrich_transaction_moves,
+    organize_roster_by_position,
+)
+from lib.http_client import get_http_client
+from lib.league_state import get_league_state
+from lib.sleeper_cache import fetch_sleeper_json
 
 logger = logging.getLogger(__name__)
 
@@ -31,10 +37,7 @@ async def fetch_league_info(league_id: str, base_url: str) -> Dict[str, Any]:
     Returns:
         Dict containing all league configuration and settings
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{base_url}/league/{league_id}")
-        response.raise_for_status()
-        return response.json()
+    return await fetch_sleeper_json(get_http_client(), f"{base_url}/league/{league_id}")
 
 
 async def fetch_league_rosters(league_id: str, base_url: str) -> List[Dict[str, Any]]:
@@ -47,10 +50,9 @@ async def fetch_league_rosters(league_id: str, base_url: str) -> List[Dict[str,
     Returns:
         List of roster dictionaries, one for each team in the league
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{base_url}/league/{league_id}/rosters")
-        response.raise_for_status()
-        return response.json()
+    return await fetch_sleeper_json(
+        get_http_client(), f"{base_url}/league/{league_id}/rosters"
+    )
 
 
 async def fetch_roster_with_enrichment(
@@ -73,34 +75,21 @@ async def fetch_roster_with_enrichment(
         Dict with roster info and enriched player data
     """
     try:
-        # Get all rosters to find the specific one
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{base_url}/league/{league_id}/rosters")
-            response.raise_for_status()
-            rosters = response.json()
+        # Fetch rosters, league users and NFL state concurrently
+        client = get_http_client()
+        league_state, users, state = await asyncio.gather(
+            get_league_state(client, base_url, league_id),
+            fetch_sleeper_json(client, f"{base_url}/league/{league_id}/users"),
+            fetch_sleeper_json(client, f"{base_url}/state/nfl"),
+        )
 
         # Find the specific roster
-        roster = None
-        for r in rosters:
-            if r.get("roster_id") == roster_id:
-                roster = r
-                break
+        roster = league_state["rosters"].get(roster_id)
 
         if not roster:
             return {"error": f"Roster ID {roster_id} not found"}
 
-        # Get all player data from cache (sync function, don't await)
-        all_players = get_players_from_cache(active_only=False)
-        if not all_players:
-            return {"error": "Failed to load player data from cache"}
-
-        # Get league users to find owner name
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{base_url}/league/{league_id}/users")
-            response.raise_for_status()
-            users = response.json()
-
-        # Find owner info
+        # Find owner info from league users
         owner_info = None
         for user in users:
             if user.get("user_id") == roster.get("owner_id"):
@@ -114,12 +103,7 @@ async def fetch_roster_with_enrichment(
                 }
                 break
 
-        # Get current NFL season and week from state
-        async with httpx.AsyncClient() as client:
-            state_response = await client.get(f"{base_url}/state/nfl")
-            state_response.raise_for_status()
-            state = state_response.json()
-
+        # Current NFL season and week from state
         current_season = state.get("season", datetime.now().year)
         current_week = state.get("week", 1)
 
@@ -152,28 +136,23 @@ async def fetch_roster_with_enrichment(
             logger.info(
                 f"Spot refreshing stats for roster players (count={len(player_ids_set)}, roster_id={roster_id})"
             )
-            spot_refresh_player_stats(player_ids_set)
+            await spot_refresh_player_stats(player_ids_set)
+
+        # Load only this roster's players from cache in one batch
+        all_players = await get_players_by_ids_async(player_ids_set)
+        if all_players is None:
+            return {"error": "Failed to load player data from cache"}
 
         # Track totals for meta information
         total_projected = 0.0
         starters_projected = 0.0
 
         # Enrich all players using utility functions
-        enriched_players = []
-        for player_id in all_player_ids:
-            if not player_id:
-                continue
-
-            # Get player data from cache
-            player_data = all_players.get(player_id, {})
-
-            # Use enrichment utility to get fully enriched player data
-            player_info = enrich_player_full(
-                player_id,
-                player_data,
-                include_position_stats=True,
-                max_news=3,
-            )
+        enriched_players = enrich_players_full(
+            all_player_ids, all_players, include_position_stats=True, max_news=3
+        )
+        for player_info in enriched_players:
+            player_id = player_info["player_id"]
 
             # Track projected points for meta info
             if player_info["stats"]["projected"]:
@@ -182,8 +161,6 @@ async def fetch_roster_with_enrichment(
                 if player_id in starters_ids:
                     starters_projected += fantasy_points
 
-            enriched_players.append(player_info)
-
         # Organize players into roster categories using utility function
         categorized = organize_roster_by_position(
             enriched_players, starters_ids, taxi_ids, reserve_ids
@@ -228,10 +205,9 @@ async def fetch_league_users(league_id: str, base_url: str) -> List[Dict[str, An
     Returns:
         List of user dictionaries for all league participants
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{base_url}/league/{league_id}/users")
-        response.raise_for_status()
-        return response.json()
+    return await fetch_sleeper_json(
+        get_http_client(), f"{base_url}/league/{league_id}/users"
+    )
 
 
 async def fetch_league_matchups(
@@ -247,27 +223,27 @@ async def fetch_league_matchups(
     Returns:
         List of matchup dictionaries for the specified week
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{base_url}/league/{league_id}/matchups/{week}")
-        response.raise_for_status()
-        matchups = response.json()
-
-        # Collect all player IDs from matchups for spot refresh
-        all_player_ids = set()
-        for matchup in matchups:
-            if matchup and isinstance(matchup, dict):
-                players = matchup.get("players", [])
-                if players:
-                    all_player_ids.update(filter(None, players))
-
-        # Spot refresh stats for all players in matchups
-        if all_player_ids:
-            logger.info(
-                f"Spot refreshing stats for {len(all_player_ids)} players in week {week} matchups"
-            )
-            spot_refresh_player_stats(all_player_ids)
+    client = get_http_client()
+    response = await client.get(f"{base_url}/league/{league_id}/matchups/{week}")
+    response.raise_for_status()
+    matchups = response.json()
+
+    # Collect all player IDs from matchups for spot refresh
+    all_player_ids = set()
+    for matchup in matchups:
+        if matchup and isinstance(matchup, dict):
+            players = matchup.get("players", [])
+            if players:
+                all_player_ids.update(filter(None, players))
+
+    # Spot refresh stats for all players in matchups
+    if all_player_ids:
+        logger.info(
+            f"Spot refreshing stats for {len(all_player_ids)} players in week {week} matchups"
+        )
+        await spot_refresh_player_stats(all_player_ids)
 
-        return matchups
+    return matchups
 
 
 async def fetch_league_transactions(
@@ -283,44 +259,24 @@ async def fetch_league_transactions(
     Returns:
         List of transaction dictionaries with enriched player data
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{base_url}/league/{league_id}/transactions/{round_num}"
-        )
-        response.raise_for_status()
-        transactions = response.json()
+    client = get_http_client()
+    response = await client.get(
+        f"{base_url}/league/{league_id}/transactions/{round_num}"
+    )
+    response.raise_for_status()
+    transactions = response.json()
+
+    # Resolve every added/dropped player in one lookup
+    players = (
+        await get_players_by_ids_async(collect_transaction_player_ids(transactions))
+        or {}
+    )
 
     # Enrich transactions with player data
     for txn in transactions:
-        # Enrich "adds" with full player data
-        if txn.get("adds"):
-            enriched_adds = {}
-            for player_id, roster_id in txn["adds"].items():
-                player_data = get_player_by_id(player_id)
-                enriched_adds[player_id] = {
-                    "roster_id": roster_id,
-                    "player_name": player_data.get("full_name")
-                    if player_data
-                    else "Unknown",
-                    "team": player_data.get("team") if player_data else None,
-                    "position": player_data.get("position") if player_data else None,
-                }
-            txn["adds"] = enriched_adds
-
-        # Enrich "drops" with full player data
-        if txn.get("drops"):
-            enriched_drops = {}
-            for player_id, roster_id in txn["drops"].items():
-                player_data = get_player_by_id(player_id)
-                enriched_drops[player_id] = {
-                    "roster_id": roster_id,
-                    "player_name": player_data.get("full_name")
-                    if player_data
-                    else "Unknown",
-                    "team": player_data.get("team") if player_data else None,
-                    "position": player_data.get("position") if player_data else None,
-                }
-            txn["drops"] = enriched_drops
+        for action in ("adds", "drops"):
+            if txn.get(action):
+                txn[action] = enrich_transaction_moves(txn[action], players)
 
     return transactions
 
@@ -337,10 +293,10 @@ async def fetch_league_traded_picks(
     Returns:
         List of traded draft pick dictionaries
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{base_url}/league/{league_id}/traded_picks")
-        response.raise_for_status()
-        return response.json()
+    client = get_http_client()
+    response = await client.get(f"{base_url}/league/{league_id}/traded_picks")
+    response.raise_for_status()
+    return response.json()
 
 
 async def fetch_league_drafts(league_id: str, base_url: str) -> List[Dict[str, Any]]:
@@ -353,10 +309,10 @@ async def fetch_league_drafts(league_id: str, base_url: str) -> List[Dict[str, A
     Returns:
         List of draft dictionaries for all league drafts
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{base_url}/league/{league_id}/drafts")
-        response.raise_for_status()
-        return response.json()
+    client = get_http_client()
+    response = await client.get(f"{base_url}/league/{league_id}/drafts")
+    response.raise_for_status()
+    return response.json()
 
 
 async def fetch_league_winners_bracket(
@@ -371,7 +327,7 @@ async def fetch_league_winners_bracket(
     Returns:
         List of playoff matchup dictionaries for the winners bracket
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{base_url}/league/{league_id}/winners_bracket")
-        response.raise_for_status()
-        return response.json()
+    client = get_http_client()
+    response = await client.get(f"{base_url}/league/{league_id}/winners_bracket")
+    response.raise_for_status()
+    return response.json()
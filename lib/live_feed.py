@@ -0,0 +1,225 @@
+"""Server-push live score subscriptions.
+
+Watching games through get_live_scores or get_roster means every client
+polls on its own. A subscription instead registers interest in a league's
+week (optionally one roster) and receives score deltas as they happen:
+
+- The first subscriber to a league and week starts one poller, which
+  refreshes the live scoreboard (see lib.live_scoring) every
+  LIVE_FEED_POLL_SECONDS and publishes each new version's changes to every
+  subscriber. The poller stops when the last subscriber leaves, so N clients
+  cost one upstream fetch loop.
+- Each subscriber gets the current scoreboard first (or the changes since
+  the version it last saw), then deltas filtered to its roster if it asked
+  for one.
+- A subscriber that falls LIVE_FEED_QUEUE_SIZE messages behind has its
+  backlog replaced by one full snapshot instead of slowing the others.
+
+sleeper_mcp serves subscriptions as Server-Sent Events on /live/{week}.
+
+Configuration (environment variables):
+- LIVE_FEED_POLL_SECONDS: seconds between scoreboard refreshes while anyone
+  is subscribed (default: 15)
+- LIVE_FEED_QUEUE_SIZE: messages buffered per subscriber (default: 16)
+- LIVE_FEED_KEEPALIVE_SECONDS: idle seconds before a keep-alive comment is
+  sent on an event stream (default: 15)
+"""
+
+import asyncio
+import json
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+import httpx
+
+from lib.live_scoring import refresh_live_scoreboard, scoreboard_since
+
+logger = logging.getLogger(__name__)
+
+LIVE_FEED_POLL_SECONDS = float(os.getenv("LIVE_FEED_POLL_SECONDS", "15"))
+LIVE_FEED_QUEUE_SIZE = int(os.getenv("LIVE_FEED_QUEUE_SIZE", "16"))
+LIVE_FEED_KEEPALIVE_SECONDS = float(os.getenv("LIVE_FEED_KEEPALIVE_SECONDS", "15"))
+
+# (league_id, week) -> subscribers, the poller task and the last version it
+# published
+_feeds: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+
+def clear_live_feeds() -> None:
+    """Forget all feeds and their subscribers (pollers are left to their loop)."""
+    _feeds.clear()
+
+
+class Subscription:
+    """One subscriber's view of a feed: a message queue and a roster filter."""
+
+    def __init__(self, roster_id: Optional[int] = None):
+        self.roster_id = roster_id
+        self.queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(
+            maxsize=LIVE_FEED_QUEUE_SIZE
+        )
+
+    def select(self, update: Dict[str, Any]) -> Dict[str, Any]:
+        """Filter an update's teams and matchups to this subscriber's roster."""
+        if self.roster_id is None:
+            return update
+
+        roster = str(self.roster_id)
+        teams = {k: v for k, v in update["teams"].items() if k == roster}
+        matchups = {
+            k: v
+            for k, v in update["matchups"].items()
+            if v is None or self.roster_id in v["roster_ids"]
+        }
+        return {**update, "teams": teams, "matchups": matchups}
+
+    def publish(self, update: Dict[str, Any], board: Dict[str, Any]) -> None:
+        """Queue an update, replacing a full backlog with a snapshot.
+
+        Deltas with nothing for this subscriber's roster are skipped.
+        """
+        message = self.select(update)
+        if not message["teams"] and not message["matchups"]:
+            return
+        if self.queue.full():
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            message = self.select({**update, **scoreboard_since(board)})
+        self.queue.put_nowait(message)
+
+    async def get(self) -> Dict[str, Any]:
+        """Wait for the next message."""
+        return await self.queue.get()
+
+
+def sse_event(message: Dict[str, Any]) -> str:
+    """Format a message as a Server-Sent Event.
+
+    The event id is the scoreboard version, so a reconnecting EventSource
+    resumes with Last-Event-ID. The event type is "scoreboard" for full
+    snapshots and "delta" for changes.
+    """
+    event = "scoreboard" if message["full"] else "delta"
+    return f"id: {message['version']}\nevent: {event}\ndata: {json.dumps(message)}\n\n"
+
+
+async def sse_stream(subscription: Subscription) -> AsyncIterator[str]:
+    """Yield a subscription's messages as Server-Sent Events, with keep-alives."""
+    while True:
+        try:
+            message = await asyncio.wait_for(
+                subscription.get(), timeout=LIVE_FEED_KEEPALIVE_SECONDS
+            )
+        except asyncio.TimeoutError:
+            yield ": keep-alive\n\n"
+            continue
+        yield sse_event(message)
+
+
+def live_feed_status() -> Dict[str, int]:
+    """Subscriber count per active feed, keyed by "league_id:week"."""
+    return {
+        f"{league_id}:{week}": len(feed["subscribers"])
+        for (league_id, week), feed in _feeds.items()
+    }
+
+
+async def _poll(
+    feed: Dict[str, Any],
+    client: httpx.AsyncClient,
+    base_url: str,
+    league_id: str,
+    week: int,
+) -> None:
+    """Refresh the scoreboard and fan out new versions until cancelled."""
+    while True:
+        await asyncio.sleep(LIVE_FEED_POLL_SECONDS)
+        try:
+            board = await refresh_live_scoreboard(client, base_url, league_id, week)
+        except Exception as e:
+            logger.warning(
+                f"Live feed refresh failed (league_id={league_id}, week={week}, error_type={type(e).__name__}, error_message={str(e)})"
+            )
+            continue
+
+        if board["version"] <= feed["version"]:
+            continue
+        update = {
+            "league_id": league_id,
+            "week": week,
+            **scoreboard_since(board, feed["version"]),
+        }
+        feed["version"] = board["version"]
+        for subscription in list(feed["subscribers"]):
+            subscription.publish(update, board)
+
+
+@asynccontextmanager
+async def subscribe(
+    client: httpx.AsyncClient,
+    base_url: str,
+    league_id: str,
+    week: int,
+    roster_id: Optional[int] = None,
+    since_version: Optional[int] = None,
+) -> AsyncIterator[Subscription]:
+    """Subscribe to live score updates for a league's week.
+
+    The subscription's first message is the current scoreboard, or only the
+    changes after since_version if the scoreboard has reached it.
+
+    Args:
+        client: HTTP client for Sleeper requests
+        base_url: The Sleeper API base URL
+        league_id: The Sleeper league ID
+        week: The NFL week number
+        roster_id: Only send updates for this roster and its matchup
+        since_version: Last version the subscriber saw (e.g. Last-Event-ID)
+
+    Raises:
+        Exception: If there is no scoreboard yet and it cannot be fetched
+    """
+    board = await refresh_live_scoreboard(client, base_url, league_id, week)
+    subscription = Subscription(roster_id)
+    subscription.queue.put_nowait(
+        subscription.select(
+            {
+                "league_id": league_id,
+                "week": week,
+                **scoreboard_since(board, since_version),
+            }
+        )
+    )
+
+    key = (league_id, week)
+    feed = _feeds.get(key)
+    if feed is None:
+        feed = {"subscribers": set(), "task": None, "version": board["version"]}
+        _feeds[key] = feed
+    feed["subscribers"].add(subscription)
+    if feed["task"] is None or feed["task"].done():
+        feed["task"] = asyncio.create_task(
+            _poll(feed, client, base_url, league_id, week)
+        )
+        logger.info(f"Live feed started (league_id={league_id}, week={week})")
+
+    try:
+        yield subscription
+    finally:
+        feed["subscribers"].discard(subscription)
+        if not feed["subscribers"] and _feeds.get(key) is feed:
+            del _feeds[key]
+            feed["task"].cancel()
+            await asyncio.gather(feed["task"], return_exceptions=True)
+            logger.info(f"Live feed stopped (league_id={league_id}, week={week})")
+
+
+async def stop_live_feeds() -> None:
+    """Cancel every feed poller (subscribers get no further updates)."""
+    feeds = list(_feeds.values())
+    _feeds.clear()
+    for feed in feeds:
+        feed["task"].cancel()
+    await asyncio.gather(*(feed["task"] for feed in feeds), return_exceptions=True)
@@ -0,0 +1,388 @@
+"""Live matchup scoring with versioned, diffable state.
+
+get_league_matchups returns raw Sleeper matchups and refreshes player stats
+on every call, so an agent polling scores every few seconds repeats the
+whole fetch each time. The scoring engine keeps one scoreboard per league
+and week instead:
+
+- Each starter gets actual points (Sleeper's league-scored players_points),
+  a projection from the player cache and the points still expected. Each
+  team gets actual, remaining and projected final totals, and each matchup
+  a win probability from the projected finals.
+- The scoreboard is recomputed at most once per LIVE_SCORING_REFRESH_SECONDS
+  per league and week; polls in between are answered from memory, and
+  concurrent polls share one refresh.
+- Every recompute that changes something bumps the scoreboard version and
+  records it on the teams and matchups that changed. A client that passes
+  the last version it saw gets only the teams and matchups changed since.
+
+Remaining points: weeks before the current NFL week are final (nothing
+remaining) and later weeks have the full projection remaining. In the
+current week a starter with no stats in the live week payload has not
+played yet; one with stats is assumed halfway through the game, so half
+of their projection is still to come on top of what they have scored,
+since Sleeper exposes no game clock here.
+
+Win probability uses a normal approximation: each starter's remaining
+points have a standard deviation of LIVE_SCORING_SD_RATIO times the points
+remaining, and teams are independent.
+
+Configuration (environment variables):
+- LIVE_SCORING_REFRESH_SECONDS: minimum seconds between recomputes of a
+  scoreboard (default: 15)
+- LIVE_SCORING_SD_RATIO: standard deviation of a starter's remaining points
+  as a fraction of them (default: 0.5)
+"""
+
+import asyncio
+import logging
+import math
+import os
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import httpx
+
+from cache_client import get_live_week_stats, get_players_by_ids_async
+from lib.enrichment import enrich_player_minimal
+from lib.sleeper_cache import fetch_sleeper_json
+
+logger = logging.getLogger(__name__)
+
+LIVE_SCORING_REFRESH_SECONDS = float(os.getenv("LIVE_SCORING_REFRESH_SECONDS", "15"))
+LIVE_SCORING_SD_RATIO = float(os.getenv("LIVE_SCORING_SD_RATIO", "0.5"))
+
+# Week phases relative to the current NFL week
+FINAL = "final"
+LIVE = "live"
+UPCOMING = "upcoming"
+
+# Share of a started player's projection still to come
+_STARTED_REMAINING = 0.5
+
+# (league_id, week) -> scoreboard state: current teams and matchups, the
+# version each last changed at, when it was refreshed and the refresh in flight
+_boards: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+
+def clear_live_scoring() -> None:
+    """Forget all scoreboards."""
+    _boards.clear()
+
+
+def win_probability(final_a: float, sd_a: float, final_b: float, sd_b: float) -> float:
+    """Probability team A outscores team B given projected finals and spreads."""
+    spread = math.sqrt(sd_a**2 + sd_b**2)
+    if spread == 0:
+        if final_a == final_b:
+            return 0.5
+        return 1.0 if final_a > final_b else 0.0
+    z = (final_a - final_b) / spread
+    return 0.5 * (1 + math.erf(z / math.sqrt(2)))
+
+
+def _points(value: Any) -> float:
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def score_team(
+    matchup: Dict[str, Any],
+    players: Dict[str, Any],
+    played_ids: Set[str],
+    phase: str,
+) -> Dict[str, Any]:
+    """Score one team's starters.
+
+    Args:
+        matchup: One team's entry from /league/{league_id}/matchups/{week}
+        players: Cached players for the starters, keyed by Sleeper ID
+        played_ids: Players with stats in the live week payload
+        phase: FINAL, LIVE or UPCOMING
+
+    Returns:
+        Dict with roster_id, matchup_id, actual, projected, remaining,
+        projected_final, sd and per-starter scores
+    """
+    players_points = matchup.get("players_points") or {}
+    starters = []
+    variance = 0.0
+    for player_id in matchup.get("starters") or []:
+        if not player_id or player_id == "0":
+            continue  # Empty lineup slot
+        player_id = str(player_id)
+        minimal = enrich_player_minimal(player_id, players.get(player_id) or {})
+        actual = _points(players_points.get(player_id))
+        projected = _points(minimal.get("projected_points"))
+
+        if phase == FINAL:
+            status, remaining = "final", 0.0
+        elif phase == UPCOMING or player_id not in played_ids:
+            status, remaining = "not_started", projected
+        else:
+            status = "in_progress"
+            remaining = projected * _STARTED_REMAINING
+
+        variance += (LIVE_SCORING_SD_RATIO * remaining) ** 2
+        starters.append(
+            {
+                "player_id": player_id,
+                "name": minimal.get("full_name"),
+                "position": minimal.get("position"),
+                "status": status,
+                "actual": round(actual, 2),
+                "projected": round(projected, 2),
+                "remaining": round(remaining, 2),
+            }
+        )
+
+    actual = _points(matchup.get("points"))
+    remaining = sum(starter["remaining"] for starter in starters)
+    return {
+        "roster_id": matchup.get("roster_id"),
+        "matchup_id": matchup.get("matchup_id"),
+        "actual": round(actual, 2),
+        "projected": round(sum(starter["projected"] for starter in starters), 2),
+        "remaining": round(remaining, 2),
+        "projected_final": round(actual + remaining, 2),
+        "sd": round(math.sqrt(variance), 2),
+        "starters": starters,
+    }
+
+
+def build_scoreboard(
+    matchups: List[Dict[str, Any]],
+    players: Dict[str, Any],
+    played_ids: Set[str],
+    phase: str,
+) -> Dict[str, Dict[str, Any]]:
+    """Score every team and matchup of a week.
+
+    Returns:
+        Dict with "teams" (roster_id -> team score) and "matchups"
+        (matchup_id -> roster_ids and win_probability per roster_id). IDs are
+        strings so the scoreboard serializes as JSON unchanged.
+    """
+    teams = {}
+    for matchup in matchups or []:
+        if isinstance(matchup, dict) and matchup.get("roster_id") is not None:
+            team = score_team(matchup, players, played_ids, phase)
+            teams[str(team["roster_id"])] = team
+
+    pairs: Dict[str, List[Dict[str, Any]]] = {}
+    for team in teams.values():
+        if team["matchup_id"] is not None:
+            pairs.setdefault(str(team["matchup_id"]), []).append(team)
+
+    scored_matchups = {}
+    for matchup_id, pair in pairs.items():
+        probabilities = {str(team["roster_id"]): 1.0 for team in pair}
+        if len(pair) == 2:
+            a, b = pair
+            p_a = win_probability(
+                a["projected_final"], a["sd"], b["projected_final"], b["sd"]
+            )
+            probabilities = {
+                str(a["roster_id"]): round(p_a, 4),
+                str(b["roster_id"]): round(1 - p_a, 4),
+            }
+        scored_matchups[matchup_id] = {
+            "matchup_id": pair[0]["matchup_id"],
+            "roster_ids": [team["roster_id"] for team in pair],
+            "win_probability": probabilities,
+        }
+
+    return {"teams": teams, "matchups": scored_matchups}
+
+
+def _new_board() -> Dict[str, Any]:
+    return {
+        "version": 0,
+        "phase": None,
+        "teams": {},
+        "matchups": {},
+        "versions": {"teams": {}, "matchups": {}},
+        "refreshed_at": 0.0,
+        "updated_at": None,
+        "task": None,
+    }
+
+
+def apply_scoreboard(
+    board: Dict[str, Any], scoreboard: Dict[str, Dict[str, Any]], phase: str
+) -> bool:
+    """Merge a recomputed scoreboard into board, bumping the version on change.
+
+    Returns:
+        True if any team or matchup changed
+    """
+    next_version = board["version"] + 1
+    changed = False
+    for kind in ("teams", "matchups"):
+        current = board[kind]
+        versions = board["versions"][kind]
+        for key, value in scoreboard[kind].items():
+            if current.get(key) != value:
+                current[key] = value
+                versions[key] = next_version
+                changed = True
+        for key in set(current) - set(scoreboard[kind]):
+            del current[key]
+            versions[key] = next_version
+            changed = True
+
+    board["phase"] = phase
+    # The first scoreboard is version 1 even if the week has no matchups
+    if changed or not board["version"]:
+        board["version"] = next_version
+        board["updated_at"] = time.time()
+    return changed
+
+
+def scoreboard_since(
+    board: Dict[str, Any], since_version: Optional[int] = None
+) -> Dict[str, Any]:
+    """Return the full scoreboard, or only what changed after since_version.
+
+    A since_version the board has not reached (e.g. from before a server
+    restart) gets the full scoreboard, flagged with full=True.
+    """
+    version = board["version"]
+    result: Dict[str, Any] = {
+        "version": version,
+        "phase": board["phase"],
+        "updated_at": board["updated_at"],
+    }
+    if since_version is None or since_version > version:
+        result.update(full=True, teams=board["teams"], matchups=board["matchups"])
+        return result
+
+    result["full"] = False
+    for kind in ("teams", "matchups"):
+        versions = board["versions"][kind]
+        changed = [key for key, at in versions.items() if at > since_version]
+        # Removed entries are reported as None
+        result[kind] = {key: board[kind].get(key) for key in changed}
+    return result
+
+
+def _starter_ids(matchups: Iterable[Any]) -> List[str]:
+    ids = set()
+    for matchup in matchups:
+        if isinstance(matchup, dict):
+            ids.update(str(pid) for pid in matchup.get("starters") or [] if pid)
+    ids.discard("0")
+    return sorted(ids)
+
+
+async def compute_scoreboard(
+    client: httpx.AsyncClient, base_url: str, league_id: str, week: int
+) -> Tuple[Dict[str, Dict[str, Any]], str]:
+    """Fetch a week's matchups and score them.
+
+    Returns:
+        (scoreboard as returned by build_scoreboard, phase)
+    """
+    matchups, payload = await asyncio.gather(
+        fetch_sleeper_json(client, f"{base_url}/league/{league_id}/matchups/{week}"),
+        get_live_week_stats(),
+    )
+    current_week = int(payload.get("week") or week)
+    if week < current_week:
+        phase = FINAL
+    elif week > current_week:
+        phase = UPCOMING
+    else:
+        phase = LIVE
+    played_ids = set(payload.get("stats") or {}) if phase == LIVE else set()
+
+    starter_ids = _starter_ids(matchups or [])
+    players = await get_players_by_ids_async(starter_ids) if starter_ids else {}
+    return build_scoreboard(matchups or [], players or {}, played_ids, phase), phase
+
+
+async def _refresh(
+    board: Dict[str, Any],
+    client: httpx.AsyncClient,
+    base_url: str,
+    league_id: str,
+    week: int,
+) -> bool:
+    scoreboard, phase = await compute_scoreboard(client, base_url, league_id, week)
+    changed = apply_scoreboard(board, scoreboard, phase)
+    board["refreshed_at"] = time.time()
+    if changed:
+        logger.info(
+            f"Live scoreboard updated (league_id={league_id}, week={week}, version={board['version']})"
+        )
+    return changed
+
+
+async def refresh_live_scoreboard(
+    client: httpx.AsyncClient,
+    base_url: str,
+    league_id: str,
+    week: int,
+    force: bool = False,
+) -> Dict[str, Any]:
+    """Bring a league's scoreboard for week up to date and return its state.
+
+    Skipped if it was refreshed less than LIVE_SCORING_REFRESH_SECONDS ago
+    (unless force=True). Concurrent callers share one refresh. If a refresh
+    fails, the last scoreboard is served; the error is raised only when there
+    is none yet.
+    """
+    board = _boards.setdefault((league_id, week), _new_board())
+    if (
+        not force
+        and board["refreshed_at"]
+        and time.time() - board["refreshed_at"] < LIVE_SCORING_REFRESH_SECONDS
+    ):
+        return board
+
+    loop = asyncio.get_running_loop()
+    task = board["task"]
+    if task is None or task.done() or task.get_loop() is not loop:
+        task = loop.create_task(_refresh(board, client, base_url, league_id, week))
+        board["task"] = task
+
+    try:
+        await asyncio.shield(task)
+    except Exception as e:
+        if not board["refreshed_at"]:
+            raise
+        logger.warning(
+            f"Live scoreboard refresh failed, serving last state (league_id={league_id}, week={week}, error_type={type(e).__name__}, error_message={str(e)})"
+        )
+    return board
+
+
+async def get_live_scoreboard(
+    client: httpx.AsyncClient,
+    base_url: str,
+    league_id: str,
+    week: int,
+    since_version: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Return a league's live scoreboard for week, or the changes since a version.
+
+    Args:
+        client: HTTP client for Sleeper requests
+        base_url: The Sleeper API base URL
+        league_id: The Sleeper league ID
+        week: The NFL week number
+        since_version: Last version the caller saw; only teams and matchups
+            changed after it are returned
+
+    Returns:
+        Dict with league_id, week, version, phase, updated_at, full and the
+        (changed) teams and matchups
+    """
+    board = await refresh_live_scoreboard(client, base_url, league_id, week)
+    return {
+        "league_id": league_id,
+        "week": week,
+        **scoreboard_since(board, since_version),
+    }
@@ -0,0 +1,84 @@
+"""Per-invocation memo for upstream fetches and cache loads.
+
+Composite tools call other tools through .fn: get_waiver_analysis calls
+get_recent_transactions and get_waiver_wire_players, which in turn calls
+get_trending_players and get_recent_transactions again. Without a shared
+memo each layer re-reads rosters, NFL state, trending lists and the
+transaction log.
+
+log_mcp_tool opens a request context around every tool invocation. Nested
+tool calls reuse the outermost context, so within one top-level call each
+memoized data source is read once:
+
+    rosters = await memoized(("rosters", league_id), lambda: fetch(...))
+
+Outside a request context (scripts, tests calling helpers directly)
+memoized() simply awaits the factory.
+"""
+
+import asyncio
+import copy
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterator, Optional
+
+# key -> task producing the value, for the current tool invocation
+_memo: ContextVar[Optional[Dict[Hashable, "asyncio.Future[Any]"]]] = ContextVar(
+    "request_memo", default=None
+)
+
+
+@contextmanager
+def request_context() -> Iterator[None]:
+    """Memoize fetches for the duration of one tool invocation.
+
+    Nested contexts (a tool calling another tool's .fn) reuse the outer memo.
+    """
+    if _memo.get() is not None:
+        yield
+        return
+
+    token = _memo.set({})
+    try:
+        yield
+    finally:
+        _memo.reset(token)
+
+
+def in_request_context() -> bool:
+    """Return True if a request context is active."""
+    return _memo.get() is not None
+
+
+async def memoized(
+    key: Hashable,
+    factory: Callable[[], Awaitable[Any]],
+    copy_result: bool = False,
+) -> Any:
+    """Return the value for key, calling factory at most once per request.
+
+    Concurrent callers share one call. Failures are not memoized, so a later
+    caller in the same request tries again.
+
+    Args:
+        key: Identifies the data source (e.g. ("sleeper_json", url))
+        factory: Zero-argument coroutine function producing the value
+        copy_result: Return a deep copy to callers that may mutate the value
+
+    Returns:
+        The (possibly shared) value produced by factory
+    """
+    memo = _memo.get()
+    if memo is None:
+        return await factory()
+
+    task = memo.get(key)
+    if task is None or (
+        task.done() and (task.cancelled() or task.exception() is not None)
+    ):
+        task = asyncio.ensure_future(factory())
+        memo[key] = task
+
+    # Shielded so one cancelled caller does not cancel a fetch others share
+    result = await asyncio.shield(task)
+    return copy.deepcopy(result) if copy_result else result
@@ -0,0 +1,226 @@
+"""Response cache for Sleeper league endpoints.
+
+League metadata, users, rosters and NFL state are read on almost every tool
+call (get_waiver_analysis alone reads rosters twice). This module keeps their
+responses in an in-process LRU, optionally backed by Redis so several server
+processes share one copy.
+
+Each endpoint has two windows:
+- fresh: the cached body is returned without touching Sleeper
+- stale: the cached body is returned and a background refresh is started
+
+Past both windows the request waits for Sleeper. Refreshes send
+If-None-Match / If-Modified-Since when Sleeper returned an ETag or
+Last-Modified header, so an unchanged response costs a 304. Concurrent
+requests for the same URL share one upstream fetch.
+
+Configuration (environment variables):
+- SLEEPER_CACHE_ENABLED: cache league endpoint responses (default: true)
+- SLEEPER_CACHE_REDIS: also store responses in Redis (default: false)
+- SLEEPER_CACHE_MAX_ENTRIES: in-memory LRU size (default: 128)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from cache_client import get_async_redis_client
+from lib.request_context import memoized
+
+logger = logging.getLogger(__name__)
+
+SLEEPER_CACHE_ENABLED = os.getenv("SLEEPER_CACHE_ENABLED", "true").lower() == "true"
+SLEEPER_CACHE_REDIS = os.getenv("SLEEPER_CACHE_REDIS", "false").lower() == "true"
+SLEEPER_CACHE_MAX_ENTRIES = int(os.getenv("SLEEPER_CACHE_MAX_ENTRIES", "128"))
+SLEEPER_RESPONSE_KEY_PREFIX = "sleeper_response:"
+
+# (path pattern, seconds served fresh, further seconds served stale)
+ENDPOINT_TTLS = [
+    (re.compile(r"/league/[^/]+$"), 3600, 86400),
+    (re.compile(r"/league/[^/]+/users$"), 3600, 86400),
+    (re.compile(r"/league/[^/]+/rosters$"), 60, 600),
+    (re.compile(r"/state/nfl$"), 300, 3600),
+]
+
+# url -> {"body", "etag", "last_modified", "fetched_at"}, least recently used first
+_entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+# url -> in-flight upstream fetch
+_inflight: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+
+
+def clear_sleeper_cache() -> None:
+    """Drop all in-process cached responses."""
+    _entries.clear()
+    _inflight.clear()
+
+
+def _ttl_for(url: str) -> Optional[Tuple[int, int]]:
+    """Return (fresh, stale) seconds for a URL, or None if it is not cached."""
+    path = urlsplit(url).path.rstrip("/")
+    for pattern, fresh, stale in ENDPOINT_TTLS:
+        if pattern.search(path):
+            return fresh, stale
+    return None
+
+
+def _remember(url: str, entry: Dict[str, Any]) -> None:
+    """Store an entry in the in-process LRU, evicting the oldest if full."""
+    _entries[url] = entry
+    _entries.move_to_end(url)
+    while len(_entries) > SLEEPER_CACHE_MAX_ENTRIES:
+        _entries.popitem(last=False)
+
+
+async def _load_entry(url: str) -> Optional[Dict[str, Any]]:
+    """Get a cached entry from memory, falling back to the Redis tier."""
+    entry = _entries.get(url)
+    if entry is not None:
+        _entries.move_to_end(url)
+        return entry
+
+    if not SLEEPER_CACHE_REDIS:
+        return None
+
+    try:
+        raw = await get_async_redis_client().get(SLEEPER_RESPONSE_KEY_PREFIX + url)
+    except Exception as e:
+        logger.warning(
+            f"Error reading Sleeper response cache (url={url}, error_type={type(e).__name__}, error_message={str(e)})"
+        )
+        return None
+    if raw is None:
+        return None
+
+    entry = json.loads(raw)
+    _remember(url, entry)
+    return entry
+
+
+async def _store_entry(url: str, entry: Dict[str, Any], ttl: Tuple[int, int]) -> None:
+    """Store an entry in memory and, if enabled, in Redis."""
+    _remember(url, entry)
+    if not SLEEPER_CACHE_REDIS:
+        return
+
+    try:
+        await get_async_redis_client().set(
+            SLEEPER_RESPONSE_KEY_PREFIX + url, json.dumps(entry), ex=sum(ttl)
+        )
+    except Exception as e:
+        logger.warning(
+            f"Error writing Sleeper response cache (url={url}, error_type={type(e).__name__}, error_message={str(e)})"
+        )
+
+
+async def _fetch(
+    client: httpx.AsyncClient,
+    url: str,
+    entry: Optional[Dict[str, Any]],
+    ttl: Tuple[int, int],
+) -> Dict[str, Any]:
+    """Fetch a URL from Sleeper, revalidating the cached entry if there is one."""
+    headers = {}
+    if entry is not None:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    response = await client.get(url, headers=headers)
+    if response.status_code == 304 and entry is not None:
+        entry = {**entry, "fetched_at": time.time()}
+        logger.debug(f"Sleeper response not modified (url={url})")
+    else:
+        response.raise_for_status()
+        entry = {
+            "body": response.text,
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+            "fetched_at": time.time(),
+        }
+
+    await _store_entry(url, entry, ttl)
+    return entry
+
+
+def _on_fetch_done(url: str, task: "asyncio.Task[Dict[str, Any]]") -> None:
+    """Forget a finished fetch and log failures (including background ones)."""
+    if _inflight.get(url) is task:
+        del _inflight[url]
+    if not task.cancelled() and task.exception() is not None:
+        e = task.exception()
+        logger.warning(
+            f"Error fetching Sleeper response (url={url}, error_type={type(e).__name__}, error_message={str(e)})"
+        )
+
+
+def _fetch_shared(
+    client: httpx.AsyncClient,
+    url: str,
+    entry: Optional[Dict[str, Any]],
+    ttl: Tuple[int, int],
+) -> "asyncio.Task[Dict[str, Any]]":
+    """Start a fetch for a URL, or join the one already in flight."""
+    loop = asyncio.get_running_loop()
+    task = _inflight.get(url)
+    if task is None or task.done() or task.get_loop() is not loop:
+        task = loop.create_task(_fetch(client, url, entry, ttl))
+        _inflight[url] = task
+        task.add_done_callback(lambda t: _on_fetch_done(url, t))
+    return task
+
+
+async def fetch_sleeper_json(client: httpx.AsyncClient, url: str) -> Any:
+    """GET a Sleeper URL and return the decoded JSON body.
+
+    URLs matching ENDPOINT_TTLS are served from the response cache; any other
+    URL is fetched directly. Within one tool invocation each URL is read once
+    (see lib.request_context).
+
+    Args:
+        client: HTTP client to use for upstream requests
+        url: Full Sleeper API URL
+
+    Returns:
+        Decoded JSON response (a new object on every call, safe to mutate)
+
+    Raises:
+        httpx.HTTPError: If the upstream request fails and no usable cached
+            response exists
+    """
+    return await memoized(
+        ("sleeper_json", url),
+        lambda: _fetch_sleeper_json(client, url),
+        copy_result=True,
+    )
+
+
+async def _fetch_sleeper_json(client: httpx.AsyncClient, url: str) -> Any:
+    """Read a Sleeper URL through the response cache."""
+    ttl = _ttl_for(url) if SLEEPER_CACHE_ENABLED else None
+    if ttl is None:
+        response = await client.get(url)
+        response.raise_for_status()
+        return response.json()
+
+    fresh, stale = ttl
+    entry = await _load_entry(url)
+    age = time.time() - entry["fetched_at"] if entry is not None else None
+
+    if entry is None or age >= fresh + stale:
+        # Shielded so a cancelled caller does not cancel a fetch others share
+        entry = await asyncio.shield(_fetch_shared(client, url, entry, ttl))
+    elif age >= fresh:
+        # Serve stale and refresh in the background
+        _fetch_shared(client, url, entry, ttl)
+        logger.debug(f"Serving stale Sleeper response (url={url}, age={age:.0f}s)")
+
+    return json.loads(entry["body"])
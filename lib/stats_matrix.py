@@ -0,0 +1,345 @@
+"""Columnar players x weeks x stats matrix for season-level analytics.
+
+Season analysis (consistency, boom/bust, positional ranks) over the nested
+{player_id: {week: {stat: value}}} dicts from the stats warehouse means
+Python loops over every player and week. This module packs one season of
+warehouse rows into a float32 NumPy array:
+
+    values[player_index, week - 1, stat_index]
+
+NaN marks a week the player has no stats for (did not play); a stat missing
+from a played week is 0. The array is written to
+STATS_MATRIX_DIR/{season}.npy with a JSON index of player IDs and stat names
+next to it, and loaded back memory-mapped, so a matrix built once is shared
+by every process on the host without parsing. It is rebuilt when the
+warehouse has synced the season since the matrix was written.
+
+NumPy is optional; without it NUMPY_AVAILABLE is False and the tools that
+need a matrix report an error.
+
+Configuration (environment variables):
+- STATS_MATRIX_DIR: directory for the matrix files (default: stats_matrix)
+"""
+
+import asyncio
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+from lib.stats_warehouse import query_player_weeks, season_synced_at
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+STATS_MATRIX_DIR = os.getenv("STATS_MATRIX_DIR", "stats_matrix")
+
+FANTASY_POINTS = "fantasy_points"
+
+# Loaded matrix per season, reused while its source sync time still matches
+_matrices: Dict[int, Dict[str, Any]] = {}
+
+
+def clear_stats_matrices() -> None:
+    """Forget loaded matrices (files on disk are kept)."""
+    _matrices.clear()
+
+
+def _paths(season: int) -> tuple[str, str]:
+    """Paths of the array and index files for a season."""
+    base = os.path.join(STATS_MATRIX_DIR, str(season))
+    return base + ".npy", base + ".json"
+
+
+def build_stats_matrix(
+    season: int,
+    player_weeks: Dict[str, Dict[int, Dict[str, Any]]],
+    num_weeks: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Pack weekly stats into a players x weeks x stats array.
+
+    Args:
+        season: Season year
+        player_weeks: player_id -> {week: stats} as from query_player_weeks
+        num_weeks: Number of week columns (default: last week with stats)
+
+    Returns:
+        Dict with season, player_ids, stats (column names, fantasy_points
+        first), index (player_id -> row) and values
+    """
+    stat_names = {FANTASY_POINTS}
+    last_week = 0
+    for weeks in player_weeks.values():
+        for week, stats in weeks.items():
+            stat_names.update(stats)
+            last_week = max(last_week, week)
+    stats = [FANTASY_POINTS] + sorted(stat_names - {FANTASY_POINTS})
+    stat_index = {name: i for i, name in enumerate(stats)}
+
+    player_ids = sorted(player_weeks)
+    values = np.full(
+        (len(player_ids), num_weeks or last_week, len(stats)), np.nan, np.float32
+    )
+    for row, player_id in enumerate(player_ids):
+        for week, week_stats in player_weeks[player_id].items():
+            if week > values.shape[1]:
+                continue
+            cell = values[row, week - 1]
+            cell[:] = 0
+            for name, value in week_stats.items():
+                if isinstance(value, (int, float)):
+                    cell[stat_index[name]] = value
+
+    return _matrix(season, player_ids, stats, values)
+
+
+def _matrix(
+    season: int, player_ids: List[str], stats: List[str], values: Any
+) -> Dict[str, Any]:
+    return {
+        "season": season,
+        "player_ids": player_ids,
+        "stats": stats,
+        "index": {player_id: row for row, player_id in enumerate(player_ids)},
+        "values": values,
+    }
+
+
+def save_stats_matrix(matrix: Dict[str, Any], synced_at: Optional[float]) -> None:
+    """Write a matrix and its index, replacing any previous files atomically."""
+    os.makedirs(STATS_MATRIX_DIR, exist_ok=True)
+    array_path, index_path = _paths(matrix["season"])
+
+    with open(array_path + ".tmp", "wb") as f:
+        np.save(f, matrix["values"])
+    with open(index_path + ".tmp", "w") as f:
+        json.dump(
+            {
+                "player_ids": matrix["player_ids"],
+                "stats": matrix["stats"],
+                "synced_at": synced_at,
+            },
+            f,
+        )
+    os.replace(array_path + ".tmp", array_path)
+    os.replace(index_path + ".tmp", index_path)
+
+
+def load_stats_matrix(
+    season: int,
+) -> tuple[Optional[Dict[str, Any]], Optional[float]]:
+    """Memory-map a saved matrix.
+
+    Returns:
+        (matrix, synced_at of the warehouse when it was built), or
+        (None, None) if there is no usable file
+    """
+    array_path, index_path = _paths(season)
+    try:
+        with open(index_path) as f:
+            index = json.load(f)
+        values = np.load(array_path, mmap_mode="r")
+    except (OSError, ValueError) as e:
+        if not isinstance(e, FileNotFoundError):
+            logger.warning(
+                f"Error loading stats matrix (season={season}, error_type={type(e).__name__}, error_message={str(e)})"
+            )
+        return None, None
+
+    if values.shape[:1] != (len(index["player_ids"]),) or values.shape[2:] != (
+        len(index["stats"]),
+    ):
+        logger.warning(f"Stats matrix does not match its index (season={season})")
+        return None, None
+    return _matrix(season, index["player_ids"], index["stats"], values), index[
+        "synced_at"
+    ]
+
+
+def get_stats_matrix(season: int) -> Dict[str, Any]:
+    """Return the season's matrix, rebuilding it if the warehouse moved on.
+
+    Reuses the loaded matrix, then the file on disk, as long as they were
+    built from the warehouse's latest sync of the season.
+    """
+    synced_at = season_synced_at(season)
+    cached = _matrices.get(season)
+    if cached is not None and cached["synced_at"] == synced_at:
+        return cached["matrix"]
+
+    matrix, built_from = load_stats_matrix(season)
+    if matrix is None or built_from != synced_at:
+        matrix = build_stats_matrix(season, query_player_weeks(season, None))
+        try:
+            save_stats_matrix(matrix, synced_at)
+        except OSError as e:
+            logger.warning(
+                f"Error saving stats matrix (season={season}, error_type={type(e).__name__}, error_message={str(e)})"
+            )
+        logger.info(
+            f"Built stats matrix (season={season}, players={len(matrix['player_ids'])}, shape={matrix['values'].shape})"
+        )
+
+    _matrices[season] = {"matrix": matrix, "synced_at": synced_at}
+    return matrix
+
+
+async def get_stats_matrix_async(season: int) -> Dict[str, Any]:
+    """Run get_stats_matrix in a worker thread."""
+    return await asyncio.to_thread(get_stats_matrix, season)
+
+
+def stat_column(matrix: Dict[str, Any], stat: str = FANTASY_POINTS) -> Any:
+    """players x weeks array for one stat (NaN for weeks not played).
+
+    Raises:
+        ValueError: If no player in the season recorded the stat
+    """
+    return matrix["values"][:, :, matrix["stats"].index(stat)]
+
+
+def games_played(matrix: Dict[str, Any]) -> Any:
+    """Weeks with stats per player."""
+    return np.sum(~np.isnan(stat_column(matrix)), axis=1)
+
+
+def season_totals(matrix: Dict[str, Any], stat: str = FANTASY_POINTS) -> Any:
+    """Season total of a stat per player."""
+    return np.nansum(stat_column(matrix, stat), axis=1)
+
+
+def season_averages(matrix: Dict[str, Any], stat: str = FANTASY_POINTS) -> Any:
+    """Per-game average of a stat per player (0 for players without games)."""
+    games = games_played(matrix)
+    return np.divide(
+        season_totals(matrix, stat),
+        games,
+        out=np.zeros(len(games), np.float64),
+        where=games > 0,
+    )
+
+
+def season_std(matrix: Dict[str, Any], stat: str = FANTASY_POINTS) -> Any:
+    """Standard deviation of a stat over games played (0 below two games)."""
+    column = stat_column(matrix, stat)
+    games = games_played(matrix)
+    mean = season_averages(matrix, stat)[:, None]
+    squared = np.nansum((column - mean) ** 2, axis=1)
+    return np.sqrt(
+        np.divide(squared, games, out=np.zeros(len(games), np.float64), where=games > 1)
+    )
+
+
+def rolling_average(
+    matrix: Dict[str, Any], window: int, stat: str = FANTASY_POINTS
+) -> Any:
+    """players x weeks array of the average over the last `window` weeks.
+
+    Weeks not played are left out of each average; a window without games is
+    NaN.
+    """
+    column = stat_column(matrix, stat)
+    played = ~np.isnan(column)
+    pad = np.zeros((column.shape[0], 1))
+    sums = np.concatenate([pad, np.cumsum(np.where(played, column, 0), axis=1)], 1)
+    counts = np.concatenate([pad, np.cumsum(played, axis=1)], 1)
+
+    end = np.arange(1, column.shape[1] + 1)
+    start = np.maximum(end - window, 0)
+    window_sums = sums[:, end] - sums[:, start]
+    window_counts = counts[:, end] - counts[:, start]
+    return np.divide(
+        window_sums,
+        window_counts,
+        out=np.full(window_sums.shape, np.nan),
+        where=window_counts > 0,
+    )
+
+
+def position_percentiles(
+    matrix: Dict[str, Any], positions: Dict[str, Optional[str]], values: Any
+) -> Any:
+    """Percentile (0-100) of each player's value among their position.
+
+    Args:
+        matrix: Stats matrix
+        positions: player_id -> position; players without one get NaN
+        values: One value per player row (e.g. season_totals(matrix))
+
+    Returns:
+        Array of percentiles; the best player at a position gets 100
+    """
+    labels = np.array([positions.get(pid) or "" for pid in matrix["player_ids"]])
+    percentiles = np.full(len(labels), np.nan)
+    for position in np.unique(labels):
+        if not position:
+            continue
+        rows = np.flatnonzero(labels == position)
+        ranks = np.argsort(np.argsort(values[rows], kind="stable"), kind="stable")
+        percentiles[rows] = 100.0 * (ranks + 1) / len(rows)
+    return percentiles
+
+
+def _rounded(value: float, digits: int = 2) -> Optional[float]:
+    return None if np.isnan(value) else round(float(value), digits)
+
+
+def season_rankings(
+    matrix: Dict[str, Any],
+    positions: Dict[str, Optional[str]],
+    position: Optional[str] = None,
+    limit: int = 25,
+    recent_weeks: int = 3,
+) -> List[Dict[str, Any]]:
+    """Rank players with games by season fantasy points.
+
+    Args:
+        matrix: Stats matrix
+        positions: player_id -> position
+        position: Only rank players at this position
+        limit: Maximum number of players returned
+        recent_weeks: Window for the recent average
+
+    Returns:
+        [{"rank", "player_id", "position", "fantasy_points", "games_played",
+        "points_per_game", "std_dev", "recent_avg", "position_percentile"}],
+        best first
+    """
+    totals = season_totals(matrix)
+    games = games_played(matrix)
+    averages = season_averages(matrix)
+    std = season_std(matrix)
+    percentiles = position_percentiles(matrix, positions, totals)
+    if matrix["values"].shape[1]:
+        recent = rolling_average(matrix, recent_weeks)[:, -1]
+    else:
+        recent = np.full(len(totals), np.nan)
+
+    player_ids = matrix["player_ids"]
+    eligible = games > 0
+    if position is not None:
+        eligible &= np.array([positions.get(pid) == position for pid in player_ids])
+    rows = np.flatnonzero(eligible)
+    rows = rows[np.argsort(-totals[rows], kind="stable")][:limit]
+
+    return [
+        {
+            "rank": rank,
+            "player_id": player_ids[row],
+            "position": positions.get(player_ids[row]),
+            "fantasy_points": _rounded(totals[row]),
+            "games_played": int(games[row]),
+            "points_per_game": _rounded(averages[row]),
+            "std_dev": _rounded(std[row]),
+            "recent_avg": _rounded(recent[row]),
+            "position_percentile": _rounded(percentiles[row], 1),
+        }
+        for rank, row in enumerate(rows, start=1)
+    ]
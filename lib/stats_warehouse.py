@@ -0,0 +1,321 @@
+"""Local per-season store of weekly player stats.
+
+get_player_stats_all_weeks used to download every week's league-wide stats
+file on each call just to pull out one player's line. Weekly stats are now
+kept in a SQLite store:
+
+- Completed weeks (earlier weeks of the current season, every week of past
+  seasons) never change, so each is fetched once.
+- The current week is refetched at most every STATS_CURRENT_WEEK_SECONDS.
+- Rows are PPR-filtered (filter_ppr_relevant_stats) and indexed by player
+  and week, so season lines for one or several players are a single query
+  with no upstream traffic.
+
+Concurrent syncs of the same season share one fetch.
+
+Configuration (environment variables):
+- STATS_WAREHOUSE_PATH: SQLite file for the store (default: stats_warehouse.db)
+- STATS_CURRENT_WEEK_SECONDS: minimum seconds between current-week
+  refreshes (default: 300)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+
+from ppr_stats import filter_ppr_relevant_stats
+from lib.request_context import memoized
+
+logger = logging.getLogger(__name__)
+
+STATS_WAREHOUSE_PATH = os.getenv("STATS_WAREHOUSE_PATH", "stats_warehouse.db")
+STATS_CURRENT_WEEK_SECONDS = int(os.getenv("STATS_CURRENT_WEEK_SECONDS", "300"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS weekly_stats (
+    season INTEGER NOT NULL,
+    week INTEGER NOT NULL,
+    player_id TEXT NOT NULL,
+    stats TEXT NOT NULL,
+    PRIMARY KEY (season, player_id, week)
+);
+CREATE TABLE IF NOT EXISTS synced_weeks (
+    season INTEGER NOT NULL,
+    week INTEGER NOT NULL,
+    complete INTEGER NOT NULL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (season, week)
+);
+"""
+
+# Open connection (shared by worker threads, guarded by _db_lock), the path it
+# was opened for, and the sync in flight per season
+_store: Dict[str, Any] = {"conn": None, "path": None, "tasks": {}}
+_db_lock = threading.Lock()
+
+
+def _get_connection() -> sqlite3.Connection:
+    """Open (or reuse) the SQLite connection for STATS_WAREHOUSE_PATH."""
+    if _store["conn"] is None or _store["path"] != STATS_WAREHOUSE_PATH:
+        if _store["conn"] is not None:
+            _store["conn"].close()
+        conn = sqlite3.connect(STATS_WAREHOUSE_PATH, check_same_thread=False)
+        conn.executescript(_SCHEMA)
+        _store["conn"] = conn
+        _store["path"] = STATS_WAREHOUSE_PATH
+    return _store["conn"]
+
+
+def close_stats_warehouse() -> None:
+    """Close the SQLite connection and forget in-flight syncs."""
+    with _db_lock:
+        if _store["conn"] is not None:
+            _store["conn"].close()
+        _store["conn"] = None
+        _store["path"] = None
+        _store["tasks"] = {}
+
+
+def _synced_weeks(season: int) -> Dict[int, Tuple[bool, float]]:
+    """week -> (complete, synced_at) for weeks of a season already stored."""
+    with _db_lock:
+        rows = (
+            _get_connection()
+            .execute(
+                "SELECT week, complete, synced_at FROM synced_weeks WHERE season = ?",
+                (season,),
+            )
+            .fetchall()
+        )
+    return {week: (bool(complete), synced_at) for week, complete, synced_at in rows}
+
+
+def _store_week(
+    season: int, week: int, stats: Dict[str, Any], complete: bool, synced_at: float
+) -> None:
+    """Replace one week's rows and record it as synced."""
+    rows = [
+        (season, week, player_id, json.dumps(player_stats))
+        for player_id, player_stats in stats.items()
+        if isinstance(player_stats, dict)
+    ]
+    with _db_lock:
+        conn = _get_connection()
+        with conn:
+            conn.execute(
+                "DELETE FROM weekly_stats WHERE season = ? AND week = ?",
+                (season, week),
+            )
+            conn.executemany("INSERT INTO weekly_stats VALUES (?, ?, ?, ?)", rows)
+            conn.execute(
+                "INSERT OR REPLACE INTO synced_weeks VALUES (?, ?, ?, ?)",
+                (season, week, int(complete), synced_at),
+            )
+
+
+def weeks_to_sync(
+    synced: Dict[int, Tuple[bool, float]],
+    last_week: int,
+    current_week: Optional[int],
+    now: float,
+) -> List[int]:
+    """Weeks that are missing, or the current week if its copy is stale.
+
+    Args:
+        synced: week -> (complete, synced_at) as stored
+        last_week: Last week to have stats for
+        current_week: The week still in progress (None for a past season)
+        now: Current time (epoch seconds)
+
+    Returns:
+        Sorted list of weeks to fetch
+    """
+    weeks = []
+    for week in range(1, last_week + 1):
+        complete, synced_at = synced.get(week, (False, None))
+        if complete:
+            continue
+        if synced_at is None or week != current_week:
+            weeks.append(week)
+        elif now - synced_at >= STATS_CURRENT_WEEK_SECONDS:
+            weeks.append(week)
+    return weeks
+
+
+async def _sync(
+    client: httpx.AsyncClient,
+    base_url: str,
+    season: int,
+    last_week: int,
+    current_week: Optional[int],
+) -> List[int]:
+    """Fetch and store the weeks that need syncing. Returns weeks written."""
+    synced = await asyncio.to_thread(_synced_weeks, season)
+    weeks = weeks_to_sync(synced, last_week, current_week, time.time())
+    if not weeks:
+        return []
+
+    responses = await asyncio.gather(
+        *(
+            client.get(f"{base_url}/stats/nfl/regular/{season}/{week}")
+            for week in weeks
+        ),
+        return_exceptions=True,
+    )
+
+    written = []
+    for week, response in zip(weeks, responses):
+        try:
+            if isinstance(response, Exception):
+                raise response
+            response.raise_for_status()
+            stats = filter_ppr_relevant_stats(response.json() or {})
+        except Exception as e:
+            # Left unsynced, so the next read retries it
+            logger.warning(
+                f"Failed to fetch week stats (season={season}, week={week}, error_type={type(e).__name__}, error_message={str(e)})"
+            )
+            continue
+        await asyncio.to_thread(
+            _store_week, season, week, stats, week != current_week, time.time()
+        )
+        written.append(week)
+
+    logger.info(f"Synced weekly stats (season={season}, weeks={written})")
+    return written
+
+
+async def sync_season_stats(
+    client: httpx.AsyncClient,
+    base_url: str,
+    season: int,
+    last_week: int,
+    current_week: Optional[int] = None,
+) -> List[int]:
+    """Bring a season's weeks 1..last_week up to date with Sleeper.
+
+    Completed weeks are fetched once; current_week is refetched once its copy
+    is older than STATS_CURRENT_WEEK_SECONDS. Concurrent callers for the same
+    season share one sync. Weeks that fail to download are logged, skipped
+    and retried on the next call.
+
+    Args:
+        client: HTTP client for Sleeper requests
+        base_url: The Sleeper API base URL
+        season: Season year
+        last_week: Last week to have stats for
+        current_week: The week still in progress (None for a past season)
+
+    Returns:
+        Weeks written by this call
+    """
+    loop = asyncio.get_running_loop()
+    task = _store["tasks"].get(season)
+    if task is None or task.done() or task.get_loop() is not loop:
+        task = loop.create_task(
+            _sync(client, base_url, season, last_week, current_week)
+        )
+        _store["tasks"][season] = task
+    return await asyncio.shield(task)
+
+
+async def ensure_season_stats(
+    client: httpx.AsyncClient,
+    base_url: str,
+    season: int,
+    state: Dict[str, Any],
+) -> None:
+    """Sync a season up to the current week described by /state/nfl.
+
+    Weeks of past seasons are all complete; for the current season the
+    state's week is still in progress. Future seasons have no stats and are
+    skipped. Runs at most once per request.
+
+    Args:
+        client: HTTP client for Sleeper requests
+        base_url: The Sleeper API base URL
+        season: Season year
+        state: Response of /state/nfl
+    """
+    current_week = state.get("week", 1)
+    state_season = int(state.get("season", season))
+    if season > state_season:
+        return
+
+    in_progress_week = current_week if season == state_season else None
+    await memoized(
+        ("season_stats", season),
+        lambda: sync_season_stats(
+            client, base_url, season, current_week, in_progress_week
+        ),
+    )
+
+
+def season_synced_at(season: int) -> Optional[float]:
+    """Time of the most recent sync of any week of a season, if any."""
+    with _db_lock:
+        row = (
+            _get_connection()
+            .execute(
+                "SELECT MAX(synced_at) FROM synced_weeks WHERE season = ?", (season,)
+            )
+            .fetchone()
+        )
+    return row[0]
+
+
+def query_player_weeks(
+    season: int,
+    player_ids: Optional[Iterable[str]],
+    weeks: Optional[Iterable[int]] = None,
+) -> Dict[str, Dict[int, Dict[str, Any]]]:
+    """Read stored weekly stats for players.
+
+    Args:
+        season: Season year
+        player_ids: Sleeper player IDs (None for every player with stats)
+        weeks: Only these weeks (default: all stored weeks)
+
+    Returns:
+        player_id -> {week: PPR-filtered stats}; players without stats are
+        omitted
+    """
+    sql = "SELECT player_id, week, stats FROM weekly_stats WHERE season = ?"
+    params: List[Any] = [season]
+    if player_ids is not None:
+        ids = list(dict.fromkeys(str(pid) for pid in player_ids))
+        if not ids:
+            return {}
+        sql += f" AND player_id IN ({', '.join('?' * len(ids))})"
+        params.extend(ids)
+    if weeks is not None:
+        week_list = list(weeks)
+        sql += f" AND week IN ({', '.join('?' * len(week_list))})"
+        params.extend(week_list)
+    sql += " ORDER BY player_id, week"
+
+    with _db_lock:
+        rows = _get_connection().execute(sql, params).fetchall()
+
+    result: Dict[str, Dict[int, Dict[str, Any]]] = {}
+    for player_id, week, stats in rows:
+        result.setdefault(player_id, {})[week] = json.loads(stats)
+    return result
+
+
+async def query_player_weeks_async(
+    season: int,
+    player_ids: Optional[Iterable[str]],
+    weeks: Optional[Iterable[int]] = None,
+) -> Dict[str, Dict[int, Dict[str, Any]]]:
+    """Run query_player_weeks in a worker thread."""
+    if player_ids is not None:
+        player_ids = list(player_ids)
+    return await asyncio.to_thread(query_player_weeks, season, player_ids, weeks)
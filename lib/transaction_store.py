@@ -0,0 +1,328 @@
+"""Local transaction log for league transactions.
+
+get_recent_transactions used to fetch transaction rounds 1-10 from Sleeper on
+every call and enrich every add/drop one player at a time. Transactions are
+now kept in a SQLite log:
+
+- The first sync backfills every round up to the current week; later syncs
+  fetch only the current and previous rounds (plus any round never synced).
+- Rows are deduplicated by transaction_id, so status changes (pending ->
+  complete/failed) overwrite the earlier copy.
+- Adds and drops are stored as Sleeper sends them ({player_id: roster_id});
+  names, teams and positions are looked up when transactions are read, so
+  they stay current and a player cache outage cannot freeze them.
+- Rows are indexed by timestamp, type and player, so filters such as
+  drops_only and max_days_ago are answered with one indexed query.
+
+One log holds every league the server is asked about; rows and synced
+rounds are keyed by league ID. Syncs are throttled and shared per league:
+callers within TRANSACTION_SYNC_SECONDS of that league's last sync read the
+log directly, and concurrent callers wait on one sync. A log written by an
+older schema is dropped and backfilled again on the next sync.
+
+Configuration (environment variables):
+- TRANSACTION_DB_PATH: SQLite file for the log (default: transactions.db)
+- TRANSACTION_SYNC_SECONDS: minimum seconds between syncs (default: 60)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import httpx
+
+from lib.sleeper_cache import fetch_sleeper_json
+
+logger = logging.getLogger(__name__)
+
+TRANSACTION_DB_PATH = os.getenv("TRANSACTION_DB_PATH", "transactions.db")
+TRANSACTION_SYNC_SECONDS = int(os.getenv("TRANSACTION_SYNC_SECONDS", "60"))
+
+DAY_MS = 24 * 60 * 60 * 1000
+
+# Bumped when the tables change; older logs are rebuilt from Sleeper
+SCHEMA_VERSION = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transactions (
+    transaction_id TEXT PRIMARY KEY,
+    league_id TEXT NOT NULL,
+    round INTEGER,
+    type TEXT,
+    status TEXT,
+    status_updated INTEGER NOT NULL DEFAULT 0,
+    has_drops INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_transactions_updated
+    ON transactions (league_id, status_updated DESC);
+CREATE INDEX IF NOT EXISTS idx_transactions_type_updated
+    ON transactions (league_id, type, status_updated DESC);
+CREATE TABLE IF NOT EXISTS transaction_players (
+    transaction_id TEXT NOT NULL,
+    player_id TEXT NOT NULL,
+    action TEXT NOT NULL,
+    roster_id INTEGER,
+    PRIMARY KEY (transaction_id, player_id, action)
+);
+CREATE INDEX IF NOT EXISTS idx_transaction_players_player
+    ON transaction_players (player_id, action);
+CREATE TABLE IF NOT EXISTS synced_rounds (
+    league_id TEXT NOT NULL,
+    round INTEGER NOT NULL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (league_id, round)
+);
+"""
+
+_TABLES = ("transactions", "transaction_players", "synced_rounds")
+
+# Open connection (shared by worker threads, guarded by _db_lock), the path it
+# was opened for, and per league: when the last sync finished and the sync in
+# flight
+_store: Dict[str, Any] = {
+    "conn": None,
+    "path": None,
+    "synced_at": {},
+    "tasks": {},
+}
+_db_lock = threading.Lock()
+
+
+def _get_connection() -> sqlite3.Connection:
+    """Open (or reuse) the SQLite connection for TRANSACTION_DB_PATH."""
+    if _store["conn"] is None or _store["path"] != TRANSACTION_DB_PATH:
+        if _store["conn"] is not None:
+            _store["conn"].close()
+        conn = sqlite3.connect(TRANSACTION_DB_PATH, check_same_thread=False)
+        if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            with conn:
+                for table in _TABLES:
+                    conn.execute(f"DROP TABLE IF EXISTS {table}")
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.executescript(_SCHEMA)
+        _store["conn"] = conn
+        _store["path"] = TRANSACTION_DB_PATH
+        _store["synced_at"] = {}
+    return _store["conn"]
+
+
+def close_transaction_store() -> None:
+    """Close the SQLite connection and forget sync state."""
+    with _db_lock:
+        if _store["conn"] is not None:
+            _store["conn"].close()
+        _store["conn"] = None
+        _store["path"] = None
+        _store["synced_at"] = {}
+        _store["tasks"] = {}
+
+
+def _synced_rounds(league_id: str) -> Set[int]:
+    """Rounds of the league that have been synced at least once."""
+    with _db_lock:
+        rows = (
+            _get_connection()
+            .execute(
+                "SELECT round FROM synced_rounds WHERE league_id = ?", (league_id,)
+            )
+            .fetchall()
+        )
+    return {row[0] for row in rows}
+
+
+def _store_transactions(
+    league_id: str,
+    rows: List[Tuple[int, Dict[str, Any]]],
+    rounds: Iterable[int],
+    synced_at: float,
+) -> None:
+    """Upsert a league's transactions and mark rounds as synced."""
+    with _db_lock:
+        conn = _get_connection()
+        with conn:
+            for round_num, txn in rows:
+                txn_id = str(txn["transaction_id"])
+                conn.execute(
+                    "INSERT OR REPLACE INTO transactions VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        txn_id,
+                        league_id,
+                        round_num,
+                        txn.get("type"),
+                        txn.get("status"),
+                        txn.get("status_updated") or 0,
+                        1 if txn.get("drops") else 0,
+                        json.dumps(txn),
+                    ),
+                )
+                conn.execute(
+                    "DELETE FROM transaction_players WHERE transaction_id = ?",
+                    (txn_id,),
+                )
+                conn.executemany(
+                    "INSERT INTO transaction_players VALUES (?, ?, ?, ?)",
+                    [
+                        (txn_id, player_id, action, roster_id)
+                        for action in ("adds", "drops")
+                        for player_id, roster_id in (txn.get(action) or {}).items()
+                    ],
+                )
+            conn.executemany(
+                "INSERT OR REPLACE INTO synced_rounds VALUES (?, ?, ?)",
+                [(league_id, round_num, synced_at) for round_num in rounds],
+            )
+
+
+async def _sync(client: httpx.AsyncClient, base_url: str, league_id: str) -> int:
+    """Fetch the rounds that need syncing and store them. Returns rows written."""
+    state = await fetch_sleeper_json(client, f"{base_url}/state/nfl")
+    current_round = max(int(state.get("week") or 1), 1)
+
+    synced = await asyncio.to_thread(_synced_rounds, league_id)
+    rounds = sorted(
+        {r for r in range(1, current_round + 1) if r not in synced}
+        | {max(current_round - 1, 1), current_round}
+    )
+
+    responses = await asyncio.gather(
+        *(
+            client.get(f"{base_url}/league/{league_id}/transactions/{round_num}")
+            for round_num in rounds
+        ),
+        return_exceptions=True,
+    )
+
+    fetched_rounds = []
+    fetched = []
+    for round_num, response in zip(rounds, responses):
+        if isinstance(response, Exception) or response.status_code != 200:
+            continue  # Retried on the next sync since the round stays unsynced
+        fetched_rounds.append(round_num)
+        fetched.extend(
+            (round_num, txn)
+            for txn in response.json() or []
+            if txn.get("transaction_id")
+        )
+
+    await asyncio.to_thread(
+        _store_transactions, league_id, fetched, fetched_rounds, time.time()
+    )
+    logger.info(
+        f"Synced league transactions (league_id={league_id}, rounds={fetched_rounds}, transactions={len(fetched)})"
+    )
+    return len(fetched)
+
+
+async def sync_transactions(
+    client: httpx.AsyncClient, base_url: str, league_id: str, force: bool = False
+) -> int:
+    """Bring the league's part of the local log up to date with Sleeper.
+
+    Skipped if the league's last sync finished less than
+    TRANSACTION_SYNC_SECONDS ago (unless force=True). Concurrent callers for
+    the same league share one sync. Failures are logged and the log is
+    served as-is.
+
+    Args:
+        client: HTTP client for Sleeper requests
+        base_url: The Sleeper API base URL
+        league_id: The Sleeper league ID
+        force: Sync even if the last sync was recent
+
+    Returns:
+        Number of transactions written (0 if skipped or failed)
+    """
+    await asyncio.to_thread(_synced_rounds, league_id)  # Opens the log if needed
+    last_synced = _store["synced_at"].get(league_id, 0.0)
+    if not force and time.time() - last_synced < TRANSACTION_SYNC_SECONDS:
+        return 0
+
+    loop = asyncio.get_running_loop()
+    task = _store["tasks"].get(league_id)
+    if task is None or task.done() or task.get_loop() is not loop:
+        task = loop.create_task(_sync(client, base_url, league_id))
+        _store["tasks"][league_id] = task
+
+    try:
+        written = await asyncio.shield(task)
+    except Exception as e:
+        logger.warning(
+            f"Transaction sync failed, serving stored transactions (league_id={league_id}, error_type={type(e).__name__}, error_message={str(e)})"
+        )
+        return 0
+
+    _store["synced_at"][league_id] = time.time()
+    return written
+
+
+def query_transactions(
+    league_id: str,
+    limit: int,
+    transaction_type: Optional[str] = None,
+    include_failed: bool = False,
+    drops_only: bool = False,
+    min_days_ago: Optional[int] = None,
+    max_days_ago: Optional[int] = None,
+    player_id: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Read a league's transactions from the log, most recent first.
+
+    Day filters follow get_recent_transactions: whole days since
+    status_updated, and transactions without a timestamp are never filtered
+    out by date.
+
+    Args:
+        league_id: The Sleeper league ID
+        limit: Maximum number of transactions to return
+        transaction_type: Only this type ('waiver', 'free_agent', 'trade')
+        include_failed: Include failed transactions
+        drops_only: Only transactions with drops
+        min_days_ago: Only transactions at least this many days old
+        max_days_ago: Only transactions at most this many days old
+        player_id: Only transactions adding or dropping this player
+
+    Returns:
+        List of Sleeper transaction dicts ({player_id: roster_id} adds/drops)
+    """
+    clauses = ["league_id = ?"]
+    params: List[Any] = [league_id]
+    if not include_failed:
+        clauses.append("status IS NOT 'failed'")
+    if transaction_type:
+        clauses.append("type = ?")
+        params.append(transaction_type)
+    if drops_only:
+        clauses.append("has_drops = 1")
+    if player_id:
+        clauses.append(
+            "transaction_id IN (SELECT transaction_id FROM transaction_players WHERE player_id = ?)"
+        )
+        params.append(str(player_id))
+
+    now_ms = datetime.now().timestamp() * 1000
+    if min_days_ago is not None:
+        clauses.append("(status_updated = 0 OR status_updated <= ?)")
+        params.append(now_ms - min_days_ago * DAY_MS)
+    if max_days_ago is not None:
+        clauses.append("(status_updated = 0 OR status_updated > ?)")
+        params.append(now_ms - (max_days_ago + 1) * DAY_MS)
+
+    where = " AND ".join(clauses)
+    sql = f"SELECT data FROM transactions WHERE {where} ORDER BY status_updated DESC LIMIT ?"
+    params.append(limit)
+
+    with _db_lock:
+        rows = _get_connection().execute(sql, params).fetchall()
+    return [json.loads(row[0]) for row in rows]
+
+
+async def query_transactions_async(**filters: Any) -> List[Dict[str, Any]]:
+    """Run query_transactions in a worker thread."""
+    return await asyncio.to_thread(query_transactions, **filters)
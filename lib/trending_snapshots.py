@@ -0,0 +1,293 @@
+"""Trending player snapshots with history.
+
+get_trending_players used to call /players/nfl/trending/{type} on every
+request, and the waiver tools pulled it in again through
+get_trending_data_map. Sleeper's 24h trending window moves slowly, so a
+background poller now snapshots the add and drop lists into Redis every few
+minutes:
+
+- trending_snapshot:{type} holds the latest snapshot
+- trending_history:{type} is a sorted set of past snapshots scored by time,
+  trimmed to TRENDING_HISTORY_HOURS
+
+Tools read the latest snapshot. Without the poller (stdio mode) a snapshot
+older than TRENDING_MAX_AGE_SECONDS is refreshed on read, so the history
+still fills in. The history also answers delta queries ("how much did each
+player's count change in the last hour") that used to need repeated live
+calls.
+
+Configuration (environment variables):
+- TRENDING_POLL_ENABLED: run the poller in the HTTP server (default: true)
+- TRENDING_POLL_SECONDS: seconds between snapshots (default: 300)
+- TRENDING_HISTORY_HOURS: hours of snapshots kept for deltas (default: 48)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from cache_client import SLEEPER_BASE_URL, get_async_redis_client
+from lib.http_client import get_http_client
+
+logger = logging.getLogger(__name__)
+
+TRENDING_POLL_ENABLED = os.getenv("TRENDING_POLL_ENABLED", "true").lower() == "true"
+TRENDING_POLL_SECONDS = int(os.getenv("TRENDING_POLL_SECONDS", "300"))
+TRENDING_HISTORY_HOURS = float(os.getenv("TRENDING_HISTORY_HOURS", "48"))
+# Snapshots older than this are refreshed on read
+TRENDING_MAX_AGE_SECONDS = 2 * TRENDING_POLL_SECONDS
+
+TRENDING_TYPES = ("add", "drop")
+TRENDING_LOOKBACK_HOURS = 24
+TRENDING_LIMIT = 25
+
+TRENDING_SNAPSHOT_KEY_PREFIX = "trending_snapshot:"
+TRENDING_HISTORY_KEY_PREFIX = "trending_history:"
+
+# Latest snapshot per type, used when Redis is unavailable
+_latest: Dict[str, Dict[str, Any]] = {}
+# In-flight refresh per type
+_inflight: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+# Poller task
+_poller: Dict[str, Any] = {"task": None}
+
+
+def clear_trending_snapshots() -> None:
+    """Forget in-process snapshots and refreshes."""
+    _latest.clear()
+    _inflight.clear()
+
+
+async def _fetch_trending(client: httpx.AsyncClient, txn_type: str) -> List[Any]:
+    """Fetch the current trending list from Sleeper."""
+    response = await client.get(
+        f"{SLEEPER_BASE_URL}/players/nfl/trending/{txn_type}",
+        params={"lookback_hours": TRENDING_LOOKBACK_HOURS, "limit": TRENDING_LIMIT},
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+async def _store_snapshot(snapshot: Dict[str, Any]) -> None:
+    """Write a snapshot as the latest one and append it to the history."""
+    txn_type = snapshot["type"]
+    encoded = json.dumps(snapshot)
+    history_key = TRENDING_HISTORY_KEY_PREFIX + txn_type
+    history_seconds = int(TRENDING_HISTORY_HOURS * 3600)
+
+    r = get_async_redis_client()
+    async with r.pipeline(transaction=False) as pipe:
+        pipe.set(TRENDING_SNAPSHOT_KEY_PREFIX + txn_type, encoded, ex=history_seconds)
+        pipe.zadd(history_key, {encoded: snapshot["fetched_at"]})
+        pipe.zremrangebyscore(
+            history_key, "-inf", snapshot["fetched_at"] - history_seconds
+        )
+        pipe.expire(history_key, history_seconds)
+        await pipe.execute()
+
+
+async def take_trending_snapshot(
+    client: httpx.AsyncClient, txn_type: str
+) -> Dict[str, Any]:
+    """Fetch the trending list and record it as a snapshot.
+
+    Args:
+        client: HTTP client for Sleeper requests
+        txn_type: "add" or "drop"
+
+    Returns:
+        Snapshot dict with type, fetched_at (epoch seconds) and players
+        ([{"player_id", "count"}] as returned by Sleeper)
+    """
+    players = await _fetch_trending(client, txn_type)
+    snapshot = {"type": txn_type, "fetched_at": time.time(), "players": players}
+    _latest[txn_type] = snapshot
+
+    try:
+        await _store_snapshot(snapshot)
+    except Exception as e:
+        logger.warning(
+            f"Error storing trending snapshot (type={txn_type}, error_type={type(e).__name__}, error_message={str(e)})"
+        )
+    return snapshot
+
+
+async def _load_snapshot(txn_type: str) -> Optional[Dict[str, Any]]:
+    """Read the latest snapshot from Redis, falling back to this process's copy."""
+    try:
+        raw = await get_async_redis_client().get(
+            TRENDING_SNAPSHOT_KEY_PREFIX + txn_type
+        )
+    except Exception as e:
+        logger.warning(
+            f"Error reading trending snapshot (type={txn_type}, error_type={type(e).__name__}, error_message={str(e)})"
+        )
+        return _latest.get(txn_type)
+    return json.loads(raw) if raw else _latest.get(txn_type)
+
+
+async def get_trending_snapshot(
+    client: httpx.AsyncClient, txn_type: str
+) -> Dict[str, Any]:
+    """Return the latest trending snapshot, refreshing it if it is too old.
+
+    Concurrent refreshes of the same type share one fetch. If the refresh
+    fails and an older snapshot exists, the older snapshot is returned.
+
+    Args:
+        client: HTTP client for Sleeper requests
+        txn_type: "add" or "drop"
+
+    Returns:
+        Snapshot dict as returned by take_trending_snapshot
+
+    Raises:
+        httpx.HTTPError: If there is no snapshot and Sleeper cannot be reached
+    """
+    snapshot = await _load_snapshot(txn_type)
+    if snapshot and time.time() - snapshot["fetched_at"] < TRENDING_MAX_AGE_SECONDS:
+        return snapshot
+
+    loop = asyncio.get_running_loop()
+    task = _inflight.get(txn_type)
+    if task is None or task.done() or task.get_loop() is not loop:
+        task = loop.create_task(take_trending_snapshot(client, txn_type))
+        _inflight[txn_type] = task
+
+    try:
+        return await asyncio.shield(task)
+    except Exception as e:
+        if snapshot is None:
+            raise
+        logger.warning(
+            f"Trending refresh failed, serving older snapshot (type={txn_type}, error_type={type(e).__name__}, error_message={str(e)})"
+        )
+        return snapshot
+
+
+async def get_trending_history(
+    txn_type: str, since: float, until: Optional[float] = None
+) -> List[Dict[str, Any]]:
+    """Return stored snapshots taken between since and until, oldest first.
+
+    Args:
+        txn_type: "add" or "drop"
+        since: Epoch seconds of the earliest snapshot to return
+        until: Epoch seconds of the latest snapshot to return (default: now)
+
+    Returns:
+        List of snapshot dicts
+    """
+    raw = await get_async_redis_client().zrangebyscore(
+        TRENDING_HISTORY_KEY_PREFIX + txn_type,
+        since,
+        until if until is not None else "+inf",
+    )
+    return [json.loads(item) for item in raw]
+
+
+async def _baseline_snapshot(txn_type: str, cutoff: float) -> Optional[Dict[str, Any]]:
+    """Latest snapshot taken at or before cutoff, else the oldest one kept."""
+    r = get_async_redis_client()
+    history_key = TRENDING_HISTORY_KEY_PREFIX + txn_type
+    raw = await r.zrevrangebyscore(history_key, cutoff, "-inf", start=0, num=1)
+    if not raw:
+        raw = await r.zrange(history_key, 0, 0)
+    return json.loads(raw[0]) if raw else None
+
+
+def _counts(snapshot: Optional[Dict[str, Any]]) -> Dict[str, int]:
+    """player_id -> count for a snapshot."""
+    if not snapshot:
+        return {}
+    return {
+        str(item.get("player_id")): item.get("count", 0) for item in snapshot["players"]
+    }
+
+
+async def get_trending_delta(
+    client: httpx.AsyncClient, txn_type: str, window_minutes: int
+) -> Dict[str, Any]:
+    """Compare the latest snapshot with the one from window_minutes ago.
+
+    If the history does not reach back that far, the oldest stored snapshot
+    is used and baseline_at says how far back the comparison really goes.
+
+    Args:
+        client: HTTP client for Sleeper requests
+        txn_type: "add" or "drop"
+        window_minutes: How far back to compare
+
+    Returns:
+        Dict with type, current_at, baseline_at (None without history) and
+        changes: [{"player_id", "count", "previous_count", "change"}] for
+        players in either snapshot, largest increase first
+    """
+    current = await get_trending_snapshot(client, txn_type)
+    cutoff = current["fetched_at"] - window_minutes * 60
+    try:
+        baseline = await _baseline_snapshot(txn_type, cutoff)
+    except Exception as e:
+        logger.warning(
+            f"Error reading trending history (type={txn_type}, error_type={type(e).__name__}, error_message={str(e)})"
+        )
+        baseline = None
+    if baseline is not None and baseline["fetched_at"] >= current["fetched_at"]:
+        baseline = None
+
+    current_counts = _counts(current)
+    previous_counts = _counts(baseline)
+    changes = [
+        {
+            "player_id": player_id,
+            "count": current_counts.get(player_id, 0),
+            "previous_count": previous_counts.get(player_id, 0),
+            "change": current_counts.get(player_id, 0)
+            - previous_counts.get(player_id, 0),
+        }
+        for player_id in {**previous_counts, **current_counts}
+    ]
+    changes.sort(key=lambda item: (-item["change"], -item["count"]))
+
+    return {
+        "type": txn_type,
+        "window_minutes": window_minutes,
+        "current_at": current["fetched_at"],
+        "baseline_at": baseline["fetched_at"] if baseline else None,
+        "changes": changes if baseline else [],
+    }
+
+
+async def poll_trending_snapshots(
+    interval_seconds: float = TRENDING_POLL_SECONDS,
+) -> None:
+    """Snapshot every trending type every interval_seconds until cancelled."""
+    while True:
+        for txn_type in TRENDING_TYPES:
+            try:
+                await take_trending_snapshot(get_http_client(), txn_type)
+            except Exception as e:
+                logger.warning(
+                    f"Trending snapshot failed (type={txn_type}, error_type={type(e).__name__}, error_message={str(e)})"
+                )
+        await asyncio.sleep(interval_seconds)
+
+
+def start_trending_poller() -> None:
+    """Start the trending poller as a background task."""
+    _poller["task"] = asyncio.create_task(poll_trending_snapshots())
+    logger.info(f"Trending poller started (interval_seconds={TRENDING_POLL_SECONDS})")
+
+
+async def stop_trending_poller() -> None:
+    """Cancel the trending poller."""
+    task = _poller["task"]
+    _poller["task"] = None
+    if task is not None:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
@@ -0,0 +1,157 @@
+"""
+Read-only, lazily decoded views over the cached player set.
+
+Most readers of the player cache touch a few dozen players (roster
+enrichment, trending, transactions) but decoding the whole cache builds
+dicts for thousands. LazyPlayers keeps each player as its encoded JSON and
+decodes it on first access, so decode work and memory scale with the players
+actually read. ActivePlayersView applies the active filter as a view instead
+of building a second dict.
+
+The blob layout stores players as fragments for this:
+
+    {"format": "player-fragments",
+     "players": {player_id: "<player JSON>", ...},
+     "active_ids": [player_id, ...]}
+
+Blobs written before fragments (a plain {player_id: player} object) are
+still read; their players are already decoded.
+"""
+
+from typing import Any, Dict, FrozenSet, Iterator, Mapping, Optional, Union
+
+from cache_codec import dumps_json, loads_json
+
+PLAYER_FRAGMENTS_FORMAT = "player-fragments"
+
+
+def is_active_player(player: Dict[str, Any]) -> bool:
+    """Return True for active players that are on an NFL team."""
+    return player.get("active", False) is True and player.get("team") is not None
+
+
+class LazyPlayers(Mapping):
+    """Player mapping that decodes each player the first time it is read.
+
+    Values in `encoded` may be JSON (str or bytes) or already-decoded dicts.
+    Decoded players are shared between callers and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        encoded: Mapping[str, Union[str, bytes, Dict[str, Any]]],
+        active_ids: Optional[FrozenSet[str]] = None,
+    ):
+        self._encoded = encoded
+        self._decoded: Dict[str, Dict[str, Any]] = {}
+        # IDs of active players, when known without decoding everyone
+        self.active_ids = active_ids
+        # Shared by views derived with with_updates, and the players they
+        # replaced, so derived data can be patched instead of rebuilt
+        self.lineage = object()
+        self.updated_ids: FrozenSet[str] = frozenset()
+
+    def __getitem__(self, player_id: str) -> Dict[str, Any]:
+        player = self._decoded.get(player_id)
+        if player is None:
+            player = self._encoded[player_id]
+            if isinstance(player, (str, bytes)):
+                player = loads_json(player)
+            self._decoded[player_id] = player
+        return player
+
+    def __contains__(self, player_id: object) -> bool:
+        return player_id in self._encoded
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._encoded)
+
+    def __len__(self) -> int:
+        return len(self._encoded)
+
+    @property
+    def decoded_count(self) -> int:
+        """Number of players decoded so far."""
+        return len(self._decoded)
+
+    def with_updates(self, updated: Dict[str, Dict[str, Any]]) -> "LazyPlayers":
+        """Return a new view with some players replaced, sharing the rest."""
+        encoded = dict(self._encoded)
+        encoded.update(updated)
+
+        active_ids = self.active_ids
+        if active_ids is not None:
+            changed_active = {pid for pid, p in updated.items() if is_active_player(p)}
+            active_ids = frozenset((active_ids - updated.keys()) | changed_active)
+
+        view = LazyPlayers(encoded, active_ids)
+        view._decoded = {**self._decoded, **updated}
+        view.lineage = self.lineage
+        view.updated_ids = self.updated_ids | updated.keys()
+        return view
+
+    def fragment(self, player_id: str) -> str:
+        """Encoded JSON for one player, without decoding it."""
+        player = self._decoded.get(player_id, self._encoded[player_id])
+        if isinstance(player, bytes):
+            return player.decode("utf-8")
+        if isinstance(player, str):
+            return player
+        return dumps_json(player).decode("utf-8")
+
+
+class ActivePlayersView(Mapping):
+    """Active players of a player mapping, filtered on access, not copied."""
+
+    def __init__(self, players: Mapping[str, Dict[str, Any]]):
+        self._players = players
+        self._active_ids: Optional[FrozenSet[str]] = getattr(
+            players, "active_ids", None
+        )
+
+    def _ids(self) -> FrozenSet[str]:
+        if self._active_ids is None:
+            self._active_ids = frozenset(
+                pid for pid, player in self._players.items() if is_active_player(player)
+            )
+        return self._active_ids
+
+    def __contains__(self, player_id: object) -> bool:
+        if self._active_ids is not None:
+            return player_id in self._active_ids
+        player = self._players.get(player_id)
+        return player is not None and is_active_player(player)
+
+    def __getitem__(self, player_id: str) -> Dict[str, Any]:
+        if player_id not in self:
+            raise KeyError(player_id)
+        return self._players[player_id]
+
+    def __iter__(self) -> Iterator[str]:
+        ids = self._ids()
+        return (pid for pid in self._players if pid in ids)
+
+    def __len__(self) -> int:
+        return len(self._ids())
+
+
+def players_blob_payload(players: Mapping[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Build the fragments payload stored in the players blob."""
+    if isinstance(players, LazyPlayers):
+        fragments = {pid: players.fragment(pid) for pid in players}
+    else:
+        fragments = {
+            pid: dumps_json(player).decode("utf-8") for pid, player in players.items()
+        }
+    return {
+        "format": PLAYER_FRAGMENTS_FORMAT,
+        "players": fragments,
+        "active_ids": list(ActivePlayersView(players)),
+    }
+
+
+def players_from_blob_payload(payload: Dict[str, Any]) -> LazyPlayers:
+    """Wrap a decoded players blob (fragments or legacy) in a lazy view."""
+    if payload.get("format") == PLAYER_FRAGMENTS_FORMAT:
+        return LazyPlayers(payload["players"], frozenset(payload["active_ids"]))
+    return LazyPlayers(payload)
@@ -0,0 +1,144 @@
+"""
+PPR stat filtering for Sleeper weekly stats payloads.
+
+Shared by build_cache (weekly stats in the player cache), cache_client (live
+stats on spot refreshes) and the stats warehouse. A weekly payload maps
+several thousand player IDs to raw stat dicts; most of those players have no
+PPR points and are dropped. The filter checks pts_ppr first so those players
+cost one lookup, and builds each kept player's dict in a single pass over
+PPR_STAT_FIELDS.
+
+iter_ppr_relevant_stats is the streaming form: it takes (player_id, stats)
+pairs, e.g. from an incremental parser, and skips players outside an
+optional ID subset before looking at their stats.
+"""
+
+from typing import Any, Collection, Dict, Iterable, Iterator, Optional, Tuple
+
+# Sleeper stat field -> descriptive name, in output order
+PPR_STAT_FIELDS = {
+    # Core PPR score
+    "pts_ppr": "fantasy_points",
+    # Passing stats
+    "pass_yd": "passing_yards",
+    "pass_td": "passing_touchdowns",
+    "pass_int": "passing_interceptions",
+    "pass_2pt": "passing_two_point_conversions",
+    # Rushing stats
+    "rush_att": "carries",  # Rushing attempts
+    "rush_yd": "rushing_yards",
+    "rush_td": "rushing_touchdowns",
+    "rush_2pt": "rushing_two_point_conversions",
+    # Receiving stats (PPR)
+    "rec": "receptions",
+    "rec_tgt": "targets",
+    "rec_yd": "receiving_yards",
+    "rec_td": "receiving_touchdowns",
+    "rec_2pt": "receiving_two_point_conversions",
+    # Fumbles
+    "fum_lost": "fumbles_lost",
+    # Kicking stats
+    "fgm": "field_goals_made",
+    "fgm_0_19": "field_goals_made_0_19",
+    "fgm_20_29": "field_goals_made_20_29",
+    "fgm_30_39": "field_goals_made_30_39",
+    "fgm_40_49": "field_goals_made_40_49",
+    "fgm_50p": "field_goals_made_50_plus",
+    "fgmiss": "field_goals_missed",
+    "xpm": "extra_points_made",
+    "xpmiss": "extra_points_missed",
+    # Defensive stats (for IDP if used)
+    "def_td": "defensive_touchdowns",
+    "def_int": "defensive_interceptions",
+    "def_sack": "defensive_sacks",
+    "def_ff": "defensive_forced_fumbles",
+    "def_fr": "defensive_fumble_recoveries",
+    # Bonus stats that might affect scoring
+    "bonus_pass_yd_300": "bonus_passing_300_yards",
+    "bonus_pass_yd_400": "bonus_passing_400_yards",
+    "bonus_rush_yd_100": "bonus_rushing_100_yards",
+    "bonus_rush_yd_200": "bonus_rushing_200_yards",
+    "bonus_rec_yd_100": "bonus_receiving_100_yards",
+    "bonus_rec_yd_200": "bonus_receiving_200_yards",
+}
+
+_FIELDS = tuple(PPR_STAT_FIELDS.items())
+
+
+def transform_player_stats(player_stats: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Rename one player's PPR-relevant stats, dropping None and 0 values.
+
+    Returns:
+        The transformed stats, or None if the player has no PPR points
+    """
+    points = player_stats.get("pts_ppr")
+    if points is None or points == 0:
+        return None
+    get = player_stats.get
+    return {
+        name: value
+        for field, name in _FIELDS
+        if (value := get(field)) is not None and value != 0
+    }
+
+
+def iter_ppr_relevant_stats(
+    items: Iterable[Tuple[str, Any]],
+    player_ids: Optional[Collection[str]] = None,
+) -> Iterator[Tuple[str, Any]]:
+    """Yield filtered (player_id, stats) pairs from a stream of raw pairs.
+
+    Args:
+        items: (player_id, raw stats) pairs
+        player_ids: Only yield these players (default: all)
+
+    Yields:
+        Players with PPR points, with transformed stats; non-dict entries are
+        passed through unchanged
+    """
+    for player_id, player_stats in items:
+        if player_ids is not None and player_id not in player_ids:
+            continue
+        if not isinstance(player_stats, dict):
+            yield player_id, player_stats
+            continue
+        transformed = transform_player_stats(player_stats)
+        if transformed is not None:
+            yield player_id, transformed
+
+
+def filter_ppr_relevant_stats(
+    stats: Dict[str, Any], player_ids: Optional[Iterable[str]] = None
+) -> Dict[str, Any]:
+    """Filter stats to only include PPR points and contributing stats.
+    Also transforms field names to be more descriptive.
+
+    Args:
+        stats: Sleeper stats payload (player_id -> raw stats)
+        player_ids: Only filter these players (default: all). Only the
+            requested IDs are looked at, so a small subset of a full weekly
+            payload is cheap.
+
+    Returns:
+        player_id -> transformed stats for players with PPR points; non-dict
+        entries are passed through unchanged
+    """
+    if player_ids is not None:
+        items: Iterable[Tuple[str, Any]] = (
+            (player_id, stats[player_id])
+            for player_id in dict.fromkeys(player_ids)
+            if player_id in stats
+        )
+    else:
+        items = stats.items()
+
+    filtered = {}
+    for player_id, player_stats in items:
+        if isinstance(player_stats, dict):
+            transformed = transform_player_stats(player_stats)
+            if transformed is not None:
+                filtered[player_id] = transformed
+        else:
+            # Handle case where stats might not be a dict
+            filtered[player_id] = player_stats
+    return filtered
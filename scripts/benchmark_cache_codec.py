@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Compare cache blob codecs on a player cache snapshot.
+
+Times encode and decode and reports compressed size for the format used
+before codecs were configurable (json.dumps + gzip level 9) and for each
+codec in cache_codec.
+
+Usage:
+    python scripts/benchmark_cache_codec.py              # local backup file
+    python scripts/benchmark_cache_codec.py --file players.json
+    python scripts/benchmark_cache_codec.py --redis      # live cache blob
+    python scripts/benchmark_cache_codec.py --synthetic 2500
+"""
+
+import argparse
+import gzip
+import json
+import os
+import random
+import sys
+import timeit
+from typing import Any, Dict
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import cache_codec  # noqa: E402
+from build_cache import PLAYERS_BACKUP_PATH, PLAYERS_CACHE_KEY  # noqa: E402
+from player_views import players_from_blob_payload  # noqa: E402
+
+
+def synthetic_players(count: int) -> Dict[str, Any]:
+    """Players shaped like cache entries (metadata, projections, news)."""
+    rng = random.Random(0)
+    players = {}
+    for i in range(count):
+        players[str(i)] = {
+            "full_name": f"Player {i}",
+            "position": rng.choice(["QB", "RB", "WR", "TE", "K", "DEF"]),
+            "team": rng.choice(["KC", "BUF", "SF", "PHI", "DAL"]),
+            "status": "Active",
+            "age": rng.randint(21, 38),
+            "fantasy_positions": ["WR"],
+            "stats": {
+                "projected": {"fantasy_points": round(rng.uniform(0, 25), 2)},
+                "actual": {"fantasy_points": round(rng.uniform(0, 30), 2)},
+            },
+            "news": [
+                {"headline": f"Headline {i}-{n} " * 4, "date": "2025-10-01"}
+                for n in range(rng.randint(0, 3))
+            ],
+        }
+    return players
+
+
+def load_snapshot(args: argparse.Namespace) -> Dict[str, Any]:
+    if args.synthetic:
+        return synthetic_players(args.synthetic)
+    if args.redis:
+        from build_cache import get_redis_client
+
+        data = get_redis_client().get(PLAYERS_CACHE_KEY)
+        if not data:
+            sys.exit("No player blob in Redis (hash layout or empty cache)")
+        return dict(players_from_blob_payload(cache_codec.decode_blob(data)))
+    with open(args.file) as f:
+        return json.load(f)
+
+
+def legacy_encode(obj: Any) -> bytes:
+    return gzip.compress(json.dumps(obj).encode("utf-8"))
+
+
+def legacy_decode(data: bytes) -> Any:
+    return json.loads(gzip.decompress(data).decode("utf-8"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--file", default=PLAYERS_BACKUP_PATH)
+    parser.add_argument("--redis", action="store_true", help="Read the live blob")
+    parser.add_argument("--synthetic", type=int, help="Generate N players instead")
+    parser.add_argument("--number", type=int, default=5, help="Runs per timing")
+    args = parser.parse_args()
+
+    players = load_snapshot(args)
+    raw_size = len(json.dumps(players).encode("utf-8"))
+    print(f"{len(players)} players, {raw_size / 1024 / 1024:.2f} MB of JSON")
+    print(
+        f"orjson: {'yes' if cache_codec.orjson else 'no'}, "
+        f"zstandard: {'yes' if cache_codec.zstandard else 'no'}\n"
+    )
+
+    codecs = {"legacy gzip-9 + json": (legacy_encode, legacy_decode)}
+    for codec in (cache_codec.GZIP_JSON, cache_codec.ZSTD_JSON):
+        if cache_codec.resolve_codec(codec) == codec:
+            codecs[codec] = (
+                lambda obj, codec=codec: cache_codec.encode_blob(obj, codec),
+                cache_codec.decode_blob,
+            )
+
+    print(f"{'codec':22} {'encode ms':>10} {'decode ms':>10} {'size KB':>9}")
+    for label, (encode, decode) in codecs.items():
+        blob = encode(players)
+        assert decode(blob) == players
+        encode_ms = min(timeit.repeat(lambda: encode(players), number=args.number))
+        decode_ms = min(timeit.repeat(lambda: decode(blob), number=args.number))
+        print(
+            f"{label:22} {encode_ms / args.number * 1000:10.1f} "
+            f"{decode_ms / args.number * 1000:10.1f} {len(blob) / 1024:9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark filter_ppr_relevant_stats against the previous implementation.
+
+Runs both on a weekly Sleeper stats payload, checks the output is identical
+(including key order) and prints timings for the full payload and for a
+roster-sized player subset.
+
+Usage:
+    python scripts/benchmark_ppr_stats.py                  # fetch 2024 week 5
+    python scripts/benchmark_ppr_stats.py --season 2025 --week 3
+    python scripts/benchmark_ppr_stats.py --file week.json # saved payload
+    python scripts/benchmark_ppr_stats.py --synthetic 8000 # no network
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import timeit
+from typing import Any, Dict
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from ppr_stats import PPR_STAT_FIELDS, filter_ppr_relevant_stats  # noqa: E402
+
+
+def legacy_filter_ppr_relevant_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """The implementation previously duplicated in build_cache and cache_client."""
+    field_mapping = dict(PPR_STAT_FIELDS)
+
+    filtered = {}
+    for player_id, player_stats in stats.items():
+        if isinstance(player_stats, dict):
+            transformed_stats = {}
+            fantasy_points = None
+
+            for old_field, new_field in field_mapping.items():
+                if old_field in player_stats:
+                    value = player_stats[old_field]
+                    if value is not None and value != 0:
+                        transformed_stats[new_field] = value
+                        if old_field == "pts_ppr":
+                            fantasy_points = value
+
+            if fantasy_points is not None:
+                filtered[player_id] = transformed_stats
+        else:
+            filtered[player_id] = player_stats
+
+    return filtered
+
+
+def synthetic_payload(num_players: int) -> Dict[str, Any]:
+    """Payload shaped like a Sleeper week: most players have no PPR points."""
+    rng = random.Random(0)
+    fields = list(PPR_STAT_FIELDS) + [f"other_{i}" for i in range(40)]
+    payload = {}
+    for i in range(num_players):
+        stats = {
+            field: rng.choice([0, 1.0, 2.5, 12.0]) for field in rng.sample(fields, 45)
+        }
+        if rng.random() < 0.8:
+            stats.pop("pts_ppr", None)
+        payload[str(i)] = stats
+    return payload
+
+
+def load_payload(args: argparse.Namespace) -> Dict[str, Any]:
+    if args.synthetic:
+        return synthetic_payload(args.synthetic)
+    if args.file:
+        with open(args.file) as f:
+            return json.load(f)
+    url = f"https://api.sleeper.app/v1/stats/nfl/regular/{args.season}/{args.week}"
+    print(f"Fetching {url}...")
+    response = httpx.get(url, timeout=30.0)
+    response.raise_for_status()
+    return response.json()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--season", default="2024")
+    parser.add_argument("--week", type=int, default=5)
+    parser.add_argument("--file", help="Read the payload from a JSON file")
+    parser.add_argument("--synthetic", type=int, help="Generate N players instead")
+    parser.add_argument("--number", type=int, default=20, help="Runs per timing")
+    args = parser.parse_args()
+
+    payload = load_payload(args)
+    legacy = legacy_filter_ppr_relevant_stats(payload)
+    current = filter_ppr_relevant_stats(payload)
+    if json.dumps(legacy) != json.dumps(current):
+        print("Output differs from the previous implementation")
+        sys.exit(1)
+    print(f"{len(payload)} players in payload, {len(current)} with PPR points")
+
+    subset = list(current)[:15]
+    timings = {
+        "legacy, full payload": lambda: legacy_filter_ppr_relevant_stats(payload),
+        "shared, full payload": lambda: filter_ppr_relevant_stats(payload),
+        "shared, 15-player subset": lambda: filter_ppr_relevant_stats(
+            payload, player_ids=subset
+        ),
+    }
+    baseline = None
+    for label, func in timings.items():
+        ms = min(timeit.repeat(func, number=args.number, repeat=3)) / args.number * 1000
+        baseline = baseline or ms
+        print(f"{label:26} {ms:8.3f} ms  ({baseline / ms:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
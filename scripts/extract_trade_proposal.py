@@ -5,6 +5,7 @@ Returns lists of player Sleeper IDs to give and get, validated against team rost
 """
 
 import os
+import sys
 import json
 import asyncio
 from typing import Dict, Tuple, Optional
@@ -12,6 +13,11 @@ import anthropic
 import httpx
 from dotenv import load_dotenv
 
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.league_state import get_league_state  # noqa: E402
+
 load_dotenv()
 
 SLEEPER_API_BASE = "https://api.sleeper.app/v1"
@@ -24,7 +30,7 @@ class TradeProposalExtractor:
         self.roster_id = roster_id
         self.claude_client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
         self.http_client = httpx.AsyncClient(timeout=30.0)
-        self.league_rosters = {}
+        self.league_state = {}
         self.players_cache = {}
 
     async def __aenter__(self):
@@ -35,17 +41,11 @@ class TradeProposalExtractor:
         await self.http_client.aclose()
 
     async def load_league_data(self):
-        """Load all league rosters and player data."""
-        # Get all rosters
-        rosters_response = await self.http_client.get(
-            f"{SLEEPER_API_BASE}/league/{LEAGUE_ID}/rosters"
+        """Load the league ownership index and player data."""
+        # Shared player_id -> roster_id index
+        self.league_state = await get_league_state(
+            self.http_client, SLEEPER_API_BASE, LEAGUE_ID
         )
-        rosters_response.raise_for_status()
-        rosters = rosters_response.json()
-
-        # Map roster_id to player lists
-        for roster in rosters:
-            self.league_rosters[roster["roster_id"]] = roster.get("players", [])
 
         # Load players cache from Redis or API
         try:
@@ -147,8 +147,7 @@ Notes:
 
     def validate_player_on_roster(self, player_id: str, roster_id: int) -> bool:
         """Check if a player is on a specific roster."""
-        roster_players = self.league_rosters.get(roster_id, [])
-        return player_id in roster_players
+        return self.league_state["owners"].get(player_id) == roster_id
 
     async def extract_trade_proposal(self, trade_text: str) -> Dict:
         """
@@ -206,11 +205,9 @@ Notes:
             player_id, player_data = player_info
 
             # Try to find which roster has this player if not specified
-            if not other_roster_id:
-                for roster_id, players in self.league_rosters.items():
-                    if roster_id != self.roster_id and player_id in players:
-                        other_roster_id = roster_id
-                        break
+            owner = self.league_state["owners"].get(player_id)
+            if not other_roster_id and owner != self.roster_id:
+                other_roster_id = owner
 
             # Validate player is on the other roster
             if other_roster_id:
@@ -220,11 +217,7 @@ Notes:
                     )
             else:
                 # Check if player is on any roster
-                on_roster = None
-                for roster_id, players in self.league_rosters.items():
-                    if player_id in players:
-                        on_roster = roster_id
-                        break
+                on_roster = owner
 
                 if not on_roster:
                     result["validation_errors"].append(
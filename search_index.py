@@ -0,0 +1,203 @@
+"""
+Prebuilt player name search index.
+
+build_cache stores the index next to the player cache; cache_client loads it
+once per cache version and answers name searches from it without touching
+the full player map.
+
+Matches are ranked by tier (exact > prefix > substring > fuzzy), then by
+trigram similarity for fuzzy matches, then by roster relevance (active on a
+team, projected and rest-of-season points, depth chart position).
+"""
+
+from bisect import bisect_left
+from collections import Counter
+from typing import Any, Dict, List, Set, Tuple
+
+# Serialized index format version, bumped when the layout changes
+SEARCH_INDEX_FORMAT = 1
+
+EXACT = 3
+PREFIX = 2
+SUBSTRING = 1
+FUZZY = 0
+
+# Minimum trigram (Jaccard) similarity for a fuzzy match
+FUZZY_MIN_SIMILARITY = 0.35
+
+
+def normalize_name(name: str) -> str:
+    """Normalize player name for matching."""
+    return (
+        name.lower().replace(".", "").replace("'", "").replace("-", "").replace(" ", "")
+    )
+
+
+def _trigrams(key: str) -> Set[str]:
+    """Padded character trigrams of a normalized key."""
+    padded = f"  {key} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def player_name_keys(player: Dict[str, Any]) -> Set[str]:
+    """Normalized names a player can be found by.
+
+    Mirrors build_cache.build_name_lookup_table: full name, first + last name,
+    last name, the name without suffixes, and for defenses the team nickname
+    and abbreviation.
+    """
+    keys = set()
+    first_name = player.get("first_name") or ""
+    last_name = player.get("last_name") or ""
+
+    if player.get("position") == "DEF":
+        if first_name and last_name:
+            keys.add(normalize_name(f"{first_name} {last_name}"))
+            keys.add(normalize_name(last_name))
+        if player.get("team"):
+            keys.add(normalize_name(player["team"]))
+    elif player.get("full_name"):
+        full_name = normalize_name(player["full_name"])
+        keys.add(full_name)
+        for suffix in ("jr", "sr", "iii", "ii"):
+            if full_name.endswith(suffix) and len(full_name) > len(suffix):
+                keys.add(full_name[: -len(suffix)])
+                break
+        if first_name and last_name:
+            keys.add(normalize_name(f"{first_name} {last_name}"))
+        if last_name:
+            keys.add(normalize_name(last_name))
+
+    keys.discard("")
+    return keys
+
+
+def player_relevance(player: Dict[str, Any]) -> float:
+    """Roster relevance used to order players within a match tier."""
+    score = 0.0
+    if player.get("active") is True and player.get("team") is not None:
+        score += 1.0
+
+    stats = player.get("stats") or {}
+    projected = (stats.get("projected") or {}).get("fantasy_points")
+    if projected:
+        score += min(float(projected) / 20.0, 1.0)
+    ros_projected = (stats.get("ros_projected") or {}).get("fantasy_points")
+    if ros_projected:
+        score += min(float(ros_projected) / 200.0, 1.0)
+
+    depth = player.get("depth_chart_order")
+    if depth == 1:
+        score += 0.5
+    elif depth == 2:
+        score += 0.25
+
+    return round(score, 3)
+
+
+def build_search_index(players: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the serializable search index for a player map.
+
+    Args:
+        players: Enriched players keyed by Sleeper ID
+
+    Returns:
+        Dict with "format", "keys" (normalized name -> Sleeper IDs) and
+        "players" (Sleeper ID -> [relevance, active flag])
+    """
+    keys: Dict[str, List[str]] = {}
+    index_players: Dict[str, List[float]] = {}
+
+    for sleeper_id, player in players.items():
+        name_keys = player_name_keys(player)
+        if not name_keys:
+            continue
+        for key in name_keys:
+            keys.setdefault(key, []).append(sleeper_id)
+        active = player.get("active") is True and player.get("team") is not None
+        index_players[sleeper_id] = [player_relevance(player), int(active)]
+
+    return {"format": SEARCH_INDEX_FORMAT, "keys": keys, "players": index_players}
+
+
+def load_search_index(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Add the lookup structures needed for querying to a serialized index."""
+    trigram_keys: Dict[str, List[str]] = {}
+    trigram_counts: Dict[str, int] = {}
+    for key in data["keys"]:
+        grams = _trigrams(key)
+        trigram_counts[key] = len(grams)
+        for gram in grams:
+            trigram_keys.setdefault(gram, []).append(key)
+
+    return {
+        **data,
+        "sorted_keys": sorted(data["keys"]),
+        "trigram_keys": trigram_keys,
+        "trigram_counts": trigram_counts,
+    }
+
+
+def query_search_index(
+    index: Dict[str, Any], query: str, limit: int = 10, active_only: bool = True
+) -> List[str]:
+    """Return Sleeper IDs matching a name query, best match first.
+
+    Args:
+        index: Index returned by load_search_index
+        query: Player name (or part of one) to search for
+        limit: Maximum number of IDs to return
+        active_only: Skip inactive players and free agents without a team
+
+    Returns:
+        Matching Sleeper IDs, ranked
+    """
+    normalized = normalize_name(query)
+    if not normalized:
+        return []
+
+    keys = index["keys"]
+    index_players = index["players"]
+    best: Dict[str, Tuple[int, float, float]] = {}
+
+    def add(key: str, tier: int, similarity: float = 1.0) -> None:
+        for sleeper_id in keys[key]:
+            relevance, active = index_players.get(sleeper_id, (0.0, 0))
+            if active_only and not active:
+                continue
+            rank = (tier, similarity, relevance)
+            if rank > best.get(sleeper_id, (-1, 0.0, 0.0)):
+                best[sleeper_id] = rank
+
+    # Exact and prefix matches from the sorted key list
+    sorted_keys = index["sorted_keys"]
+    position = bisect_left(sorted_keys, normalized)
+    while position < len(sorted_keys) and sorted_keys[position].startswith(normalized):
+        key = sorted_keys[position]
+        add(key, EXACT if key == normalized else PREFIX)
+        position += 1
+
+    if len(normalized) < 3:
+        # Too short for trigrams to find interior substrings
+        for key in keys:
+            if normalized in key and not key.startswith(normalized):
+                add(key, SUBSTRING)
+    else:
+        # Substring and fuzzy matches from keys sharing trigrams with the query
+        query_grams = _trigrams(normalized)
+        shared = Counter(
+            key for gram in query_grams for key in index["trigram_keys"].get(gram, ())
+        )
+        trigram_counts = index["trigram_counts"]
+        for key, count in shared.items():
+            if key.startswith(normalized):
+                continue
+            if normalized in key:
+                add(key, SUBSTRING)
+                continue
+            similarity = count / (len(query_grams) + trigram_counts[key] - count)
+            if similarity >= FUZZY_MIN_SIMILARITY:
+                add(key, FUZZY, round(similarity, 3))
+
+    ranked = sorted(best, key=best.__getitem__, reverse=True)
+    return ranked[:limit]
@@ -5,22 +5,60 @@ import httpx
 import os
 import logging
 import asyncio
+from contextlib import asynccontextmanager
 from contextvars import ContextVar
 from datetime import datetime
 from zoneinfo import ZoneInfo
 from dotenv import load_dotenv
 from fastmcp import FastMCP
 from typing import Optional, List, Dict, Any
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.middleware import Middleware
 from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 from cache_client import (
-    get_players_from_cache,
-    search_players as search_players_unified,
-    get_player_by_id,
+    close_async_redis_client,
+    get_players_by_ids_async,
+    get_players_from_cache_async,
+    search_players_async as search_players_unified,
+    get_player_by_id_async,
     spot_refresh_player_stats,
 )
 import logfire
+from lib.cache_warmup import (
+    CACHE_WARMUP_ENABLED,
+    get_warmup_status,
+    start_cache_warmup,
+    stop_cache_warmup,
+)
 from lib.decorators import log_mcp_tool
+from lib.free_agent_pool import get_free_agent_pool, query_free_agent_pool
+from lib.http_client import FANTASY_NERDS, close_http_clients, get_http_client
+from lib.league_context import (
+    DEFAULT_LEAGUE_ID,
+    current_league_id,
+    use_league,
+    validate_league_id,
+)
+from lib.league_state import get_league_state
+from lib.live_feed import sse_stream, stop_live_feeds, subscribe
+from lib.live_scoring import get_live_scoreboard, refresh_live_scoreboard
+from lib.request_context import memoized
+from lib.trending_snapshots import (
+    TRENDING_POLL_ENABLED,
+    get_trending_delta,
+    get_trending_snapshot,
+    start_trending_poller,
+    stop_trending_poller,
+)
+from lib.sleeper_cache import fetch_sleeper_json
+from lib.stats_matrix import (
+    NUMPY_AVAILABLE,
+    get_stats_matrix_async,
+    season_rankings,
+)
+from lib.stats_warehouse import ensure_season_stats, query_player_weeks_async
+from lib.transaction_store import query_transactions_async, sync_transactions
 from lib.validation import (
     validate_roster_id,
     validate_week,
@@ -30,7 +68,8 @@ from lib.validation import (
     create_error_response,
 )
 from lib.enrichment import (
-    enrich_player_minimal,
+    collect_transaction_player_ids,
+    enrich_transaction_moves,
     get_trending_data_map,
     get_recent_drops_set,
     add_trending_data,
@@ -60,8 +99,8 @@ logger = logging.getLogger(__name__)
 # Auto-instrument httpx for HTTP request tracing
 logfire.instrument_httpx()
 
-# Log that the server is starting
-LEAGUE_ID = os.environ.get("SLEEPER_LEAGUE_ID", "1266471057523490816")
+# Default league; connections can pick another with ?league_id= (see lib.league_context)
+LEAGUE_ID = DEFAULT_LEAGUE_ID
 logger.info(f"Initializing Token Bowl MCP Server with league_id={LEAGUE_ID}")
 
 # Initialize FastMCP server
@@ -87,14 +126,14 @@ async def get_league_info() -> Dict[str, Any]:
     - Scoring settings and rules
     - Playoff configuration and schedule
     - Draft settings and keeper rules
-    - League ID: Configured via SLEEPER_LEAGUE_ID env var (default: 1266471057523490816)
+    - League ID: Picked per connection with ?league_id=, otherwise the SLEEPER_LEAGUE_ID env var (default: 1266471057523490816)
 
     Returns:
         Dict containing all league configuration and settings
     """
     from lib.league_tools import fetch_league_info
 
-    return await fetch_league_info(LEAGUE_ID, BASE_URL)
+    return await fetch_league_info(current_league_id(), BASE_URL)
 
 
 @mcp.tool()
@@ -128,7 +167,7 @@ async def get_league_rosters(include_details: bool = False) -> List[Dict[str, An
     """
     from lib.league_tools import fetch_league_rosters
 
-    rosters = await fetch_league_rosters(LEAGUE_ID, BASE_URL)
+    rosters = await fetch_league_rosters(current_league_id(), BASE_URL)
 
     if not include_details:
         # Return minimal roster info (reduces ~600 tokens)
@@ -185,7 +224,7 @@ async def get_roster(roster_id: int) -> Dict[str, Any]:
             expected="integer between 1 and 10",
         )
 
-    return await fetch_roster_with_enrichment(roster_id, LEAGUE_ID, BASE_URL)
+    return await fetch_roster_with_enrichment(roster_id, current_league_id(), BASE_URL)
 
 
 @mcp.tool()
@@ -206,7 +245,7 @@ async def get_league_users() -> List[Dict[str, Any]]:
     """
     from lib.league_tools import fetch_league_users
 
-    return await fetch_league_users(LEAGUE_ID, BASE_URL)
+    return await fetch_league_users(current_league_id(), BASE_URL)
 
 
 @mcp.tool()
@@ -244,7 +283,71 @@ async def get_league_matchups(week: int) -> List[Dict[str, Any]]:
             )
         ]
 
-    return await fetch_league_matchups(LEAGUE_ID, week, BASE_URL)
+    return await fetch_league_matchups(current_league_id(), week, BASE_URL)
+
+
+@mcp.tool()
+@log_mcp_tool
+async def get_live_scores(
+    week: int, since_version: Optional[int] = None
+) -> Dict[str, Any]:
+    """Get live projected vs. actual scores and win probabilities for a week.
+
+    Built for polling during games: the scoreboard is recomputed at most every
+    few seconds no matter how often it is requested, and passing the version
+    from the previous response returns only what changed since.
+
+    Clients connected over HTTP can instead subscribe to pushed updates with
+    GET /live/{week} (Server-Sent Events, optional roster_id query parameter).
+
+    Args:
+        week: The NFL week number (1-18)
+        since_version: Version from a previous response. Only teams and
+                      matchups that changed after it are returned. Omit for
+                      the full scoreboard.
+
+    Returns:
+        Dict with:
+        - version: Pass as since_version on the next poll
+        - full: True if the full scoreboard is returned (first poll, or a
+          version from before a server restart)
+        - phase: "live", "final" or "upcoming"
+        - teams: roster_id -> actual, remaining, projected_final and
+          per-starter actual/projected/remaining points
+        - matchups: matchup_id -> roster_ids and win_probability per roster_id
+    """
+    try:
+        week = validate_week(week)
+    except ValueError as e:
+        logger.error(f"Week validation failed: {e}")
+        return create_error_response(
+            str(e),
+            value_received=str(week)[:100],
+            expected="integer between 1 and 18",
+        )
+
+    if since_version is not None:
+        try:
+            since_version = int(since_version)
+        except (TypeError, ValueError):
+            return create_error_response(
+                "Invalid since_version parameter",
+                value_received=str(since_version)[:100],
+                expected="integer version from a previous response",
+            )
+
+    league_id = current_league_id()
+    try:
+        return await get_live_scoreboard(
+            get_http_client(), BASE_URL, league_id, week, since_version
+        )
+    except Exception as e:
+        logger.error(
+            f"Failed to get live scores (league_id={league_id}, week={week}, "
+            f"error_type={type(e).__name__}, error_message={str(e)})",
+            exc_info=True,
+        )
+        return create_error_response(f"Failed to get live scores: {str(e)}", week=week)
 
 
 @mcp.tool()
@@ -298,7 +401,7 @@ async def get_league_transactions(round: int = 1) -> List[Dict[str, Any]]:
             }
         ]
 
-    return await fetch_league_transactions(LEAGUE_ID, round, BASE_URL)
+    return await fetch_league_transactions(current_league_id(), round, BASE_URL)
 
 
 @mcp.tool()
@@ -407,112 +510,49 @@ async def get_recent_transactions(
                 }
             ]
 
-    # Fetch transactions from the last 10 rounds to ensure we have enough
-    all_transactions = []
-
-    async with httpx.AsyncClient() as client:
-        # Fetch multiple rounds in parallel
-        tasks = []
-        for round_num in range(1, 11):  # Get rounds 1-10
-            tasks.append(
-                client.get(f"{BASE_URL}/league/{LEAGUE_ID}/transactions/{round_num}")
-            )
-
-        responses = await asyncio.gather(*tasks, return_exceptions=True)
-
-        for response in responses:
-            if isinstance(response, Exception):
-                continue  # Skip failed requests
-            if response.status_code == 200:
-                transactions = response.json()
-                if transactions:  # Some rounds may be empty
-                    all_transactions.extend(transactions)
+    # Sync the local transaction log (throttled), then answer from its index
+    league_id = current_league_id()
+    await memoized(
+        ("transaction_sync", league_id),
+        lambda: sync_transactions(get_http_client(), BASE_URL, league_id),
+    )
+    transactions = await query_transactions_async(
+        league_id=league_id,
+        limit=limit,
+        transaction_type=transaction_type,
+        include_failed=include_failed,
+        drops_only=drops_only,
+        min_days_ago=min_days_ago,
+        max_days_ago=max_days_ago,
+    )
+
+    # Players are looked up in one batch for the returned rows only, so names,
+    # teams and positions are current however long ago a round was synced
+    player_ids = collect_transaction_player_ids(transactions)
+    players = await get_players_by_ids_async(player_ids) if player_ids else {}
+    players = players or {}
 
-    # Get player data from cache for enrichment
-    from cache_client import get_player_by_id
-
-    # Get current timestamp for date calculations
     current_time = datetime.now()
-
-    # Apply filters and enrich with player data
-    filtered_transactions = []
-    for txn in all_transactions:
-        # Filter by status (exclude failed unless requested)
-        if not include_failed and txn.get("status") == "failed":
-            continue
-
-        # Filter by type if specified
-        if transaction_type and txn.get("type") != transaction_type:
-            continue
-
-        # Filter for drops only if requested
-        if drops_only and not txn.get("drops"):
-            continue
-
+    for txn in transactions:
         # Calculate days since transaction if we have a timestamp
         days_since = None
         if txn.get("status_updated"):
             # Convert milliseconds to datetime
             txn_time = datetime.fromtimestamp(txn["status_updated"] / 1000)
             days_since = (current_time - txn_time).days
-
-            # Apply date range filters
-            if min_days_ago is not None and days_since < min_days_ago:
-                continue
-            if max_days_ago is not None and days_since > max_days_ago:
-                continue
-
-            # Add days_since to transaction
             txn["days_since_transaction"] = days_since
 
-        # Enrich "adds" with player data
-        if txn.get("adds"):
-            enriched_adds = {}
-            for player_id, roster_id in txn["adds"].items():
-                player_data = get_player_by_id(player_id)
-                enriched_add = {
-                    "roster_id": roster_id,
-                    "player_name": player_data.get("full_name")
-                    if player_data
-                    else "Unknown",
-                    "team": player_data.get("team") if player_data else None,
-                    "position": player_data.get("position") if player_data else None,
-                }
-                # Include full details if requested
-                if include_player_details and player_data:
-                    enriched_add["player_data"] = player_data
-                enriched_adds[player_id] = enriched_add
-            txn["adds"] = enriched_adds
-
-        # Enrich "drops" with player data
-        if txn.get("drops"):
-            enriched_drops = {}
-            for player_id, roster_id in txn["drops"].items():
-                player_data = get_player_by_id(player_id)
-                enriched_drop = {
-                    "roster_id": roster_id,
-                    "player_name": player_data.get("full_name")
-                    if player_data
-                    else "Unknown",
-                    "team": player_data.get("team") if player_data else None,
-                    "position": player_data.get("position") if player_data else None,
-                }
+        for action in ("adds", "drops"):
+            txn[action] = enrich_transaction_moves(txn.get(action), players)
+            for player_id, move in (txn.get(action) or {}).items():
                 # Include full details if requested
-                if include_player_details and player_data:
-                    enriched_drop["player_data"] = player_data
+                if include_player_details and player_id in players:
+                    move["player_data"] = players[player_id]
                 # Add days since drop for drops_only mode
-                if drops_only and days_since is not None:
-                    enriched_drop["days_since_dropped"] = days_since
-                enriched_drops[player_id] = enriched_drop
-            txn["drops"] = enriched_drops
+                if action == "drops" and drops_only and days_since is not None:
+                    move["days_since_dropped"] = days_since
 
-        filtered_transactions.append(txn)
-
-    # Sort by status_updated timestamp (most recent first)
-    filtered_transactions.sort(key=lambda x: x.get("status_updated", 0), reverse=True)
-
-    # Return up to the limit (max 20 transactions)
-    return filtered_transactions[:limit]
+    return transactions
 
 
 @mcp.tool()
@@ -533,7 +573,7 @@ async def get_league_traded_picks() -> List[Dict[str, Any]]:
     """
     from lib.league_tools import fetch_league_traded_picks
 
-    return await fetch_league_traded_picks(LEAGUE_ID, BASE_URL)
+    return await fetch_league_traded_picks(current_league_id(), BASE_URL)
 
 
 @mcp.tool()
@@ -555,7 +595,7 @@ async def get_league_drafts() -> List[Dict[str, Any]]:
     """
     from lib.league_tools import fetch_league_drafts
 
-    return await fetch_league_drafts(LEAGUE_ID, BASE_URL)
+    return await fetch_league_drafts(current_league_id(), BASE_URL)
 
 
 @mcp.tool()
@@ -577,7 +617,7 @@ async def get_league_winners_bracket() -> List[Dict[str, Any]]:
     """
     from lib.league_tools import fetch_league_winners_bracket
 
-    return await fetch_league_winners_bracket(LEAGUE_ID, BASE_URL)
+    return await fetch_league_winners_bracket(current_league_id(), BASE_URL)
 
 
 @mcp.tool()
@@ -618,10 +658,10 @@ async def get_user(username_or_id: str) -> Dict[str, Any]:
             "expected": "non-empty string (username or user ID)",
         }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{BASE_URL}/user/{username_or_id}")
-        response.raise_for_status()
-        return response.json()
+    client = get_http_client()
+    response = await client.get(f"{BASE_URL}/user/{username_or_id}")
+    response.raise_for_status()
+    return response.json()
 
 
 # Commented out - this MCP server is for a specific league (Token Bowl)
@@ -768,9 +808,7 @@ async def search_players_by_name(name: str) -> List[Dict[str, Any]]:
                 }
             ]
 
-        # Run sync function in executor
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, search_players_unified, name)
+        result = await search_players_unified(name)
 
         # Spot refresh stats for found players
         if result:
@@ -779,9 +817,9 @@ async def search_players_by_name(name: str) -> List[Dict[str, Any]]:
                 logger.info(
                     f"Spot refreshing stats for {len(player_ids)} searched players"
                 )
-                spot_refresh_player_stats(player_ids)
+                await spot_refresh_player_stats(player_ids)
                 # Re-fetch the results to get updated stats
-                result = await loop.run_in_executor(None, search_players_unified, name)
+                result = await search_players_unified(name)
 
         return result if result else []
     except Exception as e:
@@ -830,11 +868,10 @@ async def get_player_by_sleeper_id(player_id: str) -> Optional[Dict[str, Any]]:
 
         # Spot refresh stats for this specific player
         logger.info(f"Spot refreshing stats for player {player_id}")
-        spot_refresh_player_stats({player_id})
+        await spot_refresh_player_stats({player_id})
 
-        # Run sync function in executor to get updated data
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, get_player_by_id, player_id)
+        # Get updated data
+        result = await get_player_by_id_async(player_id)
         return result if result else None
     except Exception as e:
         logger.error(
@@ -919,18 +956,22 @@ async def get_trending_players(
                 )
             ]
 
-    # Always use 24 hour lookback, fetch 25 players from API (filter after enrichment)
-    params = {"lookback_hours": 24, "limit": 25}
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{BASE_URL}/players/nfl/trending/{type}", params=params
+    # Latest 24 hour snapshot of the top 25 players (filter after enrichment);
+    # composite tools (waiver wire, search) share one read per request
+    snapshot = await memoized(
+        ("trending", type),
+        lambda: get_trending_snapshot(get_http_client(), type),
+        copy_result=True,
+    )
+    trending_data = snapshot["players"]
+
+    # Get cached player data for enrichment in one lookup
+    all_players = (
+        await get_players_by_ids_async(
+            str(item.get("player_id")) for item in trending_data
         )
-        response.raise_for_status()
-        trending_data = response.json()
-
-    # Get cached player data for enrichment
-    all_players = get_players_from_cache(active_only=False)
+        or {}
+    )
 
     # Enrich trending data with full player information
     enriched_trending = []
@@ -956,6 +997,93 @@ async def get_trending_players(
     return enriched_trending[:limit]
 
 
+@mcp.tool()
+@log_mcp_tool
+async def get_trending_changes(
+    type: str = "add", window_minutes: int = 60, limit: int = 10
+) -> Dict[str, Any]:
+    """Get how trending add/drop counts changed over a recent time window.
+
+    Compares the latest trending snapshot with the one taken window_minutes
+    ago, showing which players are gaining momentum right now rather than
+    over the whole 24 hour window.
+
+    Args:
+        type: Transaction type to track (default: "add")
+              Must be exactly "add" or "drop" (case-sensitive).
+        window_minutes: How far back to compare, in minutes (default: 60, max: 2880).
+              Can be integer or string (will be converted).
+        limit: Maximum number of players to return (default: 10, max: 25).
+              Can be integer or string (will be converted).
+
+    Returns:
+        Dict with the snapshot times compared and players sorted by the
+        largest count increase (name, position, team, count, previous_count,
+        change). baseline_at is null until snapshot history is available.
+    """
+    valid_types = ["add", "drop"]
+    if type not in valid_types:
+        logger.error(f"Invalid trending type: {type}")
+        return create_error_response(
+            "Invalid type parameter",
+            value_received=str(type)[:100],
+            valid_values=valid_types,
+        )
+
+    try:
+        window_minutes = validate_limit(window_minutes, max_value=2880)
+    except ValueError as e:
+        logger.error(f"Window validation failed: {e}")
+        return create_error_response(
+            "Invalid window_minutes parameter",
+            value_received=str(window_minutes)[:100],
+            expected="integer between 1 and 2880",
+        )
+
+    try:
+        limit = validate_limit(limit, max_value=25)
+    except ValueError as e:
+        logger.error(f"Limit validation failed: {e}")
+        return create_error_response(
+            str(e),
+            value_received=str(limit)[:100],
+            expected="integer between 1 and 25",
+        )
+
+    try:
+        delta = await get_trending_delta(get_http_client(), type, window_minutes)
+        changes = delta["changes"][:limit]
+
+        players = (
+            await get_players_by_ids_async(item["player_id"] for item in changes) or {}
+        )
+        for item in changes:
+            player_data = players.get(item["player_id"], {})
+            item["name"] = player_data.get("full_name")
+            item["position"] = player_data.get("position")
+            item["team"] = player_data.get("team")
+
+        return {
+            "type": type,
+            "window_minutes": window_minutes,
+            "current_at": datetime.fromtimestamp(delta["current_at"]).isoformat(),
+            "baseline_at": (
+                datetime.fromtimestamp(delta["baseline_at"]).isoformat()
+                if delta["baseline_at"]
+                else None
+            ),
+            "players": changes,
+        }
+
+    except Exception as e:
+        logger.error(
+            f"Failed to get trending changes (type={type}, window_minutes={window_minutes}, "
+            f"error_type={e.__class__.__name__}, error_message={str(e)})",
+            exc_info=True,
+        )
+        return {"error": f"Failed to get trending changes: {str(e)}"}
+
+
 @mcp.tool()
 @log_mcp_tool
 async def get_player_stats_all_weeks(
@@ -1017,7 +1145,7 @@ async def get_player_stats_all_weeks(
                 }
 
         # Get player info from cache first
-        player_data = get_player_by_id(player_id)
+        player_data = await get_player_by_id_async(player_id)
         if not player_data:
             return {
                 "error": f"Player with ID {player_id} not found",
@@ -1025,13 +1153,10 @@ async def get_player_stats_all_weeks(
             }
 
         # Get current season and week info
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            state_response = await client.get(f"{BASE_URL}/state/nfl")
-            state_response.raise_for_status()
-            state = state_response.json()
+        state = await fetch_sleeper_json(get_http_client(), f"{BASE_URL}/state/nfl")
 
-            current_season = season or str(state.get("season", datetime.now().year))
-            current_week = state.get("week", 1)
+        current_season = season or str(state.get("season", datetime.now().year))
+        current_week = state.get("week", 1)
 
         logger.info(
             f"Fetching all weeks stats for player {player_id} in season {current_season} (up to week {current_week})"
@@ -1055,73 +1180,41 @@ async def get_player_stats_all_weeks(
             },
         }
 
-        # Import the filter function from cache_client
-        from cache_client import filter_ppr_relevant_stats
-
-        # Fetch stats for all weeks concurrently
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            # Create tasks for all weeks
-            tasks = []
-            for week in range(1, current_week + 1):
-                url = f"{BASE_URL}/stats/nfl/regular/{current_season}/{week}"
-                tasks.append(client.get(url))
-
-            # Execute all requests concurrently
-            responses = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Process each week's response
-            for week_num, response in enumerate(responses, start=1):
-                if isinstance(response, Exception):
-                    logger.warning(
-                        f"Failed to fetch week stats (week_num={week_num}, player_id={player_id}, "
-                        f"error_type={type(response).__name__}, error_message={str(response)})"
-                    )
-                    continue
-
-                try:
-                    response.raise_for_status()
-                    week_stats = response.json()
+        # Bring the local warehouse up to date: completed weeks are fetched
+        # once, the week in progress is refreshed periodically
+        season_year = int(current_season)
+        await ensure_season_stats(get_http_client(), BASE_URL, season_year, state)
 
-                    # Filter to PPR-relevant stats
-                    filtered_stats = filter_ppr_relevant_stats(week_stats)
+        player_weeks = await query_player_weeks_async(
+            season_year, [player_id], weeks=range(1, current_week + 1)
+        )
 
-                    # Check if player has stats for this week
-                    if player_id in filtered_stats:
-                        player_week_stats = filtered_stats[player_id]
+        for week_num, player_week_stats in sorted(
+            player_weeks.get(player_id, {}).items()
+        ):
+            # Extract fantasy points
+            fantasy_points = player_week_stats.get("fantasy_points", 0)
 
-                        # Extract fantasy points
-                        fantasy_points = player_week_stats.get("fantasy_points", 0)
+            # Separate game stats from fantasy points
+            game_stats = {
+                k: v for k, v in player_week_stats.items() if k != "fantasy_points"
+            }
 
-                        # Separate game stats from fantasy points
-                        game_stats = {
-                            k: v
-                            for k, v in player_week_stats.items()
-                            if k != "fantasy_points"
-                        }
+            # Add to weekly stats
+            result["weekly_stats"][str(week_num)] = {
+                "fantasy_points": round(fantasy_points, 2),
+                "game_stats": game_stats if game_stats else None,
+            }
 
-                        # Add to weekly stats
-                        result["weekly_stats"][str(week_num)] = {
-                            "fantasy_points": round(fantasy_points, 2),
-                            "game_stats": game_stats if game_stats else None,
-                        }
+            # Update totals
+            result["totals"]["fantasy_points"] += fantasy_points
+            result["totals"]["games_played"] += 1
 
-                        # Update totals
-                        result["totals"]["fantasy_points"] += fantasy_points
-                        result["totals"]["games_played"] += 1
-
-                        # Aggregate game stats in totals
-                        for stat_key, stat_value in game_stats.items():
-                            if stat_key not in result["totals"]:
-                                result["totals"][stat_key] = 0
-                            result["totals"][stat_key] += stat_value
-
-                except Exception as e:
-                    logger.error(
-                        f"Failed to process week stats (week_num={week_num}, player_id={player_id}, "
-                        f"error_type={type(e).__name__}, error_message={str(e)})",
-                        exc_info=True,
-                    )
-                    continue
+            # Aggregate game stats in totals
+            for stat_key, stat_value in game_stats.items():
+                if stat_key not in result["totals"]:
+                    result["totals"][stat_key] = 0
+                result["totals"][stat_key] += stat_value
 
         # Round the total fantasy points
         result["totals"]["fantasy_points"] = round(
@@ -1153,6 +1246,99 @@ async def get_player_stats_all_weeks(
         }
 
 
+@mcp.tool()
+@log_mcp_tool
+async def get_season_rankings(
+    position: Optional[str] = None, season: Optional[str] = None, limit: int = 25
+) -> Dict[str, Any]:
+    """Rank NFL players by total PPR fantasy points for a season.
+
+    Args:
+        position: Filter by position (optional)
+                 Valid values: "QB", "RB", "WR", "TE", "DEF", "K"
+                 Case-insensitive. Returns all positions if not specified.
+        season: The season year (optional). Can be integer or string.
+               Valid range: 2009-2030. Defaults to current season if not provided.
+        limit: Maximum number of players to return (default: 25, max: 200).
+               Can be integer or string (will be converted).
+
+    Returns:
+        Dict with the season, weeks covered and ranked players, each with
+        total and per-game fantasy points, games played, standard deviation
+        of weekly points (consistency), average over the last 3 weeks
+        and percentile among players at the same position.
+    """
+    if not NUMPY_AVAILABLE:
+        return {"error": "Season rankings require numpy, which is not installed"}
+
+    try:
+        position = validate_position(position)
+    except ValueError as e:
+        logger.error(f"Position validation failed: {e}")
+        return create_error_response(
+            str(e),
+            value_received=str(position)[:100],
+            valid_values=["QB", "RB", "WR", "TE", "DEF", "K"],
+        )
+
+    if season is not None:
+        season = str(season).strip()
+        try:
+            year = int(season)
+            if year < 2009 or year > 2030:
+                raise ValueError("Year out of range")
+        except ValueError:
+            logger.error(f"Invalid season format: {season}")
+            return create_error_response(
+                "Invalid season parameter",
+                value_received=str(season)[:100],
+                expected="year string (e.g., '2025')",
+            )
+
+    try:
+        limit = validate_limit(limit, max_value=200)
+    except ValueError as e:
+        logger.error(f"Limit validation failed: {e}")
+        return create_error_response(
+            str(e),
+            value_received=str(limit)[:100],
+            expected="integer between 1 and 200",
+        )
+
+    try:
+        state = await fetch_sleeper_json(get_http_client(), f"{BASE_URL}/state/nfl")
+        season_year = int(season or state.get("season", datetime.now().year))
+        await ensure_season_stats(get_http_client(), BASE_URL, season_year, state)
+
+        matrix = await get_stats_matrix_async(season_year)
+        players = await get_players_by_ids_async(matrix["player_ids"]) or {}
+        positions = {
+            player_id: players.get(player_id, {}).get("position")
+            for player_id in matrix["player_ids"]
+        }
+
+        ranked = season_rankings(matrix, positions, position=position, limit=limit)
+        for item in ranked:
+            player_data = players.get(item["player_id"], {})
+            item["name"] = player_data.get("full_name")
+            item["team"] = player_data.get("team")
+
+        return {
+            "season": season_year,
+            "position": position,
+            "weeks": matrix["values"].shape[1],
+            "players": ranked,
+        }
+
+    except Exception as e:
+        logger.error(
+            f"Failed to get season rankings (position={position}, season={season}, "
+            f"error_type={type(e).__name__}, error_message={str(e)})",
+            exc_info=True,
+        )
+        return {"error": f"Failed to get season rankings: {str(e)}"}
+
+
 @mcp.tool()
 @log_mcp_tool
 async def get_waiver_wire_players(
@@ -1195,7 +1381,9 @@ async def get_waiver_wire_players(
     - Cache freshness information
 
     Note: Cache refreshes daily. Recent adds/drops may not be reflected
-    immediately in player details, but roster data is fetched live.
+    immediately in player details. Rosters come from the Sleeper response
+    cache: usually under a minute old, but up to 11 minutes old on the first
+    call after a quiet spell (that call also refreshes them for the next one).
 
     Returns:
         Dict with available players and metadata
@@ -1230,21 +1418,19 @@ async def get_waiver_wire_players(
             if not search_term:
                 search_term = None  # Treat empty string as None
 
-        # Get all current rosters to find rostered players (if verify_availability is True)
-        rostered_players = set()
+        # Rostered players from the shared ownership index (if verify_availability is True)
+        rostered_players = frozenset()
         if verify_availability:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(f"{BASE_URL}/league/{LEAGUE_ID}/rosters")
-                response.raise_for_status()
-                rosters = response.json()
-
-            # Collect all rostered player IDs
-            for roster in rosters:
-                if roster.get("players"):
-                    rostered_players.update(roster["players"])
+            league_state = await get_league_state(
+                get_http_client(), BASE_URL, current_league_id()
+            )
+            rostered_players = league_state["rostered"]
 
-        # Get all NFL players from cache (sync function, don't await)
-        all_players = get_players_from_cache(active_only=False)
+        # Get all NFL players from cache (shared for the rest of the request)
+        all_players = await memoized(
+            ("players_cache", False),
+            lambda: get_players_from_cache_async(active_only=False),
+        )
 
         # Fetch trending data and recent drops using utility functions
         trending_data = await get_trending_data_map(
@@ -1258,76 +1444,32 @@ async def get_waiver_wire_players(
             else set()
         )
 
-        # Filter to find available players
-        available_players = []
-        for player_id, player_data in all_players.items():
-            # Skip if player is rostered (only if verify_availability is True)
-            if verify_availability and player_id in rostered_players:
-                continue
-
-            # Skip if player doesn't match position filter
-            if position and player_data.get("position") != position.upper():
-                continue
-
-            # Skip if player doesn't match search term
-            if search_term:
-                player_name = (
-                    player_data.get("full_name", "")
-                    or f"{player_data.get('first_name', '')} {player_data.get('last_name', '')}"
-                ).lower()
-                if search_term.lower() not in player_name:
-                    continue
-
-            # Use enrichment utility based on mode
-            if not include_stats:
-                player_entry = enrich_player_minimal(player_id, player_data)
-            else:
-                # Full data mode - pass through all player data
-                player_entry = player_data
+        # Slice the pre-sorted free agent pool instead of scanning every player
+        pool = await get_free_agent_pool(all_players, rostered_players)
+        total_available, entries = query_free_agent_pool(
+            pool,
+            position=position,
+            search_term=search_term,
+            limit=min(limit, 200),
+            trending_map=trending_data,
+            recent_drops=recent_drops,
+        )
 
-            available_players.append(player_entry)
+        # Use enrichment utility based on mode
+        if not include_stats:
+            filtered_players = [dict(entry["minimal"]) for entry in entries]
+        else:
+            # Full data mode - pass through all player data
+            filtered_players = [
+                dict(all_players[entry["player_id"]]) for entry in entries
+            ]
 
         # Add trending data and recent drops marks using utility functions
-        available_players = add_trending_data(available_players, trending_data)
-        available_players = mark_recent_drops(available_players, recent_drops)
-
-        # Sort players by relevance
-        # Priority: 1) Recently dropped, 2) Active status, 3) Trending adds, 4) Projected points, 5) Name
-        def sort_key(player):
-            # Recently dropped players first
-            recently_dropped = 0 if player.get("recently_dropped") else 1
-            # Active players next
-            status_priority = 0 if player.get("status") == "Active" else 1
-            # Then by trending adds (negative for descending)
-            trending = -player.get("trending_add_count", 0)
-            # Then by projected points (negative for descending)
-            proj_points = 0
-            # Handle both minimal and full data structures
-            if "projected_points" in player:
-                # Minimal data mode
-                try:
-                    proj_points = -float(player.get("projected_points", 0))
-                except (ValueError, TypeError):
-                    pass
-            elif "data" in player and player.get("data", {}).get("projections"):
-                # Full data mode
-                try:
-                    proj_points = -float(
-                        player["data"]["projections"].get("proj_pts", 0)
-                    )
-                except (ValueError, TypeError):
-                    pass
-            # Then alphabetically
-            name = player.get("full_name", "") or ""
-            return (recently_dropped, status_priority, trending, proj_points, name)
-
-        available_players.sort(key=sort_key)
-
-        # Apply limit
-        filtered_players = available_players[: min(limit, 200)]
+        filtered_players = add_trending_data(filtered_players, trending_data)
+        filtered_players = mark_recent_drops(filtered_players, recent_drops)
 
         return {
-            "total_available": len(available_players),
+            "total_available": total_available,
             "filtered_count": len(filtered_players),
             "players": filtered_players,
             "filters_applied": {
@@ -1419,21 +1561,11 @@ async def get_waiver_analysis(
             f"Starting waiver analysis for position={position}, days_back={days_back}"
         )
 
-        # Get current rosters to determine position needs and waiver priority
-        rosters_data = {}
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{BASE_URL}/league/{LEAGUE_ID}/rosters")
-            response.raise_for_status()
-            rosters = response.json()
-
-            # Analyze position distribution across league
-            for roster in rosters:
-                roster_id = roster.get("roster_id")
-                if roster.get("players"):
-                    rosters_data[roster_id] = {
-                        "players": roster["players"],
-                        "settings": roster.get("settings", {}),
-                    }
+        # Get current rosters to determine availability and waiver priority
+        league_state = await get_league_state(
+            get_http_client(), BASE_URL, current_league_id()
+        )
+        rosters = league_state["roster_list"]
 
         # Get recently dropped players from our league
         recent_drops = []
@@ -1449,7 +1581,12 @@ async def get_waiver_analysis(
             dropped_player_ids = set()
 
             # Get player data from cache to enrich drops with projections
-            all_players = get_players_from_cache(active_only=False)
+            all_players = (
+                await get_players_by_ids_async(
+                    collect_transaction_player_ids(recent_transactions)
+                )
+                or {}
+            )
 
             for txn in recent_transactions:
                 if txn.get("drops"):
@@ -1535,12 +1672,8 @@ async def get_waiver_analysis(
 
         # Filter recently dropped to only include available players
         recently_dropped_available = []
-        rostered_players = set()
-        for roster_data in rosters_data.values():
-            rostered_players.update(roster_data.get("players", []))
-
         for drop in recent_drops:
-            if drop["player_id"] not in rostered_players:
+            if drop["player_id"] not in league_state["rostered"]:
                 recently_dropped_available.append(drop)
 
         recently_dropped_available = recently_dropped_available[:limit]
@@ -1669,15 +1802,15 @@ async def get_trending_context(
         max_players = min(max_players, 10)
         player_ids = player_ids[:max_players]
 
-        # Get player data for names and teams
-        from cache_client import get_player_by_id
+        # Get player data for names and teams in one lookup
+        players = await get_players_by_ids_async(player_ids, active_only=True) or {}
 
         trending_context = {}
 
         for player_id in player_ids:
             try:
                 # Get player info
-                player_data = get_player_by_id(player_id)
+                player_data = players.get(player_id)
                 if not player_data:
                     trending_context[player_id] = "Player data not available."
                     continue
@@ -1942,14 +2075,14 @@ async def get_nfl_schedule(week: Optional[int] = None) -> Dict[str, Any]:
             }
 
         # Fetch schedule from Fantasy Nerds
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://api.fantasynerds.com/v1/nfl/schedule",
-                params={"apikey": api_key},
-                timeout=10.0,
-            )
-            response.raise_for_status()
-            data = response.json()
+        client = get_http_client(FANTASY_NERDS)
+        response = await client.get(
+            "https://api.fantasynerds.com/v1/nfl/schedule",
+            params={"apikey": api_key},
+            timeout=10.0,
+        )
+        response.raise_for_status()
+        data = response.json()
 
         # Extract current week from response
         current_week = data.get("current_week", 1)
@@ -2164,7 +2297,7 @@ async def search(query: str) -> Dict[str, List[Dict[str, Any]]]:
                     {
                         "id": f"roster_{roster_id}",
                         "title": title,
-                        "url": f"https://sleeper.app/leagues/{LEAGUE_ID}/team/{roster_id}",
+                        "url": f"https://sleeper.app/leagues/{current_league_id()}/team/{roster_id}",
                     }
                 )
 
@@ -2309,7 +2442,7 @@ async def fetch(id: str) -> Dict[str, Any]:
                 "id": id,
                 "title": roster_data.get("team_name", f"Roster {roster_id}"),
                 "text": "\n".join(text_parts),
-                "url": f"https://sleeper.app/leagues/{LEAGUE_ID}/team/{roster_id}",
+                "url": f"https://sleeper.app/leagues/{current_league_id()}/team/{roster_id}",
                 "metadata": {
                     "type": "roster",
                     "wins": roster_data.get("wins"),
@@ -2347,6 +2480,7 @@ async def health_check() -> Dict[str, Any]:
 
     Performs health checks on:
     - Server status and uptime
+    - Player cache warm-up (readiness)
     - Redis cache connectivity
     - Sleeper API connectivity
     - Fantasy Nerds API connectivity (if configured)
@@ -2361,38 +2495,48 @@ async def health_check() -> Dict[str, Any]:
         "timestamp": datetime.now(ZoneInfo("America/Los_Angeles")).isoformat(),
         "components": {},
         "server_info": {
-            "league_id": LEAGUE_ID,
+            "league_id": current_league_id(),
             "debug_mode": DEBUG_MODE,
         },
     }
 
-    # Check Redis cache
-    try:
-        from cache_client import get_players_from_cache
-
-        players = get_players_from_cache(active_only=True)
-        health_status["components"]["redis_cache"] = {
-            "status": "healthy" if players else "degraded",
-            "cached_players": len(players) if players else 0,
-        }
-    except Exception as e:
-        health_status["components"]["redis_cache"] = {
-            "status": "unhealthy",
-            "error": str(e),
-        }
+    # Report cache warm-up progress
+    warmup = get_warmup_status()
+    health_status["ready"] = warmup["ready"]
+    health_status["components"]["cache_warmup"] = warmup
+    if not warmup["ready"]:
         health_status["status"] = "degraded"
 
+    # Check Redis cache (skipped while warming, so the check does not wait on
+    # the rebuild)
+    if warmup["ready"]:
+        try:
+            players = await get_players_from_cache_async(active_only=True)
+            health_status["components"]["redis_cache"] = {
+                "status": "healthy" if players else "degraded",
+                "cached_players": len(players) if players else 0,
+                "serving_backup": warmup["serving_backup"],
+            }
+        except Exception as e:
+            health_status["components"]["redis_cache"] = {
+                "status": "unhealthy",
+                "error": str(e),
+            }
+            health_status["status"] = "degraded"
+    else:
+        health_status["components"]["redis_cache"] = {"status": "warming"}
+
     # Check Sleeper API
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(f"{BASE_URL}/state/nfl")
-            response.raise_for_status()
-            state = response.json()
-            health_status["components"]["sleeper_api"] = {
-                "status": "healthy",
-                "current_season": state.get("season"),
-                "current_week": state.get("week"),
-            }
+        client = get_http_client()
+        response = await client.get(f"{BASE_URL}/state/nfl", timeout=5.0)
+        response.raise_for_status()
+        state = response.json()
+        health_status["components"]["sleeper_api"] = {
+            "status": "healthy",
+            "current_season": state.get("season"),
+            "current_week": state.get("week"),
+        }
     except Exception as e:
         health_status["components"]["sleeper_api"] = {
             "status": "unhealthy",
@@ -2404,13 +2548,14 @@ async def health_check() -> Dict[str, Any]:
     api_key = os.environ.get("FFNERD_API_KEY")
     if api_key:
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(
-                    "https://api.fantasynerds.com/v1/nfl/current-week",
-                    headers={"x-api-key": api_key},
-                )
-                response.raise_for_status()
-                health_status["components"]["fantasy_nerds_api"] = {"status": "healthy"}
+            client = get_http_client(FANTASY_NERDS)
+            response = await client.get(
+                "https://api.fantasynerds.com/v1/nfl/current-week",
+                headers={"x-api-key": api_key},
+                timeout=5.0,
+            )
+            response.raise_for_status()
+            health_status["components"]["fantasy_nerds_api"] = {"status": "healthy"}
         except Exception as e:
             health_status["components"]["fantasy_nerds_api"] = {
                 "status": "unhealthy",
@@ -2423,6 +2568,67 @@ async def health_check() -> Dict[str, Any]:
     return health_status
 
 
+@mcp.custom_route("/health", methods=["GET"])
+async def health_route(request: Request) -> JSONResponse:
+    """Lightweight HTTP health endpoint for the hosting platform.
+
+    Returns 503 only while the cache is still warming with no backup to
+    serve. A failed warm-up still returns 200: tools then rebuild the cache
+    on demand, as they did before warm-up existed.
+    """
+    warmup = get_warmup_status()
+    warming = warmup["status"] == "warming" and not warmup["ready"]
+    return JSONResponse(
+        {"status": warmup["status"], "ready": warmup["ready"]},
+        status_code=503 if warming else 200,
+    )
+
+
+@mcp.custom_route("/live/{week}", methods=["GET"])
+async def live_scores_route(request: Request) -> Response:
+    """Server-Sent Events stream of live score updates for a week.
+
+    Subscribes to the shared live feed (see lib.live_feed) instead of polling
+    get_live_scores. The league comes from the league_id query parameter like
+    every other request; roster_id limits updates to one roster and its
+    matchup. Reconnecting clients resume from Last-Event-ID.
+
+    Example: GET /live/7?league_id=1266471057523490816&roster_id=2
+    """
+    try:
+        week = validate_week(request.path_params["week"])
+        roster_id = request.query_params.get("roster_id")
+        roster_id = validate_roster_id(roster_id) if roster_id else None
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, status_code=400)
+
+    last_event_id = request.headers.get("last-event-id", "")
+    since_version = int(last_event_id) if last_event_id.isdigit() else None
+    league_id = current_league_id()
+
+    # Fail before the stream starts if there is no scoreboard to serve
+    try:
+        await refresh_live_scoreboard(get_http_client(), BASE_URL, league_id, week)
+    except Exception as e:
+        logger.warning(
+            f"Live feed unavailable (league_id={league_id}, week={week}, error_type={type(e).__name__}, error_message={str(e)})"
+        )
+        return JSONResponse({"error": "Live scores unavailable"}, status_code=502)
+
+    async def events():
+        async with subscribe(
+            get_http_client(), BASE_URL, league_id, week, roster_id, since_version
+        ) as subscription:
+            async for event in sse_stream(subscription):
+                yield event
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 # Unified player tools removed - consolidated into main player tools above
 
 
@@ -3063,41 +3269,121 @@ async def token_bowl_chat_health_check() -> Dict[str, Any]:
 # ============================================================================
 
 
-class APIKeyMiddleware(BaseHTTPMiddleware):
+class APIKeyMiddleware:
     """Middleware to extract api_key query parameter for Token Bowl Chat authentication.
 
     This middleware extracts the 'api_key' query parameter from SSE connection URLs
     and stores it in a context variable for use by Token Bowl Chat tools.
 
+    Plain ASGI rather than BaseHTTPMiddleware: FastMCP's SSE handler sends its
+    own response messages after the stream ends, which BaseHTTPMiddleware
+    rejects when the session closes.
+
     Example URL: https://tokenbowl-mcp.example.com/sse?api_key=your_api_key_here
     """
 
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Extract api_key from query parameters
-        api_key = request.query_params.get("api_key")
+        api_key = Request(scope).query_params.get("api_key")
+        if not api_key:
+            await self.app(scope, receive, send)
+            return
+
+        # Store the API key in the context variable for the whole request
+        token = token_bowl_chat_api_key_ctx.set(api_key)
+        logger.debug(
+            f"Token Bowl Chat API key set from query parameter for {scope['path']}"
+        )
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            token_bowl_chat_api_key_ctx.reset(token)
+
 
-        if api_key:
-            # Store the API key in the context variable
-            token = token_bowl_chat_api_key_ctx.set(api_key)
+class LeagueMiddleware:
+    """Middleware to select the Sleeper league from the league_id query parameter.
+
+    Tools called over the connection read it with current_league_id(); without
+    the parameter they use SLEEPER_LEAGUE_ID. All leagues share the process's
+    NFL player cache. An invalid league_id is answered with a 400.
+
+    Example URL: https://tokenbowl-mcp.example.com/sse?league_id=1266471057523490816
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        league_id = Request(scope).query_params.get("league_id")
+        if not league_id:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            league_id = validate_league_id(league_id)
+        except ValueError as e:
+            response = JSONResponse({"error": str(e)}, status_code=400)
+            await response(scope, receive, send)
+            return
+
+        with use_league(league_id):
             logger.debug(
-                f"Token Bowl Chat API key set from query parameter for {request.url.path}"
+                f"League selected from query parameter (league_id={league_id}, path={scope['path']})"
             )
-            try:
-                response = await call_next(request)
-                return response
-            finally:
-                # Reset the context variable after the request
-                token_bowl_chat_api_key_ctx.reset(token)
-        else:
-            # No API key in query params, proceed without setting context
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send)
 
 
-# Register the middleware with FastMCP
-# This must be done before calling mcp.run()
-mcp._middlewares = [APIKeyMiddleware]
-logger.info("Token Bowl Chat API key middleware registered")
+# ASGI middleware for the HTTP transports, passed to mcp.run_async()
+HTTP_MIDDLEWARE = [Middleware(APIKeyMiddleware), Middleware(LeagueMiddleware)]
+
+
+@asynccontextmanager
+async def server_lifespan(warm_cache: bool = False, poll_trending: bool = False):
+    """Open process-wide resources for the server and close them on shutdown.
+
+    FastMCP's own lifespan runs per client session, so shared resources such as
+    the pooled HTTP clients are managed around the whole server run instead.
+
+    Args:
+        warm_cache: Warm the player cache (and start the periodic refresher if
+            enabled) in the background while the server starts
+        poll_trending: Snapshot trending players in the background
+    """
+    if warm_cache:
+        start_cache_warmup()
+    if poll_trending:
+        start_trending_poller()
+    try:
+        yield
+    finally:
+        await stop_live_feeds()
+        await stop_trending_poller()
+        await stop_cache_warmup()
+        await close_http_clients()
+        await close_async_redis_client()
+        logger.info("Closed shared HTTP and Redis clients")
+
+
+async def run_server(
+    transport: str,
+    warm_cache: bool = False,
+    poll_trending: bool = False,
+    **transport_kwargs: Any,
+) -> None:
+    """Run the MCP server inside server_lifespan."""
+    async with server_lifespan(warm_cache=warm_cache, poll_trending=poll_trending):
+        await mcp.run_async(transport=transport, **transport_kwargs)
 
 
 if __name__ == "__main__":
@@ -3107,13 +3393,6 @@ if __name__ == "__main__":
 
     # Check for environment variable or command line argument
     if os.getenv("RENDER") or (len(sys.argv) > 1 and sys.argv[1] == "http"):
-        # Start background cache refresh if enabled (for Render deployment)
-        if os.getenv("ENABLE_BACKGROUND_REFRESH", "false").lower() == "true":
-            from background_refresh import start_background_refresh
-
-            start_background_refresh()
-            logger.info("Background cache refresh enabled")
-
         # Use PORT env variable (required by Render) or command line arg
         port = int(os.getenv("PORT", 8000))
         if len(sys.argv) > 2:
@@ -3121,8 +3400,18 @@ if __name__ == "__main__":
 
         # Bind to 0.0.0.0 for external access (required for cloud deployment)
         logger.info(f"Starting MCP server in HTTP/SSE mode on port {port}")
-        mcp.run(transport="sse", port=port, host="0.0.0.0")
+        # The cache warms in the background so the port is bound immediately
+        asyncio.run(
+            run_server(
+                "sse",
+                warm_cache=CACHE_WARMUP_ENABLED,
+                poll_trending=TRENDING_POLL_ENABLED,
+                port=port,
+                host="0.0.0.0",
+                middleware=HTTP_MIDDLEWARE,
+            )
+        )
     else:
         # Default to stdio for backward compatibility (Claude Desktop)
         logger.info("Starting MCP server in STDIO mode for Claude Desktop")
-        mcp.run()
+        asyncio.run(run_server("stdio"))
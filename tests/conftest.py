@@ -4,6 +4,8 @@ from pathlib import Path
 import fakeredis.aioredis as fakeredis
 import sys
 import os
+import time
+from unittest.mock import AsyncMock, MagicMock
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -58,3 +60,86 @@ def test_user_id():
 def test_draft_id():
     """Test draft ID."""
     return "987654321"
+
+
+@pytest.fixture(autouse=True)
+def reset_module_state(monkeypatch, tmp_path):
+    """Give each test fresh in-process state and its own on-disk stores.
+
+    Sleeper endpoints are fetched directly so mocked clients see every
+    request; the response cache itself is covered in test_sleeper_cache.py.
+    """
+    from lib import (
+        free_agent_pool,
+        league_state,
+        live_feed,
+        live_scoring,
+        sleeper_cache,
+        stats_matrix,
+        stats_warehouse,
+        transaction_store,
+        trending_snapshots,
+    )
+
+    monkeypatch.setattr(sleeper_cache, "SLEEPER_CACHE_ENABLED", False)
+    monkeypatch.setattr(
+        transaction_store, "TRANSACTION_DB_PATH", str(tmp_path / "transactions.db")
+    )
+    monkeypatch.setattr(
+        stats_warehouse, "STATS_WAREHOUSE_PATH", str(tmp_path / "stats_warehouse.db")
+    )
+    monkeypatch.setattr(stats_matrix, "STATS_MATRIX_DIR", str(tmp_path / "matrix"))
+
+    resets = [
+        sleeper_cache.clear_sleeper_cache,
+        transaction_store.close_transaction_store,
+        stats_warehouse.close_stats_warehouse,
+        stats_matrix.clear_stats_matrices,
+        league_state.clear_league_state,
+        trending_snapshots.clear_trending_snapshots,
+        free_agent_pool.clear_free_agent_pool,
+        live_scoring.clear_live_scoring,
+        live_feed.clear_live_feeds,
+    ]
+    for reset in resets:
+        reset()
+    yield
+    for reset in resets:
+        reset()
+
+
+def sleeper_response(data, status_code=200):
+    """Mock httpx response carrying a Sleeper JSON body."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.json = lambda: data
+    response.raise_for_status = lambda: None
+    return response
+
+
+@pytest.fixture
+def sleeper_client():
+    """Factory for mock HTTP clients serving canned Sleeper responses.
+
+    Call it with a function mapping each requested URL to its JSON body; the
+    function may raise to fail that request. client.get is an AsyncMock, so
+    tests can check which URLs were requested.
+    """
+
+    def make(route):
+        async def get(url, **kwargs):
+            return sleeper_response(route(url))
+
+        client = MagicMock()
+        client.get = AsyncMock(side_effect=get)
+        return client
+
+    return make
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Frozen time.time(); advance it by adding to clock["t"]."""
+    now = {"t": 1_000_000.0}
+    monkeypatch.setattr(time, "time", lambda: now["t"])
+    return now
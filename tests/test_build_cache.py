@@ -0,0 +1,197 @@
+"""Tests for the concurrent fetch stage in build_cache."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+import build_cache
+from build_cache import _get_json, fetch_cache_inputs, fetch_sleeper_players
+
+
+def _client(handler):
+    """Build an AsyncClient backed by a mock transport."""
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.fixture(autouse=True)
+def no_retry_backoff(monkeypatch):
+    """Retry immediately so tests do not sleep."""
+    monkeypatch.setattr(build_cache, "FETCH_RETRY_BACKOFF_SECONDS", 0)
+
+
+class TestGetJson:
+    """Test per-source retry behavior."""
+
+    @pytest.mark.asyncio
+    async def test_retries_server_errors(self):
+        """5xx responses are retried until one succeeds."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) < 3:
+                return httpx.Response(503)
+            return httpx.Response(200, json={"week": 5})
+
+        async with _client(handler) as client:
+            result = await _get_json(client, "https://example.test", "sleeper_state")
+
+        assert result == {"week": 5}
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_client_errors_not_retried(self):
+        """4xx responses (other than 429) fail immediately."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(404)
+
+        async with _client(handler) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                await _get_json(client, "https://example.test", "sleeper_state")
+
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_retries(self, monkeypatch):
+        """Connection errors are raised once retries run out."""
+        monkeypatch.setattr(build_cache, "FETCH_RETRIES", 1)
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            raise httpx.ConnectError("refused", request=request)
+
+        async with _client(handler) as client:
+            with pytest.raises(httpx.ConnectError):
+                await _get_json(client, "https://example.test", "sleeper_players")
+
+        assert len(calls) == 2
+
+
+class TestFetchSleeperPlayers:
+    """Test the streamed, filtered /players/nfl fetch."""
+
+    PLAYERS = {
+        "4046": {
+            "full_name": "Patrick Mahomes",
+            "position": "QB",
+            "team": "KC",
+            "status": "Active",
+            "search_full_name": "patrickmahomes",
+            "hashtag": "#patrickmahomes",
+        },
+        "1": {"full_name": "Long Snapper", "position": "LS", "team": "KC"},
+        "2": {"full_name": "Free Agent", "position": "WR", "team": None},
+        "3": {
+            "full_name": "Retired",
+            "position": "RB",
+            "team": "NE",
+            "status": "Inactive",
+        },
+        "4": {
+            "full_name": "On IR",
+            "position": "TE",
+            "team": "NE",
+            "status": "Inactive",
+            "injury_status": "IR",
+        },
+    }
+
+    @pytest.mark.asyncio
+    async def test_keeps_only_cacheable_players_and_fields(self):
+        body = json.dumps(self.PLAYERS).encode()
+
+        async def chunks():
+            # Small chunks so players straddle chunk boundaries
+            for i in range(0, len(body), 7):
+                yield body[i : i + 7]
+
+        def handler(request):
+            return httpx.Response(200, content=chunks())
+
+        async with _client(handler) as client:
+            players = await fetch_sleeper_players(client)
+
+        assert sorted(players) == ["4", "4046"]
+        assert players["4046"] == {
+            "full_name": "Patrick Mahomes",
+            "position": "QB",
+            "team": "KC",
+            "status": "Active",
+        }
+
+    @pytest.mark.asyncio
+    async def test_retries_server_errors(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return httpx.Response(502)
+            return httpx.Response(200, json=self.PLAYERS)
+
+        async with _client(handler) as client:
+            players = await fetch_sleeper_players(client)
+
+        assert len(calls) == 2
+        assert "4046" in players
+
+
+class TestFetchCacheInputs:
+    """Test that independent sources are fetched concurrently."""
+
+    @pytest.mark.asyncio
+    async def test_sources_fetched_concurrently(self):
+        """Every source is in flight before any of them completes."""
+        started = []
+        all_started = asyncio.Event()
+
+        def source(name, result):
+            async def fetch(*args):
+                started.append(name)
+                if len(started) == 6:
+                    all_started.set()
+                await asyncio.wait_for(all_started.wait(), timeout=1)
+                return result
+
+            return fetch
+
+        with (
+            patch.object(
+                build_cache,
+                "fetch_sleeper_players",
+                source("sleeper", {"4046": {"player_id": "4046"}}),
+            ),
+            patch.object(
+                build_cache, "fetch_fantasy_nerds_players", source("ffnerd", [])
+            ),
+            patch.object(
+                build_cache,
+                "fetch_fantasy_nerds_data",
+                source("ffnerd_data", ({}, {}, [])),
+            ),
+            patch.object(build_cache, "fetch_fantasy_nerds_ros", source("ros", {})),
+            patch.object(build_cache, "fetch_bye_weeks", source("byes", {"KC": 10})),
+            patch.object(
+                build_cache, "fetch_current_nfl_week", source("state", (7, "2025"))
+            ),
+            patch.object(
+                build_cache,
+                "fetch_player_stats",
+                AsyncMock(return_value={"4046": {"pts_ppr": 20.5}}),
+            ) as mock_stats,
+        ):
+            inputs = await fetch_cache_inputs()
+
+        mock_stats.assert_awaited_once()
+        assert mock_stats.await_args.args[1:] == (7, "2025")
+        assert inputs["current_week"] == 7
+        assert inputs["stats_data"] == {"4046": {"fantasy_points": 20.5}}
+        assert inputs["bye_weeks_map"] == {"KC": 10}
+        assert "4046" in inputs["sleeper_players"]
@@ -0,0 +1,512 @@
+"""Tests for the in-process player cache in cache_client."""
+
+import asyncio
+import gzip
+import json
+import time
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import fakeredis
+import fakeredis.aioredis
+import pytest
+import redis
+
+import cache_client
+from cache_codec import ZSTD_JSON, codec_metadata, decode_blob, encode_blob
+from player_views import players_blob_payload, players_from_blob_payload
+from build_cache import (
+    PLAYERS_BY_TEAM_PREFIX,
+    PLAYERS_CACHE_KEY,
+    PLAYERS_CACHE_VERSION_KEY,
+    PLAYERS_HASH_KEY,
+    write_players_hash,
+)
+
+
+def _write_players(r, players, last_updated=None, bump=True):
+    """Write a player blob and metadata the same way build_cache does."""
+    r.set(PLAYERS_CACHE_KEY, gzip.compress(json.dumps(players).encode("utf-8")))
+    r.set(
+        f"{PLAYERS_CACHE_KEY}_metadata",
+        json.dumps({"last_updated": (last_updated or datetime.now()).isoformat()}),
+    )
+    if bump:
+        r.incr(PLAYERS_CACHE_VERSION_KEY)
+
+
+async def _run_spot_refresh(player_ids, week_stats):
+    """Run spot_refresh_player_stats against a freshly fetched week payload."""
+    payload = {
+        "season": "2025",
+        "week": 3,
+        "stats": week_stats,
+        "fetched_at": time.time(),
+    }
+    with (
+        patch("cache_client.LIVE_STATS_REFRESH_SECONDS", 0),
+        patch("cache_client._fetch_week_stats", return_value=payload),
+    ):
+        return await cache_client.spot_refresh_player_stats(player_ids)
+
+
+@pytest.fixture
+def redis_server():
+    """Shared fake Redis server for the sync and async clients."""
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def async_redis_client(redis_server):
+    """Async fakeredis client on the shared server."""
+    return fakeredis.aioredis.FakeRedis(server=redis_server, decode_responses=False)
+
+
+@pytest.fixture
+def redis_client(redis_server, async_redis_client):
+    """Sync fakeredis client; both cache_client connections are patched."""
+    r = fakeredis.FakeRedis(server=redis_server, decode_responses=False)
+    cache_client.clear_local_player_cache()
+    with (
+        patch("cache_client.get_redis_client", return_value=r),
+        patch("cache_client.get_async_redis_client", return_value=async_redis_client),
+    ):
+        yield r
+    cache_client.clear_local_player_cache()
+
+
+PLAYERS = {
+    "1": {"full_name": "Active Player", "active": True, "team": "KC"},
+    "2": {"full_name": "Free Agent", "active": True, "team": None},
+    "3": {"full_name": "Retired Player", "active": False, "team": None},
+}
+
+
+class TestLocalPlayerCache:
+    """The decoded player dict is reused until the Redis version changes."""
+
+    def test_reuses_decoded_players_while_version_unchanged(self, redis_client):
+        _write_players(redis_client, PLAYERS)
+
+        with (
+            patch("cache_client.json.loads", wraps=json.loads) as mock_loads,
+            patch(
+                "cache_client.decode_blob", wraps=cache_client.decode_blob
+            ) as mock_decode,
+        ):
+            first = cache_client.get_players_from_cache(active_only=False)
+            second = cache_client.get_players_from_cache(active_only=False)
+
+        assert first is second
+        assert set(first) == {"1", "2", "3"}
+        assert mock_decode.call_count == 1
+        # Metadata is parsed here, the blob by the codec
+        assert mock_loads.call_count == 1
+
+    def test_active_subset_is_memoized(self, redis_client):
+        _write_players(redis_client, PLAYERS)
+
+        first = cache_client.get_players_from_cache(active_only=True)
+        second = cache_client.get_players_from_cache(active_only=True)
+
+        assert first is second
+        assert set(first) == {"1"}
+
+    def test_players_decoded_on_access(self, redis_client):
+        _write_players(redis_client, PLAYERS)
+        redis_client.set(PLAYERS_CACHE_KEY, encode_blob(players_blob_payload(PLAYERS)))
+
+        players = cache_client.get_players_from_cache(active_only=False)
+        active = cache_client.get_players_from_cache(active_only=True)
+
+        assert len(players) == 3
+        assert list(active) == ["1"]
+        assert active["1"] is players["1"]
+        assert players.decoded_count == 1
+
+    def test_version_bump_reloads_players(self, redis_client):
+        _write_players(redis_client, PLAYERS)
+        first = cache_client.get_players_from_cache(active_only=False)
+
+        updated = dict(PLAYERS)
+        updated["4"] = {"full_name": "New Signing", "active": True, "team": "BUF"}
+        _write_players(redis_client, updated)
+
+        second = cache_client.get_players_from_cache(active_only=False)
+
+        assert second is not first
+        assert "4" in second
+
+    def test_missing_version_key_always_reads_redis(self, redis_client):
+        _write_players(redis_client, PLAYERS, bump=False)
+
+        first = cache_client.get_players_from_cache(active_only=False)
+        second = cache_client.get_players_from_cache(active_only=False)
+
+        assert first == second
+        assert first is not second
+
+    def test_stale_local_copy_triggers_refresh(self, redis_client):
+        _write_players(
+            redis_client, PLAYERS, last_updated=datetime.now() - timedelta(hours=7)
+        )
+
+        with patch("cache_client.cache_players", return_value=False) as mock_build:
+            result = cache_client.get_players_from_cache(active_only=False)
+
+        mock_build.assert_called_once()
+        assert result is None
+
+    async def test_spot_refresh_bumps_version_and_updates_local_copy(
+        self, redis_client
+    ):
+        _write_players(redis_client, PLAYERS)
+        cache_client.get_players_from_cache(active_only=False)
+        version_before = int(redis_client.get(PLAYERS_CACHE_VERSION_KEY))
+
+        assert (
+            await _run_spot_refresh(
+                {"1"}, {"1": {"fantasy_points": 21.5, "receptions": 7}}
+            )
+            is True
+        )
+
+        assert int(redis_client.get(PLAYERS_CACHE_VERSION_KEY)) == version_before + 1
+
+        with patch("cache_client.decode_blob") as mock_decode:
+            players = cache_client.get_players_from_cache(active_only=False)
+
+        mock_decode.assert_not_called()
+        assert players["1"]["stats"]["actual"]["fantasy_points"] == 21.5
+
+
+@pytest.fixture
+def hash_layout(redis_client):
+    """Populate the per-player hash layout the way cache_players does."""
+    write_players_hash(redis_client, PLAYERS, ttl=3600)
+    redis_client.set(
+        f"{PLAYERS_CACHE_KEY}_metadata",
+        json.dumps({"last_updated": datetime.now().isoformat(), "layout": "hash"}),
+    )
+    redis_client.incr(PLAYERS_CACHE_VERSION_KEY)
+    return redis_client
+
+
+class TestHashLayout:
+    """Per-player hash fields let callers fetch only the IDs they need."""
+
+    def test_write_players_hash_builds_index_sets(self, redis_client):
+        redis_client.sadd(f"{PLAYERS_BY_TEAM_PREFIX}OLD", "99")
+
+        write_players_hash(redis_client, PLAYERS, ttl=3600)
+
+        assert redis_client.hlen(PLAYERS_HASH_KEY) == 3
+        assert redis_client.smembers(f"{PLAYERS_BY_TEAM_PREFIX}KC") == {b"1"}
+        assert not redis_client.exists(f"{PLAYERS_BY_TEAM_PREFIX}OLD")
+        assert redis_client.ttl(PLAYERS_HASH_KEY) > 0
+
+    def test_get_players_by_ids_uses_hmget(self, hash_layout):
+        with patch.object(
+            hash_layout, "hgetall", wraps=hash_layout.hgetall
+        ) as mock_hgetall:
+            players = cache_client.get_players_by_ids(["1", "3", "missing", "1"])
+
+        mock_hgetall.assert_not_called()
+        assert set(players) == {"1", "3"}
+
+    def test_get_players_by_ids_active_only(self, hash_layout):
+        players = cache_client.get_players_by_ids(["1", "2", "3"], active_only=True)
+
+        assert set(players) == {"1"}
+
+    def test_get_player_by_id_skips_inactive(self, hash_layout):
+        assert cache_client.get_player_by_id("1")["full_name"] == "Active Player"
+        assert cache_client.get_player_by_id("3") is None
+
+    def test_get_players_from_cache_reads_hash(self, hash_layout):
+        players = cache_client.get_players_from_cache(active_only=False)
+
+        assert set(players) == {"1", "2", "3"}
+
+    def test_search_players_resolves_lookup_matches(self, hash_layout):
+        lookup = {"activeplayer": "1", "freeagent": "2"}
+        with patch("cache_client.get_name_lookup_from_cache", return_value=lookup):
+            results = cache_client.search_players("active", limit=1)
+
+        assert [p["player_id"] for p in results] == ["1"]
+
+    async def test_spot_refresh_rewrites_only_changed_fields(self, hash_layout):
+        cache_client.get_players_from_cache(active_only=False)
+        untouched = hash_layout.hget(PLAYERS_HASH_KEY, "2")
+
+        assert (
+            await _run_spot_refresh(
+                {"1"}, {"1": {"fantasy_points": 12.0, "rushing_yards": 80}}
+            )
+            is True
+        )
+
+        stored = json.loads(hash_layout.hget(PLAYERS_HASH_KEY, "1"))
+        assert stored["stats"]["actual"]["fantasy_points"] == 12.0
+        assert hash_layout.hget(PLAYERS_HASH_KEY, "2") == untouched
+
+        with patch.object(hash_layout, "hgetall") as mock_hgetall:
+            players = cache_client.get_players_from_cache(active_only=False)
+
+        mock_hgetall.assert_not_called()
+        assert players["1"]["stats"]["actual"]["fantasy_points"] == 12.0
+        assert "stats" not in PLAYERS["1"]
+
+
+class TestIncrementalSpotRefresh:
+    """Spot refreshes only write players whose live stats changed."""
+
+    async def test_unchanged_stats_skip_write(self, hash_layout, async_redis_client):
+        week_stats = {"1": {"fantasy_points": 8.0, "receptions": 3}}
+        assert await _run_spot_refresh({"1"}, week_stats) is True
+        version = hash_layout.get(PLAYERS_CACHE_VERSION_KEY)
+
+        with patch.object(
+            async_redis_client, "hset", wraps=async_redis_client.hset
+        ) as mock_hset:
+            assert await _run_spot_refresh({"1"}, week_stats) is True
+
+        mock_hset.assert_not_called()
+        assert hash_layout.get(PLAYERS_CACHE_VERSION_KEY) == version
+
+    async def test_only_changed_players_are_rewritten(
+        self, hash_layout, async_redis_client
+    ):
+        assert (
+            await _run_spot_refresh(
+                None,
+                {
+                    "1": {"fantasy_points": 8.0},
+                    "2": {"fantasy_points": 4.0, "receptions": 2},
+                },
+            )
+            is True
+        )
+
+        with patch.object(
+            async_redis_client, "hset", wraps=async_redis_client.hset
+        ) as mock_hset:
+            await _run_spot_refresh(
+                None,
+                {
+                    "1": {"fantasy_points": 14.0},
+                    "2": {"fantasy_points": 4.0, "receptions": 2},
+                },
+            )
+
+        player_writes = [
+            c for c in mock_hset.call_args_list if c.args[0] == PLAYERS_HASH_KEY
+        ]
+        assert len(player_writes) == 1
+        assert set(player_writes[0].kwargs["mapping"]) == {"1"}
+
+    async def test_unchanged_blob_is_not_reencoded(self, redis_client):
+        _write_players(redis_client, PLAYERS)
+        week_stats = {"1": {"fantasy_points": 8.0}}
+        assert await _run_spot_refresh({"1"}, week_stats) is True
+
+        with patch("cache_client.encode_blob") as mock_encode:
+            assert await _run_spot_refresh({"1"}, week_stats) is True
+
+        mock_encode.assert_not_called()
+
+    async def test_blob_rewritten_in_recorded_codec(self, redis_client):
+        pytest.importorskip("zstandard")
+        redis_client.set(PLAYERS_CACHE_KEY, encode_blob(PLAYERS, ZSTD_JSON))
+        redis_client.set(
+            f"{PLAYERS_CACHE_KEY}_metadata",
+            json.dumps(
+                {
+                    "last_updated": datetime.now().isoformat(),
+                    **codec_metadata(ZSTD_JSON),
+                }
+            ),
+        )
+        redis_client.incr(PLAYERS_CACHE_VERSION_KEY)
+
+        assert await _run_spot_refresh({"1"}, {"1": {"fantasy_points": 8.0}}) is True
+
+        stored = redis_client.get(PLAYERS_CACHE_KEY)
+        assert stored[:4] == b"\x28\xb5\x2f\xfd"
+        players = players_from_blob_payload(decode_blob(stored))
+        assert players["1"]["stats"]["actual"]["fantasy_points"] == 8.0
+
+
+class TestSharedWeekStats:
+    """Week stats are fetched once per freshness window."""
+
+    @staticmethod
+    def _payload():
+        return {
+            "season": "2025",
+            "week": 3,
+            "stats": {"1": {"fantasy_points": 9.0}},
+            "fetched_at": time.time(),
+        }
+
+    async def test_concurrent_callers_share_one_fetch(self, redis_client):
+        _write_players(redis_client, PLAYERS)
+
+        async def slow_fetch():
+            await asyncio.sleep(0.01)
+            return self._payload()
+
+        with patch(
+            "cache_client._fetch_week_stats", side_effect=slow_fetch
+        ) as mock_fetch:
+            results = await asyncio.gather(
+                *(cache_client.spot_refresh_player_stats({"1"}) for _ in range(5))
+            )
+
+        assert results == [True] * 5
+        mock_fetch.assert_called_once()
+
+    async def test_repeat_refresh_within_window_is_noop(self, redis_client):
+        _write_players(redis_client, PLAYERS)
+
+        with patch("cache_client._fetch_week_stats", return_value=self._payload()):
+            assert await cache_client.spot_refresh_player_stats({"1"}) is True
+
+            with patch("cache_client._changed_live_stats") as mock_changed:
+                assert await cache_client.spot_refresh_player_stats({"1"}) is True
+
+        mock_changed.assert_not_called()
+
+    async def test_uses_payload_published_by_another_process(self, redis_client):
+        payload = self._payload()
+        redis_client.set(
+            cache_client.LIVE_STATS_PAYLOAD_KEY,
+            gzip.compress(json.dumps(payload).encode("utf-8")),
+        )
+
+        with patch("cache_client._fetch_week_stats") as mock_fetch:
+            result = await cache_client.get_live_week_stats()
+
+        mock_fetch.assert_not_called()
+        assert result["stats"] == payload["stats"]
+
+    async def test_lock_holder_publishes_payload(self, redis_client):
+        with patch("cache_client._fetch_week_stats", return_value=self._payload()):
+            await cache_client.get_live_week_stats()
+
+        assert redis_client.exists(cache_client.LIVE_STATS_PAYLOAD_KEY)
+        assert not redis_client.exists(cache_client.LIVE_STATS_LOCK_KEY)
+
+    async def test_fetches_directly_without_redis(self):
+        down = AsyncMock()
+        down.get.side_effect = redis.ConnectionError("Connection refused")
+        payload = self._payload()
+
+        with (
+            patch("cache_client.get_async_redis_client", return_value=down),
+            patch("cache_client._fetch_week_stats", return_value=payload),
+        ):
+            result = await cache_client.get_live_week_stats()
+
+        assert result["stats"] == payload["stats"]
+
+
+class TestAsyncReaders:
+    """Async variants read through the shared redis.asyncio client."""
+
+    async def test_get_players_from_cache_async_reuses_local_copy(self, redis_client):
+        _write_players(redis_client, PLAYERS)
+
+        first = await cache_client.get_players_from_cache_async(active_only=True)
+        second = await cache_client.get_players_from_cache_async(active_only=True)
+
+        assert first is second
+        assert set(first) == {"1"}
+
+    async def test_get_players_by_ids_async_uses_hmget(
+        self, hash_layout, async_redis_client
+    ):
+        with patch.object(
+            async_redis_client, "hgetall", wraps=async_redis_client.hgetall
+        ) as mock_hgetall:
+            players = await cache_client.get_players_by_ids_async(["2", "3"])
+
+        mock_hgetall.assert_not_called()
+        assert set(players) == {"2", "3"}
+
+    async def test_get_player_by_id_async(self, hash_layout):
+        player = await cache_client.get_player_by_id_async("1")
+
+        assert player["full_name"] == "Active Player"
+        assert await cache_client.get_player_by_id_async("3") is None
+
+    async def test_search_players_async(self, hash_layout):
+        hash_layout.set(
+            "player_name_lookup",
+            gzip.compress(json.dumps({"activeplayer": "1"}).encode("utf-8")),
+        )
+
+        results = await cache_client.search_players_async("Active Player")
+
+        assert [p["player_id"] for p in results] == ["1"]
+
+    async def test_get_cache_status_async(self, hash_layout):
+        status = await cache_client.get_cache_status_async()
+
+        assert status["exists"] is True
+        assert status["layout"] == "hash"
+
+    async def test_async_client_is_shared_per_loop(self):
+        with patch("cache_client.aioredis.from_url") as mock_from_url:
+            mock_from_url.return_value.aclose = AsyncMock()
+            first = cache_client.get_async_redis_client()
+            second = cache_client.get_async_redis_client()
+            await cache_client.close_async_redis_client()
+
+        assert first is second
+        mock_from_url.assert_called_once()
+        first.aclose.assert_awaited_once()
+
+
+class TestBackupPlayers:
+    """Serving the on-disk backup while the cache is rebuilt."""
+
+    @pytest.fixture
+    def backup(self, tmp_path, redis_client):
+        path = tmp_path / "backup.json"
+        path.write_text(json.dumps(PLAYERS))
+        assert cache_client.load_backup_players(str(path)) == 3
+        return path
+
+    def test_missing_backup_loads_nothing(self, tmp_path):
+        assert cache_client.load_backup_players(str(tmp_path / "missing.json")) == 0
+
+    async def test_backup_served_without_waiting_for_rebuild(self, backup):
+        with patch("cache_client.cache_players", return_value=False) as mock_build:
+            players = await cache_client.get_players_from_cache_async()
+            assert set(players) == {"1"}
+            # The rebuild was started in the background
+            assert await cache_client._rebuild["task"] is False
+
+        mock_build.assert_called_once()
+
+    async def test_backup_dropped_after_successful_rebuild(self, backup, redis_client):
+        def build():
+            _write_players(redis_client, {"9": PLAYERS["1"]})
+            return True
+
+        with patch("cache_client.cache_players", side_effect=build):
+            assert await cache_client.rebuild_players_cache() is True
+
+        players = await cache_client.get_players_from_cache_async()
+        assert set(players) == {"9"}
+
+    async def test_concurrent_rebuilds_share_one_build(self, redis_client):
+        with patch("cache_client.cache_players", return_value=False) as mock_build:
+            results = await asyncio.gather(
+                cache_client.rebuild_players_cache(),
+                cache_client.rebuild_players_cache(),
+            )
+
+        assert results == [False, False]
+        mock_build.assert_called_once()
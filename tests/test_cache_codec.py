@@ -0,0 +1,58 @@
+"""Tests for the cache blob codecs."""
+
+import gzip
+import json
+
+import pytest
+
+import cache_codec
+from cache_codec import (
+    GZIP_JSON,
+    ZSTD_JSON,
+    decode_blob,
+    encode_blob,
+    resolve_codec,
+)
+
+PLAYERS = {
+    "4046": {"full_name": "Patrick Mahömes", "stats": {"actual": None}, "age": 29}
+}
+
+
+class TestCodecs:
+    def test_gzip_round_trip(self):
+        blob = encode_blob(PLAYERS, "gzip")
+        assert blob[:2] == b"\x1f\x8b"
+        assert decode_blob(blob) == PLAYERS
+
+    def test_zstd_round_trip(self):
+        pytest.importorskip("zstandard")
+        blob = encode_blob(PLAYERS, "zstd")
+        assert blob[:4] == b"\x28\xb5\x2f\xfd"
+        assert decode_blob(blob) == PLAYERS
+
+    def test_reads_entries_written_before_codecs(self):
+        legacy = gzip.compress(json.dumps({"x": float("nan"), **PLAYERS}).encode())
+        decoded = decode_blob(legacy)
+        assert decoded["4046"] == PLAYERS["4046"]
+        assert decoded["x"] != decoded["x"]  # NaN
+
+    def test_stdlib_json_fallback(self, monkeypatch):
+        monkeypatch.setattr(cache_codec, "orjson", None)
+        assert decode_blob(encode_blob(PLAYERS, "gzip")) == PLAYERS
+
+    def test_unknown_format(self):
+        with pytest.raises(ValueError):
+            decode_blob(b"{}")
+
+
+class TestResolveCodec:
+    def test_default_and_names(self, monkeypatch):
+        monkeypatch.setattr(cache_codec, "CACHE_CODEC", "gzip")
+        assert resolve_codec() == GZIP_JSON
+        assert resolve_codec("bogus") == GZIP_JSON
+
+    def test_zstd_falls_back_without_zstandard(self, monkeypatch):
+        monkeypatch.setattr(cache_codec, "zstandard", None)
+        assert resolve_codec(ZSTD_JSON) == GZIP_JSON
+        assert encode_blob(PLAYERS, "zstd")[:2] == b"\x1f\x8b"
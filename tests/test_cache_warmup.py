@@ -0,0 +1,94 @@
+"""Tests for background cache warm-up."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from lib import cache_warmup
+
+
+@pytest.fixture(autouse=True)
+def reset_warmup_state():
+    """Start each test with warm-up idle."""
+    saved = dict(cache_warmup._warmup)
+    yield
+    cache_warmup._warmup.clear()
+    cache_warmup._warmup.update(saved)
+
+
+class TestWarmPlayerCache:
+    """Test warm-up decisions and readiness reporting."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_cache_skips_rebuild(self):
+        """A fresh Redis cache makes the server ready without rebuilding."""
+        with (
+            patch(
+                "lib.cache_warmup.get_cache_status_async",
+                AsyncMock(return_value={"exists": True, "age_hours": 1.0}),
+            ),
+            patch("lib.cache_warmup.rebuild_players_cache") as mock_rebuild,
+        ):
+            assert await cache_warmup.warm_player_cache() is True
+
+        mock_rebuild.assert_not_called()
+        assert cache_warmup.get_warmup_status()["status"] == "ready"
+
+    @pytest.mark.asyncio
+    async def test_stale_cache_serves_backup_while_rebuilding(self):
+        """The backup is loaded before the rebuild, so the server is ready early."""
+        seen = {}
+
+        async def rebuild():
+            seen.update(cache_warmup.get_warmup_status())
+            return True
+
+        with (
+            patch(
+                "lib.cache_warmup.get_cache_status_async",
+                AsyncMock(return_value={"exists": False}),
+            ),
+            patch("lib.cache_warmup.load_backup_players", return_value=250),
+            patch("lib.cache_warmup.rebuild_players_cache", side_effect=rebuild),
+        ):
+            assert await cache_warmup.warm_player_cache() is True
+
+        assert seen["status"] == "warming"
+        assert seen["ready"] is True
+        assert seen["serving_backup"] is True
+        status = cache_warmup.get_warmup_status()
+        assert status["serving_backup"] is False
+        assert status["last_refresh"] is not None
+
+    @pytest.mark.asyncio
+    async def test_failed_rebuild_without_backup_is_not_ready(self):
+        """With no backup and a failed rebuild, readiness is reported false."""
+        with (
+            patch(
+                "lib.cache_warmup.get_cache_status_async",
+                AsyncMock(return_value={"exists": False}),
+            ),
+            patch("lib.cache_warmup.load_backup_players", return_value=0),
+            patch("lib.cache_warmup.rebuild_players_cache", return_value=False),
+        ):
+            assert await cache_warmup.warm_player_cache() is False
+
+        status = cache_warmup.get_warmup_status()
+        assert status["status"] == "failed"
+        assert status["ready"] is False
+        assert status["last_error"] == "cache_players failed"
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_refresher(self):
+        """stop_cache_warmup cancels the periodic refresher."""
+        with (
+            patch("lib.cache_warmup.warm_player_cache", AsyncMock(return_value=True)),
+            patch("lib.cache_warmup.rebuild_players_cache") as mock_rebuild,
+        ):
+            cache_warmup.start_cache_warmup(periodic_refresh=True)
+            tasks = list(cache_warmup._warmup["tasks"])
+            await cache_warmup.stop_cache_warmup()
+
+        assert len(tasks) == 2
+        assert all(task.done() for task in tasks)
+        mock_rebuild.assert_not_called()
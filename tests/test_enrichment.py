@@ -9,6 +9,9 @@ from lib.enrichment import (
     enrich_player_injury_news,
     enrich_player_full,
     enrich_player_minimal,
+    enrich_players_full,
+    collect_transaction_player_ids,
+    enrich_transaction_moves,
     get_trending_data_map,
     get_recent_drops_set,
     add_trending_data,
@@ -372,6 +375,50 @@ class TestEnrichPlayerMinimal:
         assert "projected_points" not in result
 
 
+class TestEnrichPlayersFull:
+    """Tests for enrich_players_full()."""
+
+    def test_enriches_in_order_and_skips_empty_ids(self):
+        """Test batch enrichment keeps ID order and handles missing players."""
+        players = {
+            "4046": {"full_name": "Patrick Mahomes", "position": "QB"},
+            "7528": {"full_name": "Justin Jefferson", "position": "WR"},
+        }
+        result = enrich_players_full(["7528", None, "4046", "0000"], players)
+
+        assert [p["player_id"] for p in result] == ["7528", "4046", "0000"]
+        assert result[0]["name"] == "Justin Jefferson"
+        assert result[2]["name"] == "0000 (Unknown)"
+        assert result[2]["stats"]["projected"] is None
+
+
+class TestTransactionEnrichment:
+    """Tests for collect_transaction_player_ids() and enrich_transaction_moves()."""
+
+    def test_collects_adds_and_drops(self):
+        """Test all added and dropped players are collected once."""
+        transactions = [
+            {"adds": {"1": 2}, "drops": {"3": 2}},
+            {"adds": {"1": 4}, "drops": None},
+            {"type": "commissioner"},
+        ]
+        assert collect_transaction_player_ids(transactions) == {"1", "3"}
+
+    def test_enrich_moves(self):
+        """Test moves are replaced with player info, unknown players marked."""
+        players = {"1": {"full_name": "Player One", "team": "KC", "position": "RB"}}
+        result = enrich_transaction_moves({"1": 2, "9": 2}, players)
+
+        assert result["1"] == {
+            "roster_id": 2,
+            "player_name": "Player One",
+            "team": "KC",
+            "position": "RB",
+        }
+        assert result["9"]["player_name"] == "Unknown"
+        assert enrich_transaction_moves(None, players) is None
+
+
 class TestGetTrendingDataMap:
     """Tests for get_trending_data_map()."""
 
@@ -0,0 +1,136 @@
+"""Tests for the materialized free-agent pool."""
+
+import random
+from unittest.mock import patch
+
+import pytest
+
+from lib import free_agent_pool
+from lib.enrichment import enrich_player_minimal
+from lib.free_agent_pool import (
+    build_free_agent_pool,
+    get_free_agent_pool,
+    query_free_agent_pool,
+    relevance_key,
+)
+from player_views import LazyPlayers
+
+POSITIONS = ["QB", "RB", "WR", "TE", "K", "DEF"]
+
+
+def _players(count=300, seed=7):
+    rng = random.Random(seed)
+    players = {}
+    for i in range(count):
+        player = {
+            "full_name": f"Player {rng.choice('ABCDEFGH')}{i}",
+            "position": rng.choice(POSITIONS),
+            "team": rng.choice(["KC", "BUF", None]),
+            "status": rng.choice(["Active", "Inactive"]),
+        }
+        if rng.random() < 0.7:
+            player["stats"] = {
+                "projected": {"fantasy_points": round(rng.uniform(0, 25), 1)}
+            }
+        players[str(i)] = player
+    return players
+
+
+def _naive(players, rostered, position, search_term, limit, trending, drops):
+    """The full scan get_waiver_wire_players used to do."""
+    entries = []
+    for player_id, player_data in players.items():
+        if player_id in rostered:
+            continue
+        if position and player_data.get("position") != position:
+            continue
+        if search_term and search_term.lower() not in player_data["full_name"].lower():
+            continue
+        entries.append(
+            {
+                "player_id": player_id,
+                "rank": free_agent_pool._static_rank(
+                    enrich_player_minimal(player_id, player_data)
+                ),
+            }
+        )
+    entries.sort(key=lambda entry: relevance_key(entry, trending, drops))
+    return len(entries), [entry["player_id"] for entry in entries[:limit]]
+
+
+class TestQueryFreeAgentPool:
+    @pytest.mark.parametrize(
+        "position,search_term", [(None, None), ("WR", None), (None, "a"), ("RB", "b")]
+    )
+    def test_matches_full_scan(self, position, search_term):
+        players = _players()
+        rostered = {str(i) for i in range(0, 300, 7)}
+        trending = {"5": 40, "12": 10, "201": 3, "7": 99}
+        drops = {"9", "44", "14"}
+        pool = build_free_agent_pool(players, rostered)
+
+        total, entries = query_free_agent_pool(
+            pool, position, search_term, 25, trending, drops
+        )
+
+        assert (total, [e["player_id"] for e in entries]) == _naive(
+            players, rostered, position, search_term, 25, trending, drops
+        )
+
+    def test_rostered_players_excluded(self):
+        players = _players(20)
+        pool = build_free_agent_pool(players, {"3"})
+        total, entries = query_free_agent_pool(pool, limit=50, trending_map={"3": 9})
+        assert total == 19
+        assert "3" not in [e["player_id"] for e in entries]
+
+
+class TestGetFreeAgentPool:
+    @pytest.mark.asyncio
+    async def test_rebuilt_only_when_inputs_change(self):
+        players = _players(20)
+        with patch(
+            "lib.free_agent_pool.build_free_agent_pool",
+            wraps=build_free_agent_pool,
+        ) as mock_build:
+            first = await get_free_agent_pool(players, {"1"})
+            assert await get_free_agent_pool(players, {"1"}) is first
+            await get_free_agent_pool(players, {"1", "2"})
+            await get_free_agent_pool(dict(players), {"1", "2"})
+
+        assert mock_build.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_leagues_share_one_ranking(self):
+        players = _players(20)
+        with patch(
+            "lib.free_agent_pool.rank_players", wraps=free_agent_pool.rank_players
+        ) as mock_rank:
+            league_a = await get_free_agent_pool(players, {"1"})
+            league_b = await get_free_agent_pool(players, {"2", "3"})
+            assert await get_free_agent_pool(players, {"1"}) is league_a
+            assert await get_free_agent_pool(players, {"2", "3"}) is league_b
+
+        mock_rank.assert_called_once()
+        assert len(league_a["by_id"]) == 19
+        assert len(league_b["by_id"]) == 18
+
+    @pytest.mark.asyncio
+    async def test_spot_refresh_reranks_only_updated_players(self):
+        players = LazyPlayers(_players())
+        await get_free_agent_pool(players, {"1"})
+        refreshed = players.with_updates(
+            {"5": {**players["5"], "stats": {"projected": {"fantasy_points": 99}}}}
+        )
+
+        with patch(
+            "lib.free_agent_pool.rank_players", wraps=free_agent_pool.rank_players
+        ) as mock_rank:
+            pool = await get_free_agent_pool(refreshed, {"1"})
+
+        mock_rank.assert_called_once()
+        assert set(mock_rank.call_args.args[0]) == {"5"}
+        expected = build_free_agent_pool(dict(refreshed), {"1"})
+        assert [e["player_id"] for e in pool["partitions"]["ALL"]] == [
+            e["player_id"] for e in expected["partitions"]["ALL"]
+        ]
@@ -0,0 +1,41 @@
+"""Tests for the shared pooled HTTP clients."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lib.http_client import (  # noqa: E402
+    FANTASY_NERDS,
+    SLEEPER,
+    close_http_clients,
+    get_http_client,
+)
+
+
+class TestSharedHttpClient:
+    """Test reuse and shutdown of the per-upstream clients."""
+
+    @pytest.mark.asyncio
+    async def test_client_is_reused_per_upstream(self):
+        """Repeated calls return the same client for an upstream."""
+        try:
+            assert get_http_client() is get_http_client(SLEEPER)
+            assert get_http_client(FANTASY_NERDS) is not get_http_client(SLEEPER)
+        finally:
+            await close_http_clients()
+
+    @pytest.mark.asyncio
+    async def test_close_http_clients(self):
+        """Closed clients are replaced on the next call."""
+        client = get_http_client()
+        await close_http_clients()
+        assert client.is_closed
+
+        replacement = get_http_client()
+        try:
+            assert replacement is not client
+            assert not replacement.is_closed
+        finally:
+            await close_http_clients()
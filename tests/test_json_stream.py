@@ -0,0 +1,65 @@
+"""Tests for incremental JSON object decoding."""
+
+import json
+
+import pytest
+
+from json_stream import JSONObjectStream
+
+DOCUMENT = json.dumps(
+    {
+        "4046": {"full_name": "Patrick Mahömes", "age": 29, "injury": None},
+        "TEAM": [1, 2.5, -3e2, True, False],
+        'quote"d': "a \\u00e9 \\\\ b",
+        "n": 12345,
+    },
+    indent=2,
+    ensure_ascii=False,
+)
+
+
+def _decode(chunks):
+    stream = JSONObjectStream()
+    members = []
+    for chunk in chunks:
+        members.extend(stream.feed(chunk))
+    members.extend(stream.close())
+    return members
+
+
+class TestJSONObjectStream:
+    def test_every_split_point(self):
+        expected = list(json.loads(DOCUMENT).items())
+        for split in range(len(DOCUMENT) + 1):
+            chunks = [DOCUMENT[:split], DOCUMENT[split:]]
+            assert _decode(chunks) == expected, f"split at {split}"
+
+    def test_single_characters(self):
+        assert dict(_decode(DOCUMENT)) == json.loads(DOCUMENT)
+
+    def test_members_returned_as_they_complete(self):
+        stream = JSONObjectStream()
+        assert stream.feed('{"a": {"x": 1}, "b": ') == [("a", {"x": 1})]
+        assert stream.feed('[2], "c": 1') == [("b", [2])]
+        # The number could still grow until a delimiter arrives
+        assert stream.feed("0") == []
+        assert stream.feed("}") == [("c", 10)]
+        assert stream.close() == []
+
+    @pytest.mark.parametrize(
+        "head,tail",
+        [('{"a": 1.', "5e3}"), ('{"a": 1.5e', "3}"), ('{"a": -1.5e-', "3}")],
+    )
+    def test_number_split_after_point_or_exponent(self, head, tail):
+        assert _decode([head, tail]) == list(json.loads(head + tail).items())
+
+    def test_empty_object(self):
+        assert _decode([" {", " } "]) == []
+
+    @pytest.mark.parametrize(
+        "text",
+        ["[1, 2]", '{"a": 1', '{"a": 1,}', '{"a" 1}', "{1: 2}", '{"a": 1} {}'],
+    )
+    def test_invalid_documents(self, text):
+        with pytest.raises(ValueError):
+            _decode([text])
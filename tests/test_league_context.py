@@ -0,0 +1,98 @@
+"""Tests for per-connection league selection."""
+
+import asyncio
+import logging
+import socket
+from unittest.mock import patch
+
+import pytest
+import uvicorn
+from fastmcp import Client
+from fastmcp.client.transports import SSETransport
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from lib import league_context
+from lib.league_context import (
+    DEFAULT_LEAGUE_ID,
+    current_league_id,
+    use_league,
+    validate_league_id,
+)
+from sleeper_mcp import HTTP_MIDDLEWARE, LeagueMiddleware, mcp
+
+
+class TestLeagueContext:
+    def test_defaults_to_configured_league(self):
+        assert current_league_id() == DEFAULT_LEAGUE_ID
+
+    def test_use_league_is_scoped(self):
+        with use_league("42"):
+            assert current_league_id() == "42"
+        assert current_league_id() == DEFAULT_LEAGUE_ID
+
+    @pytest.mark.parametrize("league_id", ["", "abc", "12/../34", "1" * 33])
+    def test_rejects_malformed_ids(self, league_id):
+        with pytest.raises(ValueError):
+            validate_league_id(league_id)
+
+    def test_allow_list(self):
+        with patch.object(league_context, "ALLOWED_LEAGUE_IDS", frozenset({"1"})):
+            assert validate_league_id("1") == "1"
+            with pytest.raises(ValueError):
+                validate_league_id("2")
+
+
+class TestLeagueMiddleware:
+    @pytest.fixture
+    def client(self):
+        async def league(request):
+            return PlainTextResponse(current_league_id())
+
+        app = Starlette(
+            routes=[Route("/league", league)],
+            middleware=[Middleware(LeagueMiddleware)],
+        )
+        return TestClient(app)
+
+    def test_query_parameter_selects_league(self, client):
+        assert client.get("/league?league_id=987").text == "987"
+        assert client.get("/league").text == DEFAULT_LEAGUE_ID
+
+    def test_invalid_league_rejected(self, client):
+        response = client.get("/league?league_id=nope")
+        assert response.status_code == 400
+        assert "Invalid league_id" in response.json()["error"]
+
+
+class TestHTTPMiddlewareSSE:
+    @pytest.mark.asyncio
+    async def test_sse_session_opens_and_closes(self, caplog):
+        """The middleware must not break FastMCP's SSE handler on session close."""
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+
+        app = mcp.http_app(transport="sse", middleware=HTTP_MIDDLEWARE)
+        server = uvicorn.Server(
+            uvicorn.Config(app, host="127.0.0.1", port=port, log_config=None)
+        )
+        serve = asyncio.create_task(server.serve())
+        try:
+            while not server.started:
+                await asyncio.sleep(0.01)
+
+            url = f"http://127.0.0.1:{port}/sse?league_id=987&api_key=test"
+            with caplog.at_level(logging.ERROR):
+                async with Client(SSETransport(url)) as client:
+                    tools = await client.list_tools()
+                await asyncio.sleep(0.1)
+        finally:
+            server.should_exit = True
+            await serve
+
+        assert any(tool.name == "get_league_info" for tool in tools)
+        assert not [r for r in caplog.records if r.levelno >= logging.ERROR]
@@ -0,0 +1,74 @@
+"""Tests for the shared roster-ownership index."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from lib.league_state import build_league_state, get_league_state
+
+BASE_URL = "https://api.sleeper.app/v1"
+LEAGUE_ID = "123"
+
+ROSTERS = [
+    {"roster_id": 1, "players": ["10", "11", "12"], "starters": ["10", "0"]},
+    {"roster_id": 2, "players": ["20", "21"], "starters": ["20", "21"]},
+    {"roster_id": 3, "players": None, "starters": None},
+]
+
+PLAYERS = {
+    "10": {"position": "QB"},
+    "11": {"position": "WR"},
+    "12": {"position": "WR"},
+    "20": {"position": "RB"},
+}
+
+
+def _client(rosters):
+    """Mock client whose rosters response can be swapped between calls."""
+    response = MagicMock()
+    response.status_code = 200
+    response.json = lambda: rosters
+    client = MagicMock()
+    client.get = AsyncMock(return_value=response)
+    return client
+
+
+@pytest.fixture(autouse=True)
+def players():
+    with patch(
+        "lib.league_state.get_players_by_ids_async",
+        side_effect=lambda ids: {pid: PLAYERS[pid] for pid in ids if pid in PLAYERS},
+    ) as mock_players:
+        yield mock_players
+
+
+class TestBuildLeagueState:
+    def test_ownership_starters_and_position_counts(self):
+        state = build_league_state(LEAGUE_ID, ROSTERS, PLAYERS)
+
+        assert state["owners"]["11"] == 1
+        assert state["owners"]["21"] == 2
+        assert state["rostered"] == {"10", "11", "12", "20", "21"}
+        assert state["starters"][1] == {"10"}
+        assert state["starters"][3] == frozenset()
+        assert state["position_counts"][1] == {"QB": 1, "WR": 2}
+        assert state["position_counts"][2] == {"RB": 1}
+        assert state["rosters"][2]["players"] == ["20", "21"]
+
+
+class TestGetLeagueState:
+    @pytest.mark.asyncio
+    async def test_reused_until_rosters_change(self, players):
+        first = await get_league_state(_client(ROSTERS), BASE_URL, LEAGUE_ID)
+        assert await get_league_state(_client(ROSTERS), BASE_URL, LEAGUE_ID) is first
+        assert players.call_count == 1
+
+        moved = [
+            {**ROSTERS[0], "players": ["10", "11"]},
+            {**ROSTERS[1], "players": ["20", "21", "12"]},
+            ROSTERS[2],
+        ]
+        state = await get_league_state(_client(moved), BASE_URL, LEAGUE_ID)
+
+        assert state["owners"]["12"] == 2
+        assert players.call_count == 2
@@ -0,0 +1,157 @@
+"""Tests for live score subscriptions."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from lib import live_feed, live_scoring
+from lib.live_feed import Subscription, sse_event, sse_stream, subscribe
+from lib.live_scoring import LIVE, build_scoreboard
+
+BASE_URL = "https://api.sleeper.app/v1"
+LEAGUE_ID = "123"
+
+PLAYERS = {
+    pid: {"full_name": f"Player {pid}", "stats": {"projected": {"fantasy_points": 10}}}
+    for pid in ("1", "2", "3", "4")
+}
+
+
+def _scoreboard(points):
+    """Scoreboard with two matchups; points maps roster_id -> points."""
+    matchups = [
+        {
+            "roster_id": roster_id,
+            "matchup_id": (roster_id + 1) // 2,
+            "points": points.get(roster_id, 0.0),
+            "starters": [str(roster_id)],
+            "players_points": {str(roster_id): points.get(roster_id, 0.0)},
+        }
+        for roster_id in (1, 2, 3, 4)
+    ]
+    return build_scoreboard(matchups, PLAYERS, set(), LIVE), LIVE
+
+
+@pytest.fixture
+def upstream():
+    """Scoreboard computation driven by a mutable points map."""
+    points = {}
+    compute = AsyncMock(side_effect=lambda *args: _scoreboard(points))
+    with (
+        patch("lib.live_scoring.compute_scoreboard", compute),
+        patch.object(live_scoring, "LIVE_SCORING_REFRESH_SECONDS", 0),
+        patch.object(live_feed, "LIVE_FEED_POLL_SECONDS", 0.01),
+    ):
+        yield points, compute
+
+
+async def _next(subscription):
+    return await asyncio.wait_for(subscription.get(), timeout=1)
+
+
+class TestSubscribe:
+    @pytest.mark.asyncio
+    async def test_subscribers_share_one_poller(self, upstream):
+        points, _ = upstream
+        client = MagicMock()
+
+        async with (
+            subscribe(client, BASE_URL, LEAGUE_ID, 5) as first,
+            subscribe(client, BASE_URL, LEAGUE_ID, 5) as second,
+        ):
+            assert (await _next(first))["full"] is True
+            assert (await _next(second))["full"] is True
+            assert live_feed.live_feed_status() == {f"{LEAGUE_ID}:5": 2}
+
+            points[1] = 12.0
+            delta_first = await _next(first)
+            delta_second = await _next(second)
+
+            assert delta_first == delta_second
+            assert delta_first["full"] is False
+            assert set(delta_first["teams"]) == {"1"}
+            assert set(delta_first["matchups"]) == {"1"}
+
+        assert live_feed.live_feed_status() == {}
+
+    @pytest.mark.asyncio
+    async def test_roster_filter(self, upstream):
+        points, _ = upstream
+
+        async with subscribe(MagicMock(), BASE_URL, LEAGUE_ID, 5, roster_id=3) as sub:
+            snapshot = await _next(sub)
+            assert set(snapshot["teams"]) == {"3"}
+            assert set(snapshot["matchups"]) == {"2"}
+
+            points[1] = 5.0  # Another matchup: not sent
+            await asyncio.sleep(0.05)
+            points[4] = 7.0
+            delta = await _next(sub)
+
+        assert delta["teams"] == {}
+        assert set(delta["matchups"]) == {"2"}
+        assert delta["matchups"]["2"]["roster_ids"] == [3, 4]
+
+
+class TestSubscription:
+    def test_full_backlog_replaced_by_snapshot(self):
+        board = live_scoring._new_board()
+        live_scoring.apply_scoreboard(board, *_scoreboard({}))
+        update = {"league_id": LEAGUE_ID, "week": 5, "full": False, "version": 2}
+
+        with patch.object(live_feed, "LIVE_FEED_QUEUE_SIZE", 2):
+            subscription = Subscription()
+        for _ in range(3):
+            subscription.publish({**update, "teams": {"1": {}}, "matchups": {}}, board)
+
+        assert subscription.queue.qsize() == 1
+        snapshot = subscription.queue.get_nowait()
+        assert snapshot["full"] is True
+        assert snapshot["league_id"] == LEAGUE_ID
+        assert set(snapshot["teams"]) == {"1", "2", "3", "4"}
+
+
+class TestEventStream:
+    def test_event_format(self):
+        message = {"version": 4, "full": False, "teams": {}, "matchups": {}}
+
+        event = sse_event(message)
+
+        assert event.startswith("id: 4\nevent: delta\ndata: ")
+        assert json.loads(event.split("data: ", 1)[1]) == message
+
+    @pytest.mark.asyncio
+    async def test_keep_alive_when_idle(self):
+        subscription = Subscription()
+        with patch.object(live_feed, "LIVE_FEED_KEEPALIVE_SECONDS", 0.01):
+            stream = sse_stream(subscription)
+            assert await stream.__anext__() == ": keep-alive\n\n"
+            subscription.queue.put_nowait({"version": 1, "full": True})
+            assert (await stream.__anext__()).startswith("id: 1\nevent: scoreboard")
+            await stream.aclose()
+
+
+class TestLiveRoute:
+    @pytest.fixture
+    def client(self):
+        from sleeper_mcp import live_scores_route
+
+        return TestClient(Starlette(routes=[Route("/live/{week}", live_scores_route)]))
+
+    def test_invalid_parameters(self, client):
+        assert client.get("/live/99").status_code == 400
+        assert client.get("/live/3?roster_id=abc").status_code == 400
+
+    def test_upstream_failure_before_stream(self, client):
+        with patch(
+            "sleeper_mcp.refresh_live_scoreboard",
+            AsyncMock(side_effect=RuntimeError("down")),
+        ):
+            response = client.get("/live/3")
+
+        assert response.status_code == 502
@@ -0,0 +1,179 @@
+"""Tests for the live matchup scoring engine."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+import sleeper_mcp
+from lib import live_scoring
+from lib.live_scoring import (
+    FINAL,
+    LIVE,
+    UPCOMING,
+    build_scoreboard,
+    get_live_scoreboard,
+    win_probability,
+)
+
+BASE_URL = "https://api.sleeper.app/v1"
+LEAGUE_ID = "123"
+
+PLAYERS = {
+    pid: {
+        "full_name": f"Player {pid}",
+        "position": "WR",
+        "stats": {"projected": {"fantasy_points": 10.0}},
+    }
+    for pid in ("1", "2", "3", "4")
+}
+
+
+def _matchups(points_1=0.0):
+    return [
+        {
+            "roster_id": 1,
+            "matchup_id": 1,
+            "points": points_1,
+            "starters": ["1", "2", "0"],
+            "players_points": {"1": points_1},
+        },
+        {
+            "roster_id": 2,
+            "matchup_id": 1,
+            "points": 0.0,
+            "starters": ["3", "4"],
+            "players_points": {},
+        },
+    ]
+
+
+class TestScoring:
+    def test_win_probability(self):
+        assert win_probability(100, 10, 100, 10) == pytest.approx(0.5)
+        assert win_probability(110, 10, 100, 10) > 0.5
+        assert win_probability(90, 0, 80, 0) == 1.0
+
+    def test_upcoming_week_is_all_projection(self):
+        board = build_scoreboard(_matchups(), PLAYERS, set(), UPCOMING)
+
+        team = board["teams"]["1"]
+        assert [s["player_id"] for s in team["starters"]] == ["1", "2"]
+        assert team["projected_final"] == 20.0
+        assert board["matchups"]["1"]["win_probability"] == {"1": 0.5, "2": 0.5}
+
+    def test_live_week_counts_started_players(self):
+        board = build_scoreboard(_matchups(points_1=8.0), PLAYERS, {"1"}, LIVE)
+
+        starters = {s["player_id"]: s for s in board["teams"]["1"]["starters"]}
+        assert starters["1"]["status"] == "in_progress"
+        assert starters["1"]["remaining"] == 5.0  # Half of the projection
+        assert starters["2"]["status"] == "not_started"
+        assert board["teams"]["1"]["projected_final"] == 23.0
+        assert board["matchups"]["1"]["win_probability"]["1"] > 0.5
+
+    def test_final_week_has_nothing_remaining(self):
+        board = build_scoreboard(_matchups(points_1=8.0), PLAYERS, set(), FINAL)
+
+        assert board["teams"]["1"]["remaining"] == 0
+        assert board["matchups"]["1"]["win_probability"] == {"1": 1.0, "2": 0.0}
+
+
+@pytest.fixture
+def upstream():
+    """Mocked matchups endpoint, live week payload and player lookup."""
+    state = {"matchups": _matchups(), "stats": {}}
+
+    async def get(url, **kwargs):
+        response = MagicMock()
+        response.status_code = 200
+        response.headers = {}
+        response.json = lambda: state["matchups"]
+        return response
+
+    client = MagicMock()
+    client.get = AsyncMock(side_effect=get)
+    with (
+        patch(
+            "lib.live_scoring.get_live_week_stats",
+            side_effect=lambda: {"week": 5, "stats": state["stats"]},
+        ),
+        patch(
+            "lib.live_scoring.get_players_by_ids_async",
+            side_effect=lambda ids: {pid: PLAYERS[pid] for pid in ids},
+        ),
+    ):
+        yield client, state
+
+
+class TestLiveScoreboard:
+    @pytest.mark.asyncio
+    async def test_polls_within_window_reuse_state(self, upstream):
+        client, _ = upstream
+
+        first = await get_live_scoreboard(client, BASE_URL, LEAGUE_ID, 5)
+        second = await get_live_scoreboard(client, BASE_URL, LEAGUE_ID, 5, 1)
+
+        assert client.get.await_count == 1
+        assert first["full"] is True and first["version"] == 1
+        assert first["phase"] == LIVE
+        assert set(first["teams"]) == {"1", "2"}
+        assert second["full"] is False
+        assert second["teams"] == {} and second["matchups"] == {}
+
+    @pytest.mark.asyncio
+    async def test_changes_since_version(self, upstream):
+        client, state = upstream
+        first = await get_live_scoreboard(client, BASE_URL, LEAGUE_ID, 5)
+
+        state["matchups"] = _matchups(points_1=8.0)
+        state["stats"] = {"1": {"fantasy_points": 8.0}}
+        with patch.object(live_scoring, "LIVE_SCORING_REFRESH_SECONDS", 0):
+            diff = await get_live_scoreboard(
+                client, BASE_URL, LEAGUE_ID, 5, first["version"]
+            )
+            unchanged = await get_live_scoreboard(
+                client, BASE_URL, LEAGUE_ID, 5, diff["version"]
+            )
+
+        assert diff["version"] == 2 and diff["full"] is False
+        assert set(diff["teams"]) == {"1"}
+        assert diff["teams"]["1"]["actual"] == 8.0
+        assert set(diff["matchups"]) == {"1"}
+        assert unchanged["version"] == 2
+        assert unchanged["teams"] == {} and unchanged["matchups"] == {}
+
+    @pytest.mark.asyncio
+    async def test_unknown_version_gets_full_scoreboard(self, upstream):
+        client, _ = upstream
+
+        result = await get_live_scoreboard(client, BASE_URL, LEAGUE_ID, 5, 99)
+
+        assert result["full"] is True
+        assert set(result["teams"]) == {"1", "2"}
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_serves_last_state(self, upstream):
+        client, _ = upstream
+        await get_live_scoreboard(client, BASE_URL, LEAGUE_ID, 5)
+
+        client.get = AsyncMock(side_effect=RuntimeError("down"))
+        with patch.object(live_scoring, "LIVE_SCORING_REFRESH_SECONDS", 0):
+            result = await get_live_scoreboard(client, BASE_URL, LEAGUE_ID, 5)
+
+        assert result["version"] == 1
+        assert set(result["teams"]) == {"1", "2"}
+
+
+class TestLiveScoresTool:
+    @pytest.mark.asyncio
+    async def test_failure_returns_error_response(self):
+        with patch(
+            "sleeper_mcp.get_live_scoreboard",
+            AsyncMock(side_effect=RuntimeError("Sleeper unavailable")),
+        ):
+            result = await sleeper_mcp.get_live_scores.fn(5)
+
+        assert result == {
+            "error": "Failed to get live scores: Sleeper unavailable",
+            "week": 5,
+        }
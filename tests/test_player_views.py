@@ -0,0 +1,96 @@
+"""Tests for the lazy player views."""
+
+import json
+
+import pytest
+
+from player_views import (
+    ActivePlayersView,
+    LazyPlayers,
+    players_blob_payload,
+    players_from_blob_payload,
+)
+
+PLAYERS = {
+    "1": {"full_name": "Active Player", "active": True, "team": "KC"},
+    "2": {"full_name": "Free Agent", "active": True, "team": None},
+    "3": {"full_name": "Retired Player", "active": False, "team": None},
+}
+
+
+def _lazy():
+    return LazyPlayers({pid: json.dumps(p) for pid, p in PLAYERS.items()})
+
+
+class TestLazyPlayers:
+    def test_decodes_only_players_read(self):
+        players = _lazy()
+
+        assert len(players) == 3
+        assert "2" in players and "9" not in players
+        assert players.decoded_count == 0
+
+        assert players["1"] == PLAYERS["1"]
+        assert players["1"] is players["1"]
+        assert players.get("9") is None
+        assert players.decoded_count == 1
+
+    def test_with_updates_shares_unchanged_players(self):
+        players = _lazy()
+        kept = players["1"]
+        signed = {"full_name": "Free Agent", "active": True, "team": "BUF"}
+
+        updated = players.with_updates({"2": signed})
+
+        assert updated["1"] is kept
+        assert updated["2"] is signed
+        assert players["2"] == PLAYERS["2"]
+        assert updated.decoded_count == 2
+        assert updated.lineage is players.lineage
+        assert updated.updated_ids == {"2"}
+
+
+class TestActivePlayersView:
+    def test_filters_without_copying(self):
+        players = _lazy()
+        active = ActivePlayersView(players)
+
+        assert "1" in active and "2" not in active
+        assert active.get("3") is None
+        with pytest.raises(KeyError):
+            active["2"]
+        assert dict(active) == {"1": PLAYERS["1"]}
+
+    def test_known_active_ids_skip_decoding(self):
+        players = players_from_blob_payload(
+            json.loads(json.dumps(players_blob_payload(PLAYERS)))
+        )
+        active = ActivePlayersView(players)
+
+        assert len(active) == 1 and list(active) == ["1"]
+        assert players.decoded_count == 0
+
+    def test_updates_keep_active_ids_current(self):
+        players = players_from_blob_payload(players_blob_payload(PLAYERS))
+        updated = players.with_updates(
+            {
+                "1": {**PLAYERS["1"], "active": False},
+                "2": {**PLAYERS["2"], "team": "SF"},
+            }
+        )
+
+        assert list(ActivePlayersView(updated)) == ["2"]
+
+
+class TestBlobPayload:
+    def test_round_trip(self):
+        payload = players_blob_payload(_lazy())
+
+        assert payload["active_ids"] == ["1"]
+        assert dict(players_from_blob_payload(payload)) == PLAYERS
+
+    def test_reads_legacy_blob(self):
+        players = players_from_blob_payload(PLAYERS)
+
+        assert dict(players) == PLAYERS
+        assert list(ActivePlayersView(players)) == ["1"]
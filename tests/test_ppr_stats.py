@@ -0,0 +1,56 @@
+"""Tests for PPR stat filtering."""
+
+import build_cache
+import cache_client
+from ppr_stats import filter_ppr_relevant_stats, iter_ppr_relevant_stats
+
+PAYLOAD = {
+    "4046": {
+        "rec": 5.0,
+        "pts_ppr": 22.4,
+        "pass_yd": 0,
+        "rush_yd": None,
+        "rec_yd": 87.0,
+        "gp": 1.0,
+    },
+    "1111": {"pass_yd": 12.0},  # no PPR points
+    "2222": {"pts_ppr": 0, "rec": 1.0},  # zero PPR points
+    "TEAM": "not-a-dict",
+}
+
+
+class TestFilter:
+    def test_renames_in_field_order_and_drops_empty_values(self):
+        result = filter_ppr_relevant_stats(PAYLOAD)
+
+        assert list(result) == ["4046", "TEAM"]
+        assert list(result["4046"].items()) == [
+            ("fantasy_points", 22.4),
+            ("receptions", 5.0),
+            ("receiving_yards", 87.0),
+        ]
+        assert result["TEAM"] == "not-a-dict"
+
+    def test_player_subset(self):
+        result = filter_ppr_relevant_stats(PAYLOAD, player_ids=["2222", "4046", "x"])
+        assert list(result) == ["4046"]
+
+    def test_one_implementation_shared(self):
+        assert build_cache.filter_ppr_relevant_stats is filter_ppr_relevant_stats
+        assert cache_client.filter_ppr_relevant_stats is filter_ppr_relevant_stats
+
+
+class TestStreaming:
+    def test_matches_filter(self):
+        pairs = iter_ppr_relevant_stats(iter(PAYLOAD.items()))
+        assert dict(pairs) == filter_ppr_relevant_stats(PAYLOAD)
+
+    def test_skips_players_outside_subset_without_reading_them(self):
+        class Unreadable(dict):
+            def get(self, *args):
+                raise AssertionError("stats read for a skipped player")
+
+        pairs = [("1", Unreadable()), ("4046", PAYLOAD["4046"])]
+        result = list(iter_ppr_relevant_stats(pairs, player_ids={"4046"}))
+
+        assert [player_id for player_id, _ in result] == ["4046"]
@@ -0,0 +1,106 @@
+"""Tests for the per-invocation request memo."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from lib.decorators import log_mcp_tool
+from lib.request_context import in_request_context, memoized, request_context
+from lib.sleeper_cache import fetch_sleeper_json
+
+
+def _counting_factory(value="value"):
+    calls = []
+
+    async def factory():
+        calls.append(1)
+        await asyncio.sleep(0)
+        return value
+
+    return factory, calls
+
+
+class TestMemoized:
+    @pytest.mark.asyncio
+    async def test_outside_context_calls_every_time(self):
+        factory, calls = _counting_factory()
+        await memoized("key", factory)
+        await memoized("key", factory)
+        assert len(calls) == 2
+        assert not in_request_context()
+
+    @pytest.mark.asyncio
+    async def test_inside_context_calls_once_including_concurrent(self):
+        factory, calls = _counting_factory()
+        with request_context():
+            results = await asyncio.gather(
+                memoized("key", factory), memoized("key", factory)
+            )
+            await memoized("key", factory)
+            await memoized("other", factory)
+        assert results == ["value", "value"]
+        assert len(calls) == 2  # "key" once, "other" once
+
+    @pytest.mark.asyncio
+    async def test_failures_are_retried(self):
+        attempts = []
+
+        async def flaky():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("down")
+            return "ok"
+
+        with request_context():
+            with pytest.raises(RuntimeError):
+                await memoized("key", flaky)
+            assert await memoized("key", flaky) == "ok"
+
+    @pytest.mark.asyncio
+    async def test_copy_result_isolates_callers(self):
+        factory, _ = _counting_factory({"players": ["1"]})
+        with request_context():
+            first = await memoized("key", factory, copy_result=True)
+            first["players"].append("2")
+            second = await memoized("key", factory, copy_result=True)
+        assert second == {"players": ["1"]}
+
+
+class TestToolComposition:
+    @pytest.mark.asyncio
+    async def test_nested_tools_share_one_memo(self):
+        factory, calls = _counting_factory()
+
+        @log_mcp_tool
+        async def inner_tool():
+            return await memoized("source", factory)
+
+        @log_mcp_tool
+        async def composite_tool():
+            await inner_tool()
+            await inner_tool()
+            return await memoized("source", factory)
+
+        await composite_tool()
+        assert len(calls) == 1
+
+        # A separate top-level invocation starts with an empty memo
+        await composite_tool()
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_sleeper_json_read_once_per_request(self):
+        response = MagicMock()
+        response.json = lambda: [{"roster_id": 1}]
+        client = MagicMock()
+        client.get = AsyncMock(return_value=response)
+        url = "https://api.sleeper.app/v1/league/1/rosters"
+
+        with request_context():
+            first = await fetch_sleeper_json(client, url)
+            first.append({"roster_id": 2})
+            second = await fetch_sleeper_json(client, url)
+
+        assert second == [{"roster_id": 1}]
+        assert client.get.await_count == 1
@@ -0,0 +1,166 @@
+"""Tests for the prebuilt player name search index."""
+
+import gzip
+import json
+from unittest.mock import patch
+
+import fakeredis
+import pytest
+
+import cache_client
+from build_cache import (
+    PLAYER_SEARCH_INDEX_KEY,
+    PLAYERS_CACHE_KEY,
+    PLAYERS_CACHE_VERSION_KEY,
+)
+from search_index import (
+    build_search_index,
+    load_search_index,
+    player_name_keys,
+    query_search_index,
+)
+
+PLAYERS = {
+    "4046": {
+        "full_name": "Patrick Mahomes",
+        "first_name": "Patrick",
+        "last_name": "Mahomes",
+        "position": "QB",
+        "team": "KC",
+        "active": True,
+        "depth_chart_order": 1,
+        "stats": {"projected": {"fantasy_points": 22.0}},
+    },
+    "9999": {
+        "full_name": "Pat Mahomesby",
+        "first_name": "Pat",
+        "last_name": "Mahomesby",
+        "position": "WR",
+        "team": None,
+        "active": True,
+    },
+    "6794": {
+        "full_name": "Justin Jefferson",
+        "first_name": "Justin",
+        "last_name": "Jefferson",
+        "position": "WR",
+        "team": "MIN",
+        "active": True,
+        "stats": {"projected": {"fantasy_points": 18.0}},
+    },
+    "1111": {
+        "full_name": "Van Jefferson",
+        "first_name": "Van",
+        "last_name": "Jefferson",
+        "position": "WR",
+        "team": "PIT",
+        "active": True,
+        "depth_chart_order": 4,
+    },
+    "5849": {
+        "full_name": "Kenneth Walker III",
+        "first_name": "Kenneth",
+        "last_name": "Walker",
+        "position": "RB",
+        "team": "SEA",
+        "active": True,
+    },
+    "KC": {
+        "first_name": "Kansas City",
+        "last_name": "Chiefs",
+        "position": "DEF",
+        "team": "KC",
+        "active": True,
+    },
+}
+
+
+@pytest.fixture
+def index():
+    """Loaded index for PLAYERS, round-tripped through JSON like the cache."""
+    return load_search_index(json.loads(json.dumps(build_search_index(PLAYERS))))
+
+
+class TestPlayerNameKeys:
+    def test_player_keys_include_last_name_and_suffixless_name(self):
+        assert player_name_keys(PLAYERS["5849"]) == {
+            "kennethwalkeriii",
+            "kennethwalker",
+            "walker",
+        }
+
+    def test_defense_keys_include_nickname_and_abbreviation(self):
+        assert player_name_keys(PLAYERS["KC"]) == {
+            "kansascitychiefs",
+            "chiefs",
+            "kc",
+        }
+
+
+class TestQuerySearchIndex:
+    def test_exact_match_ranks_first(self, index):
+        ids = query_search_index(index, "Patrick Mahomes", active_only=False)
+        assert ids[0] == "4046"
+
+    def test_prefix_match(self, index):
+        assert query_search_index(index, "mahom", active_only=False) == [
+            "4046",
+            "9999",
+        ]
+
+    def test_shared_last_name_ranked_by_relevance(self, index):
+        assert query_search_index(index, "Jefferson") == ["6794", "1111"]
+
+    def test_substring_match(self, index):
+        assert query_search_index(index, "ferson") == ["6794", "1111"]
+
+    def test_fuzzy_match_on_misspelling(self, index):
+        assert query_search_index(index, "Patrik Mahommes")[0] == "4046"
+
+    def test_active_only_skips_free_agents(self, index):
+        assert "9999" not in query_search_index(index, "mahomesby")
+        assert query_search_index(index, "mahomesby", active_only=False)[0] == "9999"
+
+    def test_short_query_and_limit(self, index):
+        assert len(query_search_index(index, "an", limit=2)) == 2
+        assert query_search_index(index, "  ") == []
+
+    def test_defense_by_abbreviation(self, index):
+        assert query_search_index(index, "KC")[0] == "KC"
+
+
+class TestCacheClientSearch:
+    @pytest.fixture
+    def redis_client(self):
+        r = fakeredis.FakeRedis(decode_responses=False)
+        r.set(PLAYERS_CACHE_KEY, gzip.compress(json.dumps(PLAYERS).encode("utf-8")))
+        r.set(
+            f"{PLAYERS_CACHE_KEY}_metadata",
+            json.dumps({"last_updated": "2099-01-01T00:00:00"}),
+        )
+        r.set(
+            PLAYER_SEARCH_INDEX_KEY,
+            gzip.compress(json.dumps(build_search_index(PLAYERS)).encode("utf-8")),
+        )
+        r.incr(PLAYERS_CACHE_VERSION_KEY)
+        cache_client.clear_local_player_cache()
+        with patch("cache_client.get_redis_client", return_value=r):
+            yield r
+        cache_client.clear_local_player_cache()
+
+    def test_search_players_uses_index(self, redis_client):
+        results = cache_client.search_players("jeffer")
+        assert [p["player_id"] for p in results] == ["6794", "1111"]
+        assert results[0]["full_name"] == "Justin Jefferson"
+
+    def test_index_decoded_once_per_version(self, redis_client):
+        with patch(
+            "cache_client._decode_search_index",
+            wraps=cache_client._decode_search_index,
+        ) as mock_decode:
+            cache_client.search_players("mahomes")
+            cache_client.search_players("walker")
+            redis_client.incr(PLAYERS_CACHE_VERSION_KEY)
+            cache_client.search_players("walker")
+
+        assert mock_decode.call_count == 2
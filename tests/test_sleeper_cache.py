@@ -0,0 +1,153 @@
+"""Tests for the Sleeper league endpoint response cache."""
+
+import asyncio
+import json
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import fakeredis
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lib import sleeper_cache  # noqa: E402
+from lib.sleeper_cache import fetch_sleeper_json  # noqa: E402
+
+BASE_URL = "https://api.sleeper.app/v1"
+ROSTERS_URL = f"{BASE_URL}/league/123/rosters"
+
+
+def _response(data, status_code=200, headers=None):
+    """Build a mock httpx response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.text = json.dumps(data)
+    response.json = lambda: data
+    response.headers = headers or {}
+    response.raise_for_status = lambda: None
+    return response
+
+
+def _client(*responses):
+    """Build a mock client returning the given responses in order."""
+    client = MagicMock()
+    client.get = AsyncMock(side_effect=list(responses))
+    return client
+
+
+def _age_entry(url, seconds):
+    """Pretend the cached entry for a URL was fetched some seconds ago."""
+    sleeper_cache._entries[url]["fetched_at"] -= seconds
+
+
+@pytest.fixture(autouse=True)
+def sleeper_cache_enabled(monkeypatch):
+    """Turn the response cache back on (conftest disables it for tool tests)."""
+    monkeypatch.setattr(sleeper_cache, "SLEEPER_CACHE_ENABLED", True)
+
+
+class TestResponseCache:
+    """Test freshness windows, revalidation and sharing."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_response_served_from_memory(self):
+        """A fresh entry is returned without another request."""
+        client = _client(_response([{"roster_id": 1}]))
+
+        first = await fetch_sleeper_json(client, ROSTERS_URL)
+        first[0]["roster_id"] = 99
+        second = await fetch_sleeper_json(client, ROSTERS_URL)
+
+        assert second == [{"roster_id": 1}]
+        assert client.get.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_uncached_endpoint_fetched_every_time(self):
+        """URLs without a TTL go straight to Sleeper."""
+        url = f"{BASE_URL}/league/123/transactions/1"
+        client = _client(_response([]), _response([{"type": "waiver"}]))
+
+        await fetch_sleeper_json(client, url)
+        result = await fetch_sleeper_json(client, url)
+
+        assert result == [{"type": "waiver"}]
+        assert client.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_response_served_while_revalidating(self):
+        """A stale entry is returned at once and refreshed in the background."""
+        client = _client(_response([{"roster_id": 1}]), _response([{"roster_id": 2}]))
+        await fetch_sleeper_json(client, ROSTERS_URL)
+        _age_entry(ROSTERS_URL, 120)
+
+        stale = await fetch_sleeper_json(client, ROSTERS_URL)
+        await asyncio.sleep(0)
+        refreshed = await fetch_sleeper_json(client, ROSTERS_URL)
+
+        assert stale == [{"roster_id": 1}]
+        assert refreshed == [{"roster_id": 2}]
+        assert client.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_response_revalidated_with_etag(self):
+        """An expired entry sends its validators and keeps the body on 304."""
+        client = _client(
+            _response(
+                [{"roster_id": 1}],
+                headers={"etag": '"abc"', "last-modified": "Mon, 01 Sep 2025"},
+            ),
+            _response(None, status_code=304),
+        )
+        await fetch_sleeper_json(client, ROSTERS_URL)
+        _age_entry(ROSTERS_URL, 3600)
+
+        result = await fetch_sleeper_json(client, ROSTERS_URL)
+
+        assert result == [{"roster_id": 1}]
+        headers = client.get.await_args.kwargs["headers"]
+        assert headers == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Mon, 01 Sep 2025",
+        }
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(self):
+        """Concurrent requests for the same URL make one upstream call."""
+        client = _client(_response([{"roster_id": 1}]))
+
+        results = await asyncio.gather(
+            fetch_sleeper_json(client, ROSTERS_URL),
+            fetch_sleeper_json(client, ROSTERS_URL),
+        )
+
+        assert results[0] == results[1] == [{"roster_id": 1}]
+        assert client.get.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_lru_evicts_oldest_entry(self, monkeypatch):
+        """The in-memory tier holds at most SLEEPER_CACHE_MAX_ENTRIES."""
+        monkeypatch.setattr(sleeper_cache, "SLEEPER_CACHE_MAX_ENTRIES", 1)
+        client = _client(_response({"week": 1}), _response([]))
+
+        await fetch_sleeper_json(client, f"{BASE_URL}/state/nfl")
+        await fetch_sleeper_json(client, ROSTERS_URL)
+
+        assert list(sleeper_cache._entries) == [ROSTERS_URL]
+
+    @pytest.mark.asyncio
+    async def test_redis_tier_shared_between_processes(self, monkeypatch):
+        """Entries written to Redis are read back after memory is cleared."""
+        monkeypatch.setattr(sleeper_cache, "SLEEPER_CACHE_REDIS", True)
+        redis_client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        client = _client(_response([{"roster_id": 1}]))
+
+        with patch(
+            "lib.sleeper_cache.get_async_redis_client", return_value=redis_client
+        ):
+            await fetch_sleeper_json(client, ROSTERS_URL)
+            sleeper_cache._entries.clear()
+            result = await fetch_sleeper_json(client, ROSTERS_URL)
+
+        assert result == [{"roster_id": 1}]
+        assert client.get.await_count == 1
+        assert 0 < await redis_client.ttl(f"sleeper_response:{ROSTERS_URL}") <= 660
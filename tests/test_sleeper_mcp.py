@@ -280,7 +280,7 @@ class TestPlayerTools:
     async def test_get_player_by_sleeper_id_mock(self):
         """Test getting a player by Sleeper ID with mocked cache."""
         # Mock the imported function directly (it's a sync function)
-        with patch("sleeper_mcp.get_player_by_id") as mock_get_player:
+        with patch("sleeper_mcp.get_player_by_id_async") as mock_get_player:
             mock_get_player.return_value = {
                 "player_id": "1234",
                 "first_name": "Patrick",
@@ -300,9 +300,9 @@ class TestPlayerTools:
     @pytest.mark.vcr()
     async def test_get_trending_players(self):
         """Test getting trending players."""
-        # Mock get_players_from_cache to return empty dict if cache fails
-        with patch("sleeper_mcp.get_players_from_cache") as mock_get_cache:
-            mock_get_cache.return_value = {}
+        # Mock the player lookup to return empty dict if cache fails
+        with patch("sleeper_mcp.get_players_by_ids_async") as mock_get_players:
+            mock_get_players.return_value = {}
 
             result = await sleeper_mcp.get_trending_players.fn(type="add")
 
@@ -348,7 +348,7 @@ class TestPlayerTools:
     async def test_get_player_by_sleeper_id_integration(self):
         """Test getting a player by Sleeper ID with real API."""
         # Mock cache to return Patrick Mahomes
-        with patch("sleeper_mcp.get_player_by_id") as mock_get_player:
+        with patch("sleeper_mcp.get_player_by_id_async") as mock_get_player:
             mock_get_player.return_value = {
                 "player_id": "4046",
                 "first_name": "Patrick",
@@ -408,7 +408,7 @@ class TestPlayerTools:
         """Test getting waiver wire players with basic parameters."""
         # Mock cache and roster data
         with (
-            patch("sleeper_mcp.get_players_from_cache") as mock_cache,
+            patch("sleeper_mcp.get_players_from_cache_async") as mock_cache,
             patch("sleeper_mcp.get_trending_data_map") as mock_trending,
         ):
             mock_cache.return_value = {
@@ -436,7 +436,7 @@ class TestPlayerTools:
         """Test getting waiver wire players filtered by position."""
         # Mock cache and roster data
         with (
-            patch("sleeper_mcp.get_players_from_cache") as mock_cache,
+            patch("sleeper_mcp.get_players_from_cache_async") as mock_cache,
             patch("sleeper_mcp.get_trending_data_map") as mock_trending,
         ):
             mock_cache.return_value = {
@@ -473,7 +473,7 @@ class TestPlayerTools:
         """Test getting waiver wire players with search term."""
         # Mock cache and roster data
         with (
-            patch("sleeper_mcp.get_players_from_cache") as mock_cache,
+            patch("sleeper_mcp.get_players_from_cache_async") as mock_cache,
             patch("sleeper_mcp.get_trending_data_map") as mock_trending,
         ):
             mock_cache.return_value = {
@@ -510,7 +510,8 @@ class TestPlayerTools:
         """Test getting waiver wire analysis."""
         # Mock cache and roster data
         with (
-            patch("sleeper_mcp.get_players_from_cache") as mock_cache,
+            patch("sleeper_mcp.get_players_from_cache_async") as mock_cache,
+            patch("sleeper_mcp.get_players_by_ids_async", return_value={}),
             patch("sleeper_mcp.get_trending_data_map") as mock_trending,
         ):
             mock_cache.return_value = {}
@@ -528,13 +529,15 @@ class TestPlayerTools:
     async def test_get_trending_context(self):
         """Test getting trending context for players."""
         # Mock the cache lookup to return player data
-        with patch("sleeper_mcp.get_player_by_id") as mock_get_player:
-            mock_get_player.return_value = {
-                "player_id": "4046",
-                "full_name": "Patrick Mahomes",
-                "team": "KC",
-                "position": "QB",
-                "status": "Active",
+        with patch("sleeper_mcp.get_players_by_ids_async") as mock_get_players:
+            mock_get_players.return_value = {
+                "4046": {
+                    "player_id": "4046",
+                    "full_name": "Patrick Mahomes",
+                    "team": "KC",
+                    "position": "QB",
+                    "status": "Active",
+                }
             }
 
             result = await sleeper_mcp.get_trending_context.fn(
@@ -546,7 +549,8 @@ class TestPlayerTools:
             assert "4046" in result
             assert isinstance(result["4046"], str)
             # Should have some context text
-            assert len(result["4046"]) > 0
+            assert result["4046"].startswith("Patrick Mahomes (QB, KC)")
+            mock_get_players.assert_awaited_once()
 
 
 class TestDraftTools:
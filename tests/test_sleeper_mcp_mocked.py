@@ -1,7 +1,7 @@
 """Test Sleeper MCP tools with mocked API responses."""
 
 import pytest
-from unittest.mock import patch, AsyncMock
+from unittest.mock import patch, AsyncMock, MagicMock
 import sleeper_mcp
 
 
@@ -20,9 +20,9 @@ class TestLeagueToolsMocked:
             "settings": {"max_keepers": 0, "playoff_teams": 6},
         }
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("lib.league_tools.get_http_client") as mock_client:
             mock_instance = AsyncMock()
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
 
             mock_resp = AsyncMock()
             mock_resp.json = lambda: mock_response
@@ -50,9 +50,9 @@ class TestLeagueToolsMocked:
             }
         ]
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("lib.league_tools.get_http_client") as mock_client:
             mock_instance = AsyncMock()
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
 
             mock_resp = AsyncMock()
             mock_resp.json = lambda: mock_response
@@ -81,9 +81,9 @@ class TestLeagueToolsMocked:
             }
         ]
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("lib.league_tools.get_http_client") as mock_client:
             mock_instance = AsyncMock()
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
 
             mock_resp = AsyncMock()
             mock_resp.json = lambda: mock_response
@@ -109,9 +109,9 @@ class TestLeagueToolsMocked:
             }
         ]
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("lib.league_tools.get_http_client") as mock_client:
             mock_instance = AsyncMock()
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
 
             mock_resp = AsyncMock()
             mock_resp.json = lambda: mock_response
@@ -137,9 +137,9 @@ class TestLeagueToolsMocked:
             }
         ]
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("lib.league_tools.get_http_client") as mock_client:
             mock_instance = AsyncMock()
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
 
             mock_resp = AsyncMock()
             mock_resp.json = lambda: mock_response
@@ -167,9 +167,9 @@ class TestLeagueToolsMocked:
             }
         ]
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("lib.league_tools.get_http_client") as mock_client:
             mock_instance = AsyncMock()
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
 
             mock_resp = AsyncMock()
             mock_resp.json = lambda: mock_response
@@ -217,83 +217,76 @@ class TestLeagueToolsMocked:
             },
         ]
 
-        # Mock the cache function
-        with patch("cache_client.get_player_by_id") as mock_cache:
-            # Return minimal player data for enrichment
-            def get_player_mock(player_id):
-                return {
+        def create_mock_response(data):
+            mock_resp = MagicMock()
+            mock_resp.status_code = 200
+            mock_resp.json = lambda: data
+            return mock_resp
+
+        # Rounds 1 and 2 have transactions; the current week is 2
+        round_data = {"1": mock_round1, "2": mock_round2}
+
+        async def mock_get(url, **kwargs):
+            if url.endswith("/state/nfl"):
+                return create_mock_response({"week": 2})
+            return create_mock_response(round_data.get(url.rsplit("/", 1)[-1], []))
+
+        # Mock the batched player lookup used for enrichment
+        with (
+            patch("sleeper_mcp.get_players_by_ids_async") as mock_cache,
+            patch("sleeper_mcp.get_http_client") as mock_client,
+        ):
+            mock_cache.side_effect = lambda player_ids: {
+                player_id: {
                     "full_name": f"Player {player_id}",
                     "position": "RB",
                     "team": "SF",
                 }
-
-            mock_cache.side_effect = get_player_mock
-
-            # Helper to create fresh mock responses for each test
-            def create_mock_responses():
-                def create_mock_response(data):
-                    mock_resp = AsyncMock()
-                    mock_resp.status_code = 200
-                    mock_resp.json = lambda: data
-                    return mock_resp
-
-                return [
-                    create_mock_response(mock_round1),  # Round 1
-                    create_mock_response(mock_round2),  # Round 2
-                    create_mock_response([]),  # Round 3
-                    create_mock_response([]),  # Round 4
-                    create_mock_response([]),  # Round 5
-                    create_mock_response([]),  # Round 6
-                    create_mock_response([]),  # Round 7
-                    create_mock_response([]),  # Round 8
-                    create_mock_response([]),  # Round 9
-                    create_mock_response([]),  # Round 10
-                ]
+                for player_id in player_ids
+            }
+            mock_instance = AsyncMock()
+            mock_client.return_value = mock_instance
+            mock_instance.get = AsyncMock(side_effect=mock_get)
 
             # Test default behavior
-            with patch("httpx.AsyncClient") as mock_client:
-                mock_instance = AsyncMock()
-                mock_client.return_value.__aenter__.return_value = mock_instance
-                mock_instance.get = AsyncMock(side_effect=create_mock_responses())
-
-                result = await sleeper_mcp.get_recent_transactions.fn()
+            result = await sleeper_mcp.get_recent_transactions.fn()
 
-                assert isinstance(result, list)
-                assert len(result) == 2  # Should exclude failed by default
-                assert result[0]["transaction_id"] == "2"  # Newest first
-                assert result[1]["transaction_id"] == "1"
+            assert isinstance(result, list)
+            assert len(result) == 2  # Should exclude failed by default
+            assert result[0]["transaction_id"] == "2"  # Newest first
+            assert result[1]["transaction_id"] == "1"
+            assert result[0]["adds"]["789"]["player_name"] == "Player 789"
+            mock_cache.assert_called_once()  # One batched lookup
 
             # Test with include_failed=True
-            with patch("httpx.AsyncClient") as mock_client:
-                mock_instance = AsyncMock()
-                mock_client.return_value.__aenter__.return_value = mock_instance
-                mock_instance.get = AsyncMock(side_effect=create_mock_responses())
-
-                result = await sleeper_mcp.get_recent_transactions.fn(
-                    include_failed=True
-                )
-                assert len(result) == 3
+            result = await sleeper_mcp.get_recent_transactions.fn(include_failed=True)
+            assert len(result) == 3
 
             # Test with transaction_type filter
-            with patch("httpx.AsyncClient") as mock_client:
-                mock_instance = AsyncMock()
-                mock_client.return_value.__aenter__.return_value = mock_instance
-                mock_instance.get = AsyncMock(side_effect=create_mock_responses())
-
-                result = await sleeper_mcp.get_recent_transactions.fn(
-                    transaction_type="waiver"
-                )
-                assert len(result) == 1
-                assert result[0]["type"] == "waiver"
+            result = await sleeper_mcp.get_recent_transactions.fn(
+                transaction_type="waiver"
+            )
+            assert len(result) == 1
+            assert result[0]["type"] == "waiver"
 
             # Test with limit
-            with patch("httpx.AsyncClient") as mock_client:
-                mock_instance = AsyncMock()
-                mock_client.return_value.__aenter__.return_value = mock_instance
-                mock_instance.get = AsyncMock(side_effect=create_mock_responses())
+            result = await sleeper_mcp.get_recent_transactions.fn(limit=1)
+            assert len(result) == 1
 
-                result = await sleeper_mcp.get_recent_transactions.fn(limit=1)
-                assert len(result) == 1
+            # Later calls within the sync window are answered from the log
+            assert mock_instance.get.await_count == 3
+
+            # Names come from the player cache at read time, so a failed
+            # lookup does not stick to the stored transactions
+            lookup = mock_cache.side_effect
+            mock_cache.side_effect = None
+            mock_cache.return_value = None
+            result = await sleeper_mcp.get_recent_transactions.fn()
+            assert result[0]["adds"]["789"]["player_name"] == "Unknown"
+
+            mock_cache.side_effect = lookup
+            result = await sleeper_mcp.get_recent_transactions.fn()
+            assert result[0]["adds"]["789"]["player_name"] == "Player 789"
 
 
 class TestUserToolsMocked:
@@ -309,9 +302,9 @@ class TestUserToolsMocked:
             "avatar": "abc123",
         }
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("sleeper_mcp.get_http_client") as mock_client:
             mock_instance = AsyncMock()
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
 
             mock_resp = AsyncMock()
             mock_resp.json = lambda: mock_response
@@ -336,9 +329,9 @@ class TestPlayerToolsMocked:
             {"player_id": "4034", "count": 120},
         ]
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("sleeper_mcp.get_http_client") as mock_client:
             mock_instance = AsyncMock()
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
 
             mock_resp = AsyncMock()
             mock_resp.json = lambda: mock_response
@@ -346,8 +339,8 @@ class TestPlayerToolsMocked:
             mock_instance.get.return_value = mock_resp
 
             # Mock the cache function
-            with patch("sleeper_mcp.get_players_from_cache") as mock_cache:
-                mock_cache.return_value = {
+            with patch("sleeper_mcp.get_players_by_ids_async") as mock_players:
+                mock_players.return_value = {
                     "4046": {
                         "player_id": "4046",
                         "full_name": "Patrick Mahomes",
@@ -363,6 +356,9 @@ class TestPlayerToolsMocked:
                 result = await sleeper_mcp.get_trending_players.fn(type="add")
 
                 assert isinstance(result, list)
-                if result:
-                    assert "player_id" in result[0]
-                    assert "count" in result[0]
+                assert [p["full_name"] for p in result] == [
+                    "Patrick Mahomes",
+                    "Davante Adams",
+                ]
+                assert result[0]["count"] == 150
+                assert set(mock_players.call_args.args[0]) == {"4046", "4034"}
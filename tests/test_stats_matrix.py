@@ -0,0 +1,140 @@
+"""Tests for the columnar season stats matrix."""
+
+from unittest.mock import patch
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from lib import stats_matrix  # noqa: E402
+from lib.stats_matrix import (  # noqa: E402
+    build_stats_matrix,
+    games_played,
+    get_stats_matrix,
+    load_stats_matrix,
+    position_percentiles,
+    rolling_average,
+    season_rankings,
+    season_std,
+    season_totals,
+)
+from lib.stats_warehouse import sync_season_stats  # noqa: E402
+
+PLAYER_WEEKS = {
+    "1": {
+        1: {"fantasy_points": 10.0, "receptions": 4},
+        2: {"fantasy_points": 20.0, "receptions": 6},
+        3: {"fantasy_points": 30.0},
+    },
+    "2": {1: {"fantasy_points": 8.0}, 3: {"fantasy_points": 12.0}},
+    "3": {2: {"fantasy_points": 15.0, "passing_yards": 300.0}},
+}
+POSITIONS = {"1": "WR", "2": "WR", "3": "QB"}
+
+
+@pytest.fixture
+def matrix():
+    return build_stats_matrix(2025, PLAYER_WEEKS)
+
+
+class TestBuild:
+    def test_layout(self, matrix):
+        assert matrix["player_ids"] == ["1", "2", "3"]
+        assert matrix["stats"] == ["fantasy_points", "passing_yards", "receptions"]
+        assert matrix["values"].shape == (3, 3, 3)
+        # Week not played is NaN, stat missing from a played week is 0
+        assert np.isnan(matrix["values"][1, 1]).all()
+        assert matrix["values"][0, 2, 2] == 0
+
+    def test_saved_matrix_is_memory_mapped(self, matrix):
+        stats_matrix.save_stats_matrix(matrix, synced_at=123.0)
+        loaded, synced_at = load_stats_matrix(2025)
+
+        assert synced_at == 123.0
+        assert isinstance(loaded["values"], np.memmap)
+        assert loaded["player_ids"] == matrix["player_ids"]
+        np.testing.assert_array_equal(loaded["values"], matrix["values"])
+
+
+class TestAggregations:
+    def test_totals_games_and_std(self, matrix):
+        np.testing.assert_allclose(season_totals(matrix), [60, 20, 15])
+        np.testing.assert_array_equal(games_played(matrix), [3, 2, 1])
+        np.testing.assert_allclose(season_totals(matrix, "receptions"), [10, 0, 0])
+        np.testing.assert_allclose(season_std(matrix), [np.std([10, 20, 30]), 2, 0])
+
+    def test_rolling_average_skips_weeks_not_played(self, matrix):
+        rolling = rolling_average(matrix, window=2)
+        np.testing.assert_allclose(rolling[0], [10, 15, 25])
+        np.testing.assert_allclose(rolling[1], [8, 8, 12])
+        assert np.isnan(rolling[2, 0])
+
+    def test_position_percentiles(self, matrix):
+        percentiles = position_percentiles(
+            matrix, {"1": "WR", "2": "WR"}, season_totals(matrix)
+        )
+        np.testing.assert_allclose(percentiles[:2], [100, 50])
+        assert np.isnan(percentiles[2])
+
+    def test_rankings(self, matrix):
+        ranked = season_rankings(matrix, POSITIONS, position="WR", limit=5)
+
+        assert [item["player_id"] for item in ranked] == ["1", "2"]
+        assert ranked[0]["points_per_game"] == 20
+        assert ranked[0]["recent_avg"] == 20  # weeks 1-3
+        assert ranked[1]["position_percentile"] == 50
+
+
+class TestGetStatsMatrix:
+    @pytest.mark.asyncio
+    async def test_rebuilt_only_after_new_sync(self, monkeypatch, sleeper_client):
+        client = sleeper_client(
+            lambda url: {"1": {"pts_ppr": float(url.rsplit("/", 1)[1])}}
+        )
+        builds = []
+        build = stats_matrix.build_stats_matrix
+        monkeypatch.setattr(
+            stats_matrix,
+            "build_stats_matrix",
+            lambda *args: builds.append(1) or build(*args),
+        )
+
+        await sync_season_stats(client, "https://api", 2025, 2, current_week=3)
+        first = get_stats_matrix(2025)
+        stats_matrix.clear_stats_matrices()
+        assert get_stats_matrix(2025)["player_ids"] == first["player_ids"]
+        assert len(builds) == 1  # second call loaded the file
+
+        await sync_season_stats(client, "https://api", 2025, 3, current_week=3)
+        assert get_stats_matrix(2025)["values"].shape[1] == 3
+        assert len(builds) == 2
+
+
+class TestTool:
+    @pytest.mark.asyncio
+    async def test_season_rankings(self):
+        import sleeper_mcp
+
+        with (
+            patch(
+                "sleeper_mcp.fetch_sleeper_json",
+                return_value={"season": "2025", "week": 4},
+            ),
+            patch("sleeper_mcp.ensure_season_stats"),
+            patch(
+                "sleeper_mcp.get_stats_matrix_async",
+                return_value=build_stats_matrix(2025, PLAYER_WEEKS),
+            ),
+            patch(
+                "sleeper_mcp.get_players_by_ids_async",
+                return_value={
+                    pid: {"full_name": f"Player {pid}", "position": pos}
+                    for pid, pos in POSITIONS.items()
+                },
+            ),
+        ):
+            result = await sleeper_mcp.get_season_rankings.fn(limit=2)
+
+        assert result["weeks"] == 3
+        assert [p["name"] for p in result["players"]] == ["Player 1", "Player 2"]
+        assert result["players"][0]["fantasy_points"] == 60
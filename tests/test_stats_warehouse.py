@@ -0,0 +1,133 @@
+"""Tests for the local season stats warehouse."""
+
+from unittest.mock import patch
+
+import pytest
+
+from lib import stats_warehouse
+from lib.stats_warehouse import query_player_weeks, sync_season_stats
+
+BASE_URL = "https://api.sleeper.app/v1"
+
+
+def _week(points):
+    """Stats file with one player scoring the given PPR points."""
+    return {
+        "4046": {"pts_ppr": points, "pass_yd": 250.0, "gp": 1.0},
+        "9999": {"pass_yd": 10.0},  # no pts_ppr, filtered out
+    }
+
+
+def _requested(client):
+    """Weeks requested from a weeks_client, in order."""
+    return [int(call.args[0].rsplit("/", 1)[1]) for call in client.get.await_args_list]
+
+
+@pytest.fixture
+def weeks_client(sleeper_client):
+    """Mock client serving /stats/nfl/regular/{season}/{week}."""
+
+    def make(weeks, failing=()):
+        def route(url):
+            week = int(url.rsplit("/", 1)[1])
+            if week in failing:
+                raise RuntimeError("down")
+            return weeks[week]
+
+        return sleeper_client(route)
+
+    return make
+
+
+class TestSync:
+    @pytest.mark.asyncio
+    async def test_completed_weeks_fetched_once(self, clock, weeks_client):
+        client = weeks_client({1: _week(10), 2: _week(20), 3: _week(5)})
+
+        await sync_season_stats(client, BASE_URL, 2025, 3, current_week=3)
+        await sync_season_stats(client, BASE_URL, 2025, 3, current_week=3)
+
+        assert sorted(_requested(client)) == [1, 2, 3]
+        weeks = query_player_weeks(2025, ["4046", "9999"])
+        assert list(weeks) == ["4046"]
+        assert weeks["4046"][2]["fantasy_points"] == 20
+
+    @pytest.mark.asyncio
+    async def test_current_week_refreshed_when_stale(self, clock, weeks_client):
+        client = weeks_client({1: _week(10), 2: _week(3)})
+        await sync_season_stats(client, BASE_URL, 2025, 2, current_week=2)
+
+        client = weeks_client({1: _week(10), 2: _week(18)})
+        clock["t"] += stats_warehouse.STATS_CURRENT_WEEK_SECONDS
+        await sync_season_stats(client, BASE_URL, 2025, 2, current_week=2)
+
+        assert _requested(client) == [2]
+        assert query_player_weeks(2025, ["4046"])["4046"][2]["fantasy_points"] == 18
+
+    @pytest.mark.asyncio
+    async def test_past_season_weeks_all_complete(self, clock, weeks_client):
+        client = weeks_client({1: _week(10), 2: _week(20)})
+        await sync_season_stats(client, BASE_URL, 2024, 2)
+
+        client = weeks_client({})
+        clock["t"] += stats_warehouse.STATS_CURRENT_WEEK_SECONDS
+        await sync_season_stats(client, BASE_URL, 2024, 2)
+        assert _requested(client) == []
+
+    @pytest.mark.asyncio
+    async def test_failed_week_retried(self, clock, weeks_client):
+        client = weeks_client({1: _week(10)}, failing={2})
+        assert await sync_season_stats(client, BASE_URL, 2025, 2, current_week=3) == [1]
+
+        client = weeks_client({2: _week(20)})
+        await sync_season_stats(client, BASE_URL, 2025, 2, current_week=3)
+        assert _requested(client) == [2]
+
+
+class TestQuery:
+    @pytest.mark.asyncio
+    async def test_multiple_players_and_week_filter(self, clock, weeks_client):
+        stats = {
+            week: {
+                "1": {"pts_ppr": float(week)},
+                "2": {"pts_ppr": float(week * 10)},
+            }
+            for week in (1, 2, 3)
+        }
+        client = weeks_client(stats)
+        await sync_season_stats(client, BASE_URL, 2025, 3, current_week=4)
+
+        result = query_player_weeks(2025, ["1", "2", "3"], weeks=[2, 3])
+
+        assert {pid: list(weeks) for pid, weeks in result.items()} == {
+            "1": [2, 3],
+            "2": [2, 3],
+        }
+        assert result["2"][3]["fantasy_points"] == 30
+
+
+class TestTool:
+    @pytest.mark.asyncio
+    async def test_season_line_served_from_warehouse(self, clock, weeks_client):
+        import sleeper_mcp
+
+        client = weeks_client({1: _week(10), 2: _week(20)})
+        state = {"season": "2025", "week": 2}
+
+        with (
+            patch("sleeper_mcp.get_http_client", return_value=client),
+            patch("sleeper_mcp.fetch_sleeper_json", return_value=state),
+            patch(
+                "sleeper_mcp.get_player_by_id_async",
+                return_value={"full_name": "Patrick Mahomes", "position": "QB"},
+            ),
+        ):
+            await sleeper_mcp.get_player_stats_all_weeks.fn("4046")
+            client.get.reset_mock()
+            result = await sleeper_mcp.get_player_stats_all_weeks.fn("4046")
+
+        assert _requested(client) == []  # week 1 complete, week 2 still fresh
+        assert result["weekly_stats"]["2"]["fantasy_points"] == 20
+        assert result["totals"]["fantasy_points"] == 30
+        assert result["totals"]["games_played"] == 2
+        assert result["totals"]["passing_yards"] == 500
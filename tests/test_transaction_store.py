@@ -0,0 +1,168 @@
+"""Tests for the local transaction log."""
+
+import sqlite3
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from lib import transaction_store
+from lib.transaction_store import query_transactions, sync_transactions
+
+BASE_URL = "https://api.sleeper.app/v1"
+LEAGUE_ID = "123"
+
+
+def _ms(days_ago):
+    """Millisecond timestamp for some days ago."""
+    return int((datetime.now() - timedelta(days=days_ago, hours=1)).timestamp() * 1000)
+
+
+def _txn(txn_id, days_ago, **fields):
+    return {
+        "transaction_id": txn_id,
+        "type": "free_agent",
+        "status": "complete",
+        "status_updated": _ms(days_ago),
+        **fields,
+    }
+
+
+@pytest.fixture
+def rounds_client(sleeper_client):
+    """Mock client serving /state/nfl and transaction rounds."""
+
+    def make(week, rounds):
+        def route(url):
+            if url.endswith("/state/nfl"):
+                return {"week": week}
+            return rounds.get(int(url.rsplit("/", 1)[-1]), [])
+
+        return sleeper_client(route)
+
+    return make
+
+
+def _requested_rounds(client):
+    return sorted(
+        int(call.args[0].rsplit("/", 1)[-1])
+        for call in client.get.await_args_list
+        if "/transactions/" in call.args[0]
+    )
+
+
+class TestSync:
+    @pytest.mark.asyncio
+    async def test_first_sync_backfills_then_syncs_recent_rounds(self, rounds_client):
+        rounds = {1: [_txn("a", 20)], 3: [_txn("b", 2)]}
+        client = rounds_client(3, rounds)
+        assert await sync_transactions(client, BASE_URL, LEAGUE_ID) == 2
+        assert _requested_rounds(client) == [1, 2, 3]
+
+        client = rounds_client(4, rounds)
+        await sync_transactions(client, BASE_URL, LEAGUE_ID, force=True)
+        assert _requested_rounds(client) == [3, 4]
+
+    @pytest.mark.asyncio
+    async def test_sync_is_throttled(self, rounds_client):
+        client = rounds_client(1, {})
+        await sync_transactions(client, BASE_URL, LEAGUE_ID)
+        await sync_transactions(client, BASE_URL, LEAGUE_ID)
+        assert client.get.await_count == 2  # state + round 1, once
+
+    @pytest.mark.asyncio
+    async def test_status_change_replaces_row(self, rounds_client):
+        await sync_transactions(
+            rounds_client(1, {1: [_txn("a", 1, status="pending")]}), BASE_URL, LEAGUE_ID
+        )
+        await sync_transactions(
+            rounds_client(1, {1: [_txn("a", 1, status="failed")]}),
+            BASE_URL,
+            LEAGUE_ID,
+            force=True,
+        )
+
+        assert query_transactions(LEAGUE_ID, limit=10) == []
+        rows = query_transactions(LEAGUE_ID, limit=10, include_failed=True)
+        assert [(r["transaction_id"], r["status"]) for r in rows] == [("a", "failed")]
+
+    @pytest.mark.asyncio
+    async def test_stores_moves_as_sent(self, rounds_client):
+        rounds = {1: [_txn("a", 1, adds={"10": 1}, drops={"11": 1})]}
+        await sync_transactions(rounds_client(1, rounds), BASE_URL, LEAGUE_ID)
+
+        row = query_transactions(LEAGUE_ID, limit=1)[0]
+        assert row["adds"] == {"10": 1}
+        assert row["drops"] == {"11": 1}
+
+    @pytest.mark.asyncio
+    async def test_failed_state_fetch_keeps_log(self, rounds_client):
+        await sync_transactions(
+            rounds_client(1, {1: [_txn("a", 1)]}), BASE_URL, LEAGUE_ID
+        )
+        client = MagicMock()
+        client.get = AsyncMock(side_effect=RuntimeError("down"))
+
+        assert await sync_transactions(client, BASE_URL, LEAGUE_ID, force=True) == 0
+        assert len(query_transactions(LEAGUE_ID, limit=10)) == 1
+
+    @pytest.mark.asyncio
+    async def test_leagues_synced_and_queried_separately(self, rounds_client):
+        await sync_transactions(
+            rounds_client(1, {1: [_txn("a", 1)]}), BASE_URL, LEAGUE_ID
+        )
+        client = rounds_client(1, {1: [_txn("b", 1)]})
+        await sync_transactions(client, BASE_URL, "456")
+
+        assert _requested_rounds(client) == [1]  # Not throttled by league 123
+        assert [t["transaction_id"] for t in query_transactions("456", limit=10)] == [
+            "b"
+        ]
+        assert [
+            t["transaction_id"] for t in query_transactions(LEAGUE_ID, limit=10)
+        ] == ["a"]
+
+    def test_older_schema_is_rebuilt(self):
+        conn = sqlite3.connect(transaction_store.TRANSACTION_DB_PATH)
+        conn.execute("CREATE TABLE synced_rounds (round INTEGER PRIMARY KEY)")
+        conn.execute("INSERT INTO synced_rounds VALUES (1)")
+        conn.commit()
+        conn.close()
+
+        assert transaction_store._synced_rounds(LEAGUE_ID) == set()
+
+
+class TestQuery:
+    @pytest.fixture(autouse=True)
+    async def synced(self, rounds_client):
+        rounds = {
+            1: [
+                _txn("old_drop", 10, drops={"20": 1}),
+                _txn("waiver", 3, type="waiver", adds={"21": 2}),
+                _txn("recent_drop", 1, adds={"22": 3}, drops={"23": 3}),
+            ]
+        }
+        await sync_transactions(rounds_client(1, rounds), BASE_URL, LEAGUE_ID)
+
+    def _ids(self, **filters):
+        return [
+            t["transaction_id"]
+            for t in query_transactions(LEAGUE_ID, limit=10, **filters)
+        ]
+
+    def test_most_recent_first(self):
+        assert self._ids() == ["recent_drop", "waiver", "old_drop"]
+
+    def test_drops_only_within_days(self):
+        assert self._ids(drops_only=True, max_days_ago=7) == ["recent_drop"]
+
+    def test_min_days_ago(self):
+        assert self._ids(min_days_ago=3) == ["waiver", "old_drop"]
+
+    def test_type_and_player_filters(self):
+        assert self._ids(transaction_type="waiver") == ["waiver"]
+        assert self._ids(player_id="23") == ["recent_drop"]
+
+    def test_log_survives_reopen(self):
+        transaction_store.close_transaction_store()
+        assert len(self._ids()) == 3
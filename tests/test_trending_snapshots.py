@@ -0,0 +1,129 @@
+"""Tests for trending player snapshots and deltas."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import fakeredis.aioredis
+import pytest
+
+from lib import trending_snapshots
+from lib.trending_snapshots import (
+    get_trending_delta,
+    get_trending_history,
+    get_trending_snapshot,
+    take_trending_snapshot,
+)
+
+
+@pytest.fixture
+def trending_client(sleeper_client):
+    """Mock client returning the given trending lists in order."""
+
+    def make(*trending_lists):
+        responses = iter(trending_lists)
+        return sleeper_client(lambda url: next(responses))
+
+    return make
+
+
+@pytest.fixture
+def redis_client():
+    r = fakeredis.aioredis.FakeRedis()
+    with patch("lib.trending_snapshots.get_async_redis_client", return_value=r):
+        yield r
+
+
+class TestSnapshots:
+    @pytest.mark.asyncio
+    async def test_fresh_snapshot_served_without_fetch(
+        self, redis_client, clock, trending_client
+    ):
+        client = trending_client([{"player_id": "1", "count": 10}])
+        await get_trending_snapshot(client, "add")
+        clock["t"] += 60
+        snapshot = await get_trending_snapshot(client, "add")
+
+        assert snapshot["players"] == [{"player_id": "1", "count": 10}]
+        assert client.get.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_old_snapshot_refreshed_and_history_kept(
+        self, redis_client, clock, trending_client
+    ):
+        client = trending_client(
+            [{"player_id": "1", "count": 10}], [{"player_id": "1", "count": 15}]
+        )
+        await get_trending_snapshot(client, "add")
+        clock["t"] += trending_snapshots.TRENDING_MAX_AGE_SECONDS
+        snapshot = await get_trending_snapshot(client, "add")
+
+        assert snapshot["players"][0]["count"] == 15
+        history = await get_trending_history("add", since=0)
+        assert [s["players"][0]["count"] for s in history] == [10, 15]
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_serves_older_snapshot(
+        self, redis_client, clock, trending_client
+    ):
+        await take_trending_snapshot(
+            trending_client([{"player_id": "1", "count": 3}]), "drop"
+        )
+        clock["t"] += trending_snapshots.TRENDING_MAX_AGE_SECONDS
+        client = MagicMock()
+        client.get = AsyncMock(side_effect=RuntimeError("down"))
+
+        snapshot = await get_trending_snapshot(client, "drop")
+        assert snapshot["players"][0]["count"] == 3
+
+    @pytest.mark.asyncio
+    async def test_works_without_redis(self, trending_client):
+        broken = MagicMock()
+        broken.get = AsyncMock(side_effect=ConnectionError("no redis"))
+        broken.pipeline = MagicMock(side_effect=ConnectionError("no redis"))
+        client = trending_client([{"player_id": "1", "count": 1}])
+
+        with patch(
+            "lib.trending_snapshots.get_async_redis_client", return_value=broken
+        ):
+            await get_trending_snapshot(client, "add")
+            await get_trending_snapshot(client, "add")
+
+        assert client.get.await_count == 1
+
+
+class TestDelta:
+    @pytest.mark.asyncio
+    async def test_change_over_window(self, redis_client, clock, trending_client):
+        await take_trending_snapshot(
+            trending_client(
+                [{"player_id": "1", "count": 10}, {"player_id": "2", "count": 8}]
+            ),
+            "add",
+        )
+        clock["t"] += 30 * 60
+        await take_trending_snapshot(
+            trending_client([{"player_id": "1", "count": 12}]), "add"
+        )
+        clock["t"] += 30 * 60
+        await take_trending_snapshot(
+            trending_client(
+                [{"player_id": "1", "count": 20}, {"player_id": "3", "count": 9}]
+            ),
+            "add",
+        )
+
+        delta = await get_trending_delta(MagicMock(), "add", window_minutes=60)
+
+        assert delta["baseline_at"] == delta["current_at"] - 3600
+        assert [(c["player_id"], c["change"]) for c in delta["changes"]] == [
+            ("1", 10),
+            ("3", 9),
+            ("2", -8),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_no_history_yet(self, redis_client, clock, trending_client):
+        client = trending_client([{"player_id": "1", "count": 10}])
+        delta = await get_trending_delta(client, "add", window_minutes=60)
+
+        assert delta["baseline_at"] is None
+        assert delta["changes"] == []
@@ -14,7 +14,7 @@ class TestValidParameters:
     """Test that MCP tools work correctly with valid parameters."""
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
+    @patch("lib.league_tools.get_http_client")
     async def test_get_roster_with_valid_id(self, mock_client):
         """Test get_roster works with valid roster_id."""
         # Mock the HTTP responses
@@ -39,35 +39,25 @@ class TestValidParameters:
         mock_state_response.json = lambda: {"season": 2025, "week": 10}
         mock_state_response.raise_for_status = lambda: None
 
-        # Setup the mock client - we need to handle 3 separate AsyncClient instances
-        mock_instance1 = AsyncMock()
-        mock_instance1.get = AsyncMock(return_value=mock_response)
-        mock_instance1.__aenter__.return_value = mock_instance1
-        mock_instance1.__aexit__.return_value = None
-
-        mock_instance2 = AsyncMock()
-        mock_instance2.get = AsyncMock(return_value=mock_users_response)
-        mock_instance2.__aenter__.return_value = mock_instance2
-        mock_instance2.__aexit__.return_value = None
-
-        mock_instance3 = AsyncMock()
-        mock_instance3.get = AsyncMock(return_value=mock_state_response)
-        mock_instance3.__aenter__.return_value = mock_instance3
-        mock_instance3.__aexit__.return_value = None
-
-        # Return a different instance for each call to AsyncClient()
-        # We need 6 instances total: 3 for the first test, 3 for the second test
-        mock_client.side_effect = [
-            mock_instance1,
-            mock_instance2,
-            mock_instance3,
-            mock_instance1,
-            mock_instance2,
-            mock_instance3,
-        ]
+        # rosters, users and state are fetched concurrently on one shared client
+        responses = {
+            "rosters": mock_response,
+            "users": mock_users_response,
+            "state": mock_state_response,
+        }
+
+        async def mock_get(url, **kwargs):
+            return next(resp for key, resp in responses.items() if key in url)
+
+        mock_instance = AsyncMock()
+        mock_instance.get = AsyncMock(side_effect=mock_get)
+        mock_client.return_value = mock_instance
 
-        # Mock the cache function
-        with patch("sleeper_mcp.get_players_from_cache") as mock_cache:
+        # Mock the cache functions
+        with (
+            patch("lib.league_tools.get_players_by_ids_async") as mock_cache,
+            patch("lib.league_tools.spot_refresh_player_stats"),
+        ):
             mock_cache.return_value = {
                 "4046": {"first_name": "Patrick", "last_name": "Mahomes"}
             }
@@ -87,7 +77,7 @@ class TestValidParameters:
             assert result["week"] == 10
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
+    @patch("lib.league_tools.get_http_client")
     async def test_get_league_matchups_with_valid_week(self, mock_client):
         """Test get_league_matchups works with valid week."""
         # Mock the HTTP response
@@ -99,8 +89,6 @@ class TestValidParameters:
 
         mock_instance = AsyncMock()
         mock_instance.get.return_value = mock_response
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
         mock_client.return_value = mock_instance
 
         # Mock spot refresh
@@ -117,7 +105,7 @@ class TestValidParameters:
             assert "error" not in result[0] if result else True
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
+    @patch("lib.league_tools.get_http_client")
     async def test_get_league_transactions_with_valid_round(self, mock_client):
         """Test get_league_transactions works with valid round."""
         # Mock the HTTP response
@@ -129,8 +117,6 @@ class TestValidParameters:
 
         mock_instance = AsyncMock()
         mock_instance.get.return_value = mock_response
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
         mock_client.return_value = mock_instance
 
         # Test with valid round
@@ -170,7 +156,7 @@ class TestValidParameters:
                 assert "error" not in result[0] if result else True
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
+    @patch("sleeper_mcp.get_http_client")
     async def test_get_user_with_valid_username(self, mock_client):
         """Test get_user works with valid username."""
         # Mock the HTTP response
@@ -184,8 +170,6 @@ class TestValidParameters:
 
         mock_instance = AsyncMock()
         mock_instance.get.return_value = mock_response
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
         mock_client.return_value = mock_instance
 
         # Test with valid username
@@ -200,7 +184,7 @@ class TestValidParameters:
     @pytest.mark.asyncio
     async def test_get_trending_players_with_valid_type(self):
         """Test get_trending_players works with valid type."""
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("sleeper_mcp.get_http_client") as mock_client:
             # Mock the HTTP response
             mock_response = AsyncMock()
             mock_response.json = lambda: [{"player_id": "4046", "count": 1000}]
@@ -208,11 +192,9 @@ class TestValidParameters:
 
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
-            mock_instance.__aenter__.return_value = mock_instance
-            mock_instance.__aexit__.return_value = None
             mock_client.return_value = mock_instance
 
-            with patch("sleeper_mcp.get_player_by_id") as mock_player:
+            with patch("sleeper_mcp.get_player_by_id_async") as mock_player:
                 mock_player.return_value = {
                     "player_id": "4046",
                     "first_name": "Patrick",
@@ -269,8 +251,8 @@ class TestValidParameters:
     @pytest.mark.asyncio
     async def test_health_check(self):
         """Test health_check tool works correctly."""
-        with patch("sleeper_mcp.get_players_from_cache") as mock_cache:
-            with patch("httpx.AsyncClient") as mock_client:
+        with patch("sleeper_mcp.get_players_from_cache_async") as mock_cache:
+            with patch("sleeper_mcp.get_http_client") as mock_client:
                 # Mock cache response
                 mock_cache.return_value = {"4046": {"player_id": "4046"}}
 
@@ -281,8 +263,6 @@ class TestValidParameters:
 
                 mock_instance = AsyncMock()
                 mock_instance.get.return_value = mock_response
-                mock_instance.__aenter__.return_value = mock_instance
-                mock_instance.__aexit__.return_value = None
                 mock_client.return_value = mock_instance
 
                 # Test health check